@@ -0,0 +1,19 @@
+import hmac
+from typing import Optional
+from fastapi import Header, HTTPException
+from app.config import get_settings
+
+settings = get_settings()
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """
+    운영용(admin) API 접근 확인
+    ADMIN_API_TOKEN이 설정되지 않았으면 운영용 API는 모두 막힌다.
+    """
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode(), settings.ADMIN_API_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
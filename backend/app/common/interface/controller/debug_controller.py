@@ -0,0 +1,76 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from app.common.dependencies import require_admin_token
+from app.config import get_settings
+from app.utils import blocking_detector, profiling
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger("debug_controller")
+
+# 워커 프로세스 단위로 동작하므로 응답 헤더에 pid를 함께 돌려준다
+router = APIRouter(
+    prefix="/debug",
+    tags=["Debug"],
+    dependencies=[Depends(require_admin_token)],
+    include_in_schema=False,
+)
+
+
+def _profile_response(body: str, media_type: str = "text/plain") -> PlainTextResponse:
+    return PlainTextResponse(
+        body, media_type=media_type, headers={"X-Worker-Pid": str(os.getpid())}
+    )
+
+
+@router.get("/profile")
+async def profile_worker(
+    seconds: float = Query(5.0, gt=0),
+    mode: str = Query("sample", pattern="^(sample|cprofile)$"),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    sort_by: str = Query("cumulative", pattern="^(cumulative|tottime|ncalls)$"),
+):
+    """
+    요청을 받은 워커의 이벤트 루프 스레드를 N초 동안 프로파일링
+
+    - mode=sample: 스택 샘플링 결과를 collapsed stack 형식으로 반환
+      (flamegraph.pl, speedscope에 그대로 입력해 flamegraph 생성)
+    - mode=cprofile: cProfile 통계(pstats) 텍스트 반환
+    """
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds는 {settings.PROFILING_MAX_SECONDS} 이하여야 합니다.",
+        )
+
+    logger.info(f"🔬 프로파일링 시작 (mode={mode}, {seconds}s, pid={os.getpid()})")
+    try:
+        if mode == "cprofile":
+            body = await profiling.capture_cprofile(seconds, sort_by=sort_by)
+        else:
+            body = await profiling.capture_sampling_profile(
+                seconds, interval_ms / 1000
+            )
+    except profiling.ProfilerBusy:
+        raise HTTPException(
+            status_code=409, detail="이 워커에서 이미 프로파일링이 진행 중입니다."
+        )
+    return _profile_response(body)
+
+
+@router.get("/blocking")
+async def blocking_summary(reset: bool = False):
+    """
+    이 워커에서 감지된 이벤트 루프 막힘을 호출 위치별로 요약
+    reset=true면 조회 후 기록을 비운다.
+    """
+    detector = blocking_detector.blocking_detector
+    if not settings.BLOCKING_DETECTOR_ENABLED or detector is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    summary = detector.summary()
+    if reset:
+        detector.reset()
+    return {"pid": os.getpid(), **summary}
@@ -30,10 +30,25 @@ class Settings(BaseSettings):
     # Qdrant settings
     QDRANT_HOST: str
     QDRANT_PORT: int
-    QDRANT_SEARCH_URL: str
+    QDRANT_SEARCH_URL: Optional[str] = None  # 이전 REST 검색 URL (app/qdrant.py 클라이언트는 HOST/PORT 사용)
+    QDRANT_COLLECTION: str = "danawa_products"
+    QDRANT_API_KEY: Optional[str] = None
+    QDRANT_PREFER_GRPC: bool = False  # True면 QDRANT_GRPC_PORT로 gRPC 사용
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_TIMEOUT_SECONDS: int = 10
+    QDRANT_MAX_CONNECTIONS: int = 20  # 프로세스당 REST 연결 풀 크기
+    QDRANT_SEARCH_HNSW_EF: Optional[int] = None  # None이면 컬렉션 기본값
+    QDRANT_SEARCH_EXACT: bool = False  # True면 HNSW 없이 전수 검색 (정확도 비교용)
+    QDRANT_SEARCH_VIA_CELERY: bool = True  # False면 API 프로세스에서 async 클라이언트로 직접 검색
 
     # Replicate API key
     REPLICATE_API_KEY: str
+    REPLICATE_API_BASE_URL: str = "https://api.replicate.com/v1"
+
+    # YOLO+CLIP 객체 인식 API
+    YOLO_CLIP_API_URL: str = (
+        "https://yolo-clip-api-604858116968.asia-northeast3.run.app/process"
+    )
 
     # Google Cloud Storage settings
     GCS_BUCKET: str
@@ -49,8 +64,63 @@ class Settings(BaseSettings):
         "https://storage.googleapis.com/furniture-image-bucket"
     )
 
+    # 인증 settings
+    AUTH_CHECK_USER_STATUS: bool = False  # True면 Bearer 인증 시 탈퇴/미존재 사용자 거부
+    USER_STATUS_CACHE_TTL_SECONDS: int = 30  # 사용자 존재 여부 캐시 유지 시간
+    USER_INDEX_RETRY_SECONDS: int = 30  # users 인덱스 생성 실패 시 재시도 간격
+
+    # 로그인 요청 제한 settings (Redis 슬라이딩 윈도우)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    LOGIN_RATE_LIMIT_PER_IP: int = 20  # 윈도우당 IP별 로그인 시도 수
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5  # 윈도우당 이메일별 로그인 시도 수
+    # X-Forwarded-For에 IP를 덧붙이는 신뢰할 수 있는 프록시 수 (Traefik 1단, 0이면 헤더 무시)
+    TRUSTED_PROXY_HOPS: int = 1
+
+    # 비밀번호 해시 settings
+    BCRYPT_ROUNDS: int = 12  # 변경 시 다음 로그인에서 자동으로 재해시됨
+    PASSWORD_HASH_WORKERS: int = 2  # 워커 프로세스당 bcrypt 전용 스레드 수
+    PASSWORD_HASH_QUEUE_SIZE: int = 32  # 초과 시 즉시 거부(503)
+
+    # 스타일 카탈로그 응답 캐시 settings
+    STYLE_CATALOG_VERSION: str = "1"  # ETag에 반영되는 값 (캐시는 워커 재시작 시 다시 만들어짐)
+    STYLE_CATALOG_MAX_AGE_SECONDS: int = 3600  # Cache-Control max-age
+
+    # 생성 파이프라인 메트릭 settings (목록에 없는 style/room_type은 "other"로 기록)
+    METRICS_STYLES: str = "modern,natural,minimal,vintage"  # 쉼표로 구분, 스타일 카탈로그 값도 자동 추가
+    METRICS_ROOM_TYPES: str = "livingroom,bedroom,office"  # 쉼표로 구분
+
+    # 응답 직렬화 settings
+    FAST_RESPONSE_SERIALIZATION: bool = False  # 라이브러리/생성/마이페이지 응답을 response_model 재검증 없이 바로 직렬화
+
+    # AR 치수 통계 settings
+    AR_STATS_CACHE_TTL_SECONDS: int = 300  # 프로세스 내 통계 캐시 유지 시간
+    AR_STATS_REFRESH_INTERVAL_SECONDS: int = 3600  # 0이면 주기적 재계산 비활성화
+    AR_LABELS_CACHE_TTL_SECONDS: int = 300  # AR 모델이 있는 label 목록 캐시 유지 시간
+
+    # OpenTelemetry tracing settings
+    OTEL_ENABLED: bool = False
+    OTEL_EXPORTER: str = "otlp"  # otlp(로컬 collector) | file(JSON lines) | console
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://otel-collector:4318/v1/traces"
+    OTEL_FILE_PATH: str = "/logs/traces.jsonl"
+    OTEL_SAMPLE_RATIO: float = 1.0
+
+    # 운영용(admin) API settings
+    ADMIN_API_TOKEN: Optional[str] = None  # X-Admin-Token 헤더 값, 없으면 운영용 API 비활성화
+
+    # 프로파일링 settings (dev/staging)
+    PROFILING_ENABLED: bool = False  # /debug/profile 엔드포인트 등록
+    PROFILING_MAX_SECONDS: int = 60  # 1회 캡처 최대 시간
+    EVENT_LOOP_LAG_MONITOR_ENABLED: bool = True  # event_loop_lag_seconds 게이지
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    ASYNCIO_SLOW_CALLBACK_SECONDS: float = 0.0  # 0보다 크면 asyncio 디버그 모드로 느린 콜백 로그
+    BLOCKING_DETECTOR_ENABLED: bool = False  # 이벤트 루프를 막는 동기 호출 감지 (/debug/blocking)
+    BLOCKING_DETECTOR_THRESHOLD_SECONDS: float = 0.1
+
     # Logging settings
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # json | text (json은 promtail/Loki에서 필드 조회 가능)
+    LOG_DEBUG_SAMPLE_RATE: float = 0.1  # 반복 debug 로그(polling 진행 등) 샘플링 비율
     LOG_FILE: Optional[str] = None  # 로그 파일 경로 (예: "/logs/app.log")
 
 
@@ -7,6 +7,8 @@ import asyncio
 from typing import Optional
 from app.config import get_settings
 from app.utils.logger import get_logger
+from app.utils import metrics
+from app.utils.metrics import observe_stage
 
 settings = get_settings()
 logger = get_logger("replicate_service")
@@ -17,7 +19,7 @@ class ReplicateService:
 
     def __init__(self):
         self.api_key = settings.REPLICATE_API_KEY
-        self.base_url = "https://api.replicate.com/v1"
+        self.base_url = settings.REPLICATE_API_BASE_URL
         self.model_version = (
             "854e8727697a057c525cdb45ab037f64ecca770a1769cc52287c2e56472a247b"
         )
@@ -68,21 +70,27 @@ class ReplicateService:
 
             async with httpx.AsyncClient() as client:
                 # 예측 생성 요청
-                response = await client.post(
-                    f"{self.base_url}/predictions",
-                    headers=self._get_headers(),
-                    json=payload,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
+                with observe_stage(metrics.STAGE_REPLICATE_CREATE, style, room_type):
+                    response = await client.post(
+                        f"{self.base_url}/predictions",
+                        headers=self._get_headers(),
+                        json=payload,
+                        timeout=30.0,
+                    )
+                    response.raise_for_status()
 
-                prediction_data = response.json()
-                get_url = prediction_data["urls"]["get"]
+                    prediction_data = response.json()
+                    get_url = prediction_data["urls"]["get"]
 
                 # 결과 폴링
-                generated_image_url = await self._poll_prediction_result(
-                    client, get_url
-                )
+                with observe_stage(
+                    metrics.STAGE_REPLICATE_WAIT, style, room_type
+                ) as stage:
+                    generated_image_url = await self._poll_prediction_result(
+                        client, get_url
+                    )
+                    if not generated_image_url:
+                        stage.outcome = "error"
 
                 if generated_image_url:
                     logger.info(
@@ -137,7 +145,11 @@ class ReplicateService:
                     return None
                 else:
                     # 진행 중이면 대기
-                    logger.debug(f"⏳ Polling... Status: {poll_data['status']}")
+                    logger.debug(
+                        "⏳ Polling... Status: %s",
+                        poll_data["status"],
+                        extra={"sample_rate": settings.LOG_DEBUG_SAMPLE_RATE},
+                    )
                     await asyncio.sleep(1)
                     attempt += 1
 
@@ -14,6 +14,8 @@ from app.integrations.replicate import ReplicateService
 from app.interior.schemas.mappers import domain_to_interior_generate_response
 from app.config import get_settings
 from app.utils.logger import get_logger
+from app.utils import metrics
+from app.utils.metrics import observe_stage
 
 # GCS 관련 import 추가
 from google.cloud import storage
@@ -21,6 +23,7 @@ from io import BytesIO
 
 # Celery 및 Qdrant 연동 import (분리된 태스크)
 from app.interior.tasks.qdrant_tasks import qdrant_search_task
+from app.qdrant import search_similar_products
 
 import httpx
 import asyncio
@@ -30,18 +33,7 @@ from dataclasses import dataclass
 settings = get_settings()
 logger = get_logger("interior_service")
 
-YOLO_CLIP_API_URL = "https://yolo-clip-api-604858116968.asia-northeast3.run.app/process"
-QDRANT_SEARCH_URL = settings.QDRANT_SEARCH_URL
-
-
-# Qdrant 유사도 검색 Celery 태스크
-def qdrant_search(embedding, top_k=3):
-    import requests
-
-    payload = {"vector": embedding, "top": top_k, "with_payload": True}
-    resp = requests.post(QDRANT_SEARCH_URL, json=payload, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+YOLO_CLIP_API_URL = settings.YOLO_CLIP_API_URL
 
 
 def now(utc=True):
@@ -67,6 +59,70 @@ def qdrant_payload_to_danawa_product(payload):
     )
 
 
+def merge_qdrant_hits_with_products(points, products_map):
+    """
+    한 가구의 Qdrant hits와 DB 상품을 합쳐 (추천 상품 목록, 대표 이미지 인덱스 목록) 반환
+
+    상품 정보는 DB 상품(없으면 Qdrant payload로 만든 상품)을 기준으로 payload 값을 덮어쓰고,
+    image_url은 payload 이미지 중 대표 이미지 인덱스에 해당하는 하나로 정한다.
+
+    Args:
+        points: Qdrant 검색 결과 points
+        products_map: 상품 id → DB DanawaProduct
+
+    Returns:
+        (DanawaProduct 리스트, image_url 인덱스 리스트)
+    """
+    # 같은 상품 id가 여러 번 나오면 첫 번째 payload 기준
+    payload_by_id = {}
+    for point in points:
+        payload = point.get("payload", {})
+        payload_by_id.setdefault(payload.get("id"), payload)
+
+    danawa_products = []
+    danawa_products_image_index = []
+    for point in points:
+        payload = point.get("payload", {})
+        product_id = payload.get("id", "")
+        db_product = products_map.get(product_id)
+
+        # DB image_url 리스트에서 Qdrant 대표 이미지 위치
+        db_image_url = db_product.image_url if db_product else ""
+        try:
+            img_idx = db_image_url.index(payload.get("image_url", []))
+        except (ValueError, TypeError):
+            img_idx = 0
+        danawa_products_image_index.append(img_idx)
+
+        matched = payload_by_id.get(product_id) or {}
+        qdrant_image_urls = matched.get("image_url", [])
+        if isinstance(qdrant_image_urls, str):
+            qdrant_image_urls = [qdrant_image_urls]
+        if len(qdrant_image_urls) > img_idx:
+            image_url = qdrant_image_urls[img_idx]
+        else:
+            image_url = qdrant_image_urls[0] if qdrant_image_urls else ""
+
+        base = db_product or qdrant_payload_to_danawa_product(payload)
+        danawa_products.append(
+            DanawaProduct(
+                id=base.id,
+                label=matched.get("label", base.label),
+                product_name=matched.get("product_name", base.product_name),
+                product_url=matched.get("product_url", base.product_url),
+                image_url=image_url,  # 대표 이미지
+                dimensions=Dimensions(
+                    width_cm=matched.get("width_cm", base.dimensions.width_cm),
+                    depth_cm=matched.get("depth_cm", base.dimensions.depth_cm),
+                    height_cm=matched.get("height_cm", base.dimensions.height_cm),
+                ),
+                created_at=matched.get("created_at", base.created_at),
+                updated_at=matched.get("updated_at", base.updated_at),
+            )
+        )
+    return danawa_products, danawa_products_image_index
+
+
 class InteriorService:
     def __init__(
         self,
@@ -88,21 +144,39 @@ class InteriorService:
         인테리어 이미지 생성 → 객체 인식 및 임베딩 추출 → Qdrant 검색 → 결과 가공 및 응답 생성
         """
         try:
-            logger.info("🚀 인테리어 생성 프로세스 시작...")
-            # 1. 인테리어 이미지 생성
-            logger.info("🎨 Replicate로 인테리어 이미지 생성 중...")
-            generated_image_url = await self._generate_interior_image(
-                image_url, room_type, style, prompt
-            )
+            with observe_stage(metrics.STAGE_TOTAL, style, room_type):
+                return await self._generate_interior(
+                    user_id, image_url, room_type, style, prompt
+                )
+        except Exception as e:
+            logger.error(f"인테리어 생성 중 오류 발생: {str(e)}")
+            raise Exception(f"인테리어 생성 중 오류 발생: {str(e)}")
 
-            # === GCS 업로드 추가 ===
-            # 생성된 이미지 다운로드
+    async def _generate_interior(
+        self,
+        user_id: str,
+        image_url: str,
+        room_type: str,
+        style: str,
+        prompt: str,
+    ):
+        logger.info("🚀 인테리어 생성 프로세스 시작...")
+        # 1. 인테리어 이미지 생성 (Replicate 단계별 시간은 ReplicateService에서 기록)
+        logger.info("🎨 Replicate로 인테리어 이미지 생성 중...")
+        generated_image_url = await self._generate_interior_image(
+            image_url, room_type, style, prompt
+        )
+
+        # === GCS 업로드 추가 ===
+        # 생성된 이미지 다운로드
+        with observe_stage(metrics.STAGE_IMAGE_DOWNLOAD, style, room_type):
             async with httpx.AsyncClient() as client:
                 resp = await client.get(generated_image_url)
                 resp.raise_for_status()
                 image_bytes = resp.content
 
-            # GCS에 업로드
+        # GCS에 업로드
+        with observe_stage(metrics.STAGE_GCS_UPLOAD, style, room_type):
             gcs_client = storage.Client()
             bucket_name = settings.GCS_BUCKET
             bucket = gcs_client.bucket(bucket_name)
@@ -115,27 +189,28 @@ class InteriorService:
             blob.upload_from_file(BytesIO(image_bytes), content_type="image/jpeg")
             blob.make_public()
 
-            generated_image_url = (
-                f"https://storage.googleapis.com/{bucket_name}/{blob_path}"
-            )
-            logger.info(f"✅ GCS 업로드 완료: {generated_image_url}")
-            # === GCS 업로드 완료 ===
+        generated_image_url = f"https://storage.googleapis.com/{bucket_name}/{blob_path}"
+        logger.info(f"✅ GCS 업로드 완료: {generated_image_url}")
+        # === GCS 업로드 완료 ===
 
-            # 2. YOLO+CLIP 서버로 객체 인식 및 임베딩 추출
-            logger.info("🔍 YOLO+CLIP으로 객체 인식 및 임베딩 추출 중...")
+        # 2. YOLO+CLIP 서버로 객체 인식 및 임베딩 추출
+        logger.info("🔍 YOLO+CLIP으로 객체 인식 및 임베딩 추출 중...")
+        with observe_stage(metrics.STAGE_YOLO_CLIP, style, room_type):
             yolo_results = await self._detect_furniture_with_yolo_clip(
                 generated_image_url
             )
-            logger.info(f"📦 객체 인식 완료: {len(yolo_results)}개 객체 발견")
-
-            # 3. Qdrant 검색 태스크 실행 및 polling
-            logger.info("🔎 Qdrant 유사도 검색 시작...")
-            detected_furnitures = await self._search_qdrant_for_furnitures(yolo_results)
+        logger.info(f"📦 객체 인식 완료: {len(yolo_results)}개 객체 발견")
+        metrics.record_detected_objects(
+            (obj.get("label", "object") for obj in yolo_results), style, room_type
+        )
 
-            # 4. DB에서 상품 정보 조회 및 Qdrant 결과로 enrich
-            logger.info("💾 DB 상품 정보 조회 및 데이터 enrich 중...")
-            await self._enrich_furnitures_with_db_and_qdrant(detected_furnitures)
+        # 3. Qdrant 검색 태스크 실행 및 polling, DB 상품 정보로 enrich
+        logger.info("🔎 Qdrant 유사도 검색 시작...")
+        detected_furnitures = await self._search_qdrant_for_furnitures(
+            yolo_results, style=style, room_type=room_type
+        )
 
+        with observe_stage(metrics.STAGE_MONGO_WRITE, style, room_type):
             # 5. 각 가구(FurnitureDetected) 객체를 DB에 저장하고, id만 리스트로 추출
             detected_furniture_ids = []
             for furniture in detected_furnitures:
@@ -162,13 +237,9 @@ class InteriorService:
             )
             await self.interior_repository.create(interior)
 
-            # 7. 최종 응답 생성 (interior와 실제 가구 객체 리스트를 함께 반환)
-            logger.info("🎉 인테리어 생성 완료!")
-            return domain_to_interior_generate_response(interior, detected_furnitures)
-
-        except Exception as e:
-            logger.error(f"인테리어 생성 중 오류 발생: {str(e)}")
-            raise Exception(f"인테리어 생성 중 오류 발생: {str(e)}")
+        # 7. 최종 응답 생성 (interior와 실제 가구 객체 리스트를 함께 반환)
+        logger.info("🎉 인테리어 생성 완료!")
+        return domain_to_interior_generate_response(interior, detected_furnitures)
 
     async def _detect_furniture_with_yolo_clip(self, image_url: str):
         """YOLO+CLIP 서버에 이미지 URL을 전달하여 객체 인식 및 임베딩 추출"""
@@ -181,161 +252,151 @@ class InteriorService:
             yolo_resp.raise_for_status()
             return yolo_resp.json()  # [{label, confidence, bbox, clip_embedding}, ...]
 
-    async def _search_qdrant_for_furnitures(self, yolo_results):
+    async def _search_qdrant_for_furnitures(
+        self, yolo_results, style: str = "", room_type: str = ""
+    ):
         import uuid
 
         detected_furnitures = []
+        searches = [
+            (
+                str(uuid.uuid4()),
+                obj.get("label", "object"),
+                obj["bbox"],
+                obj.get("clip_embedding"),
+            )
+            for obj in yolo_results
+        ]
+        # 1~2. 각 객체별로 Qdrant 검색 (Celery 태스크 또는 async 클라이언트)
+        if settings.QDRANT_SEARCH_VIA_CELERY:
+            all_hits = await self._search_qdrant_with_celery(searches, style, room_type)
+        else:
+            all_hits = await self._search_qdrant_directly(searches, style, room_type)
+
+        # 3. 결과 가공: 모든 hit의 상품을 DB에서 한 번에 조회
+        all_product_ids = set()
+        for points in all_hits:
+            for point in points:
+                pid = point.get("payload", {}).get("id")
+                if pid:
+                    all_product_ids.add(pid)
+        logger.info("💾 DB 상품 정보 조회 및 데이터 enrich 중...")
+        with observe_stage(metrics.STAGE_MONGO_ENRICH, style, room_type):
+            products = await self.interior_repository.get_danawa_products_by_ids(
+                list(all_product_ids)
+            )
+        products_map = {p.id: p for p in products}
+
+        # 4. 각 가구별로 Qdrant hits와 DB 상품을 합쳐 추천 상품 생성
+        for (part_id, label, bbox, _), points in zip(searches, all_hits):
+            danawa_products, image_index = merge_qdrant_hits_with_products(
+                points, products_map
+            )
+            furniture = FurnitureDetected(
+                id=part_id,
+                label=label,
+                bounding_box=BoundingBox(
+                    x=bbox[0], y=bbox[1], width=bbox[2], height=bbox[3]
+                ),
+                danawa_products=danawa_products,
+                danawa_products_image_index=image_index,
+                created_at=now(),
+                qdrant_hits=points,
+            )
+            detected_furnitures.append(furniture)
+        return detected_furnitures
+
+    async def _search_qdrant_with_celery(self, searches, style: str, room_type: str):
+        """Celery 태스크로 검색하고 모두 끝날 때까지 polling, 객체별 points 목록 반환"""
         celery_results = []
-        # 1. 각 객체별로 Qdrant 검색 태스크 실행
-        for obj in yolo_results:
-            part_id = str(uuid.uuid4())
-            bbox = obj["bbox"]
-            label = obj.get("label", "object")
-            embedding = obj.get("clip_embedding")
+        for part_id, label, _, embedding in searches:
             celery_result = qdrant_search_task.delay(label, embedding, 5)
-            celery_results.append((part_id, celery_result, label, bbox))
+            celery_results.append((part_id, celery_result))
 
-        # 2. polling: 모든 태스크가 끝날 때까지 대기
+        # polling: 모든 태스크가 끝날 때까지 대기
         timeout_sec = 30
         interval_sec = 0.5
         start = time.time()
+        recorded = set()  # 객체별 검색 시간 기록 완료 여부
         logger.info(f"🔄 Qdrant 검색 태스크 시작: {len(celery_results)}개 객체")
         while True:
-            ready_count = sum(1 for _, r, _, _ in celery_results if r.ready())
+            ready_count = 0
+            for part_id, r in celery_results:
+                if not r.ready():
+                    continue
+                ready_count += 1
+                if part_id not in recorded:
+                    recorded.add(part_id)
+                    metrics.record_stage(
+                        metrics.STAGE_QDRANT_SEARCH,
+                        time.time() - start,
+                        style,
+                        room_type,
+                        "success" if r.successful() else "error",
+                    )
             if ready_count == len(celery_results):
                 logger.info(
                     f"✅ Qdrant 검색 완료: {ready_count}/{len(celery_results)}개"
                 )
                 break
             if time.time() - start > timeout_sec:
+                for part_id, _ in celery_results:
+                    if part_id not in recorded:
+                        metrics.record_stage(
+                            metrics.STAGE_QDRANT_SEARCH,
+                            time.time() - start,
+                            style,
+                            room_type,
+                            "timeout",
+                        )
                 logger.error("Qdrant 검색 태스크 timeout")
                 raise Exception("Qdrant 검색 태스크 timeout")
             logger.debug(
-                f"⏳ Qdrant 검색 진행 중: {ready_count}/{len(celery_results)}개 완료..."
+                "⏳ Qdrant 검색 진행 중: %d/%d개 완료...",
+                ready_count,
+                len(celery_results),
+                extra={"sample_rate": settings.LOG_DEBUG_SAMPLE_RATE},
             )
             await asyncio.sleep(interval_sec)
 
-        # 3. 결과 가공 (DB 상품정보 미리 조회)
-        all_product_ids = []
         all_hits = []
-        for _, celery_result, _, _ in celery_results:
-            qdrant_resp = celery_result.get()
-            hits = qdrant_resp.get("result", [])
-            points = (
+        for _, celery_result in celery_results:
+            hits = celery_result.get().get("result", [])
+            all_hits.append(
                 hits["points"] if isinstance(hits, dict) and "points" in hits else hits
             )
-            for point in points:
-                payload = point.get("payload", {})
-                pid = payload.get("id")
-                if pid:
-                    all_product_ids.append(pid)
-            all_hits.append(points)
-        # DB에서 DanawaProduct 미리 조회
-        products = await self.interior_repository.get_danawa_products_by_ids(
-            list(set(all_product_ids))
-        )
-        products_map = {p.id: p for p in products}
+        return all_hits
 
-        # 4. 각 가구별로 DanawaProduct, image_url 인덱스 매칭
-        for idx, (part_id, _, label, bbox) in enumerate(celery_results):
-            points = all_hits[idx]
-            danawa_products = []
-            danawa_products_image_index = []
-            for point in points:
-                payload = point.get("payload", {})
-                qdrant_image_urls = payload.get("image_url", [])
-                db_product = products_map.get(payload.get("id"))
-                db_image_url = db_product.image_url if db_product else ""
-                try:
-                    img_idx = db_image_url.index(qdrant_image_urls)
-                except ValueError:
-                    img_idx = 0
-                danawa_products_image_index.append(img_idx)
-                danawa_products.append(qdrant_payload_to_danawa_product(payload))
-            furniture = FurnitureDetected(
-                id=part_id,
-                label=label,
-                bounding_box=BoundingBox(
-                    x=bbox[0], y=bbox[1], width=bbox[2], height=bbox[3]
-                ),
-                danawa_products=danawa_products,
-                danawa_products_image_index=danawa_products_image_index,
-                created_at=now(),
-            )
-            # Qdrant hits도 함께 저장 (enrich용)
-            furniture._qdrant_hits = points
-            detected_furnitures.append(furniture)
-        return detected_furnitures
-
-    async def _enrich_furnitures_with_db_and_qdrant(self, detected_furnitures):
-        all_product_ids = [p.id for f in detected_furnitures for p in f.danawa_products]
-        products = await self.interior_repository.get_danawa_products_by_ids(
-            all_product_ids
-        )
-        products_map = {p.id: p for p in products}
+    async def _search_qdrant_directly(self, searches, style: str, room_type: str):
+        """공유 async Qdrant 클라이언트로 동시에 검색, 객체별 points 목록 반환"""
+        start = time.time()
 
-        def enrich_product_with_qdrant_info(product, qdrant_payload):
-            return product.__class__(
-                id=product.id,
-                label=qdrant_payload.get("label", getattr(product, "label", "")),
-                product_name=qdrant_payload.get(
-                    "product_name", getattr(product, "product_name", "")
-                ),
-                product_url=qdrant_payload.get(
-                    "product_url", getattr(product, "product_url", "")
-                ),
-                image_url=qdrant_payload.get(
-                    "image_url", getattr(product, "image_url", "")
-                ),
-                dimensions=Dimensions(
-                    width_cm=qdrant_payload.get(
-                        "width_cm", getattr(product.dimensions, "width_cm", 0)
-                    ),
-                    depth_cm=qdrant_payload.get(
-                        "depth_cm", getattr(product.dimensions, "depth_cm", 0)
-                    ),
-                    height_cm=qdrant_payload.get(
-                        "height_cm", getattr(product.dimensions, "height_cm", 0)
-                    ),
-                ),
-                created_at=qdrant_payload.get(
-                    "created_at", getattr(product, "created_at", None)
-                ),
-                updated_at=qdrant_payload.get(
-                    "updated_at", getattr(product, "updated_at", None)
-                ),
+        async def search(label, embedding):
+            try:
+                points = await search_similar_products(label, embedding, 5)
+            except Exception:
+                metrics.record_stage(
+                    metrics.STAGE_QDRANT_SEARCH,
+                    time.time() - start,
+                    style,
+                    room_type,
+                    "error",
+                )
+                raise
+            metrics.record_stage(
+                metrics.STAGE_QDRANT_SEARCH,
+                time.time() - start,
+                style,
+                room_type,
+                "success",
             )
+            return points
 
-        for furniture in detected_furnitures:
-            enriched_products = []
-            for i, product in enumerate(furniture.danawa_products):
-                # Qdrant hits에서 image_url 리스트 추출
-                points = getattr(furniture, "_qdrant_hits", [])
-                payload = None
-                qdrant_image_urls = []
-                for point in points:
-                    if point.get("payload", {}).get("id") == product.id:
-                        payload = point.get("payload", {})
-                        qdrant_image_urls = payload.get("image_url", [])
-                        if isinstance(qdrant_image_urls, str):
-                            qdrant_image_urls = [qdrant_image_urls]
-                        break
-                idx = (
-                    furniture.danawa_products_image_index[i]
-                    if furniture.danawa_products_image_index
-                    and len(furniture.danawa_products_image_index) > i
-                    else 0
-                )
-                image_url = (
-                    qdrant_image_urls[idx]
-                    if qdrant_image_urls and len(qdrant_image_urls) > idx
-                    else (qdrant_image_urls[0] if qdrant_image_urls else "")
-                )
-                db_product = products_map.get(product.id, product)
-                enriched = enrich_product_with_qdrant_info(db_product, payload or {})
-                enriched.image_url = image_url  # 대표 이미지로 덮어쓰기
-                enriched_products.append(enriched)
-            furniture.danawa_products = enriched_products
+        all_hits = await asyncio.gather(
+            *(search(label, embedding) for _, label, _, embedding in searches)
+        )
+        logger.info(f"✅ Qdrant 검색 완료: {len(all_hits)}개")
+        return list(all_hits)
 
     async def _generate_interior_image(
         self,
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Dict, Optional
+from app.interior.application.interior_service import InteriorService
+from app.interior.schemas.interior_schema import StyleInfoListResponse
+from app.interior.schemas.mappers import (
+    interior_type_to_style_info_item,
+    interior_type_to_style_info_response,
+)
+from app.config import get_settings
+from app.utils.logger import get_logger
+from app.utils.metrics import register_styles
+from app.utils.response_cache import CachedResponse, build_cached_response
+
+settings = get_settings()
+logger = get_logger("style_catalog_cache")
+
+
+class StyleCatalogCache:
+    """
+    인테리어 스타일 카탈로그 응답 캐시 (워커 프로세스 단위)
+
+    스타일 카탈로그는 배포 시에만 바뀌므로 직렬화된 응답을 메모리에 보관하고,
+    워커가 다시 시작될 때(배포·재시작) 새로 만든다. 실행 중에는 DB를 다시 읽지 않으므로
+    배포 없이 DB의 카탈로그를 수정했다면 API 컨테이너를 재시작해야 반영된다.
+    """
+
+    def __init__(self):
+        self._all: Optional[CachedResponse] = None
+        self._by_id: Dict[str, CachedResponse] = {}
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._all is not None
+
+    async def warm(self, interior_service: InteriorService):
+        """DB에서 전체 스타일을 읽어 응답을 미리 직렬화"""
+        async with self._lock:
+            if self._is_fresh():
+                return
+            version = settings.STYLE_CATALOG_VERSION
+            styles = await interior_service.get_all_interior_types()
+            self._all = build_cached_response(
+                StyleInfoListResponse(
+                    status="success",
+                    data=[interior_type_to_style_info_item(style) for style in styles],
+                ),
+                version,
+            )
+            self._by_id = {
+                style.id: build_cached_response(
+                    interior_type_to_style_info_response(style), version
+                )
+                for style in styles
+            }
+            # 스타일 요청 값은 "style_" 뒤의 이름이므로 두 형태 모두 메트릭 label로 허용
+            register_styles(style.id.removeprefix("style_") for style in styles)
+            register_styles(style.name for style in styles)
+            logger.info(f"🗂️ 스타일 카탈로그 캐시 생성: {len(styles)}개 (v{version})")
+
+    def invalidate(self):
+        self._all = None
+        self._by_id = {}
+
+    async def get_all(self, interior_service: InteriorService) -> CachedResponse:
+        if not self._is_fresh():
+            await self.warm(interior_service)
+        return self._all
+
+    async def get_by_name(
+        self, interior_service: InteriorService, style_name: str
+    ) -> Optional[CachedResponse]:
+        if not self._is_fresh():
+            await self.warm(interior_service)
+        return self._by_id.get(f"style_{style_name}")
+
+
+style_catalog_cache = StyleCatalogCache()
@@ -1,16 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+# 라이브러리 응답 한 번에 수천 개씩 만들어지므로 slots로 인스턴스 __dict__를 없앤다.
+# 생성 후 바뀌지 않는 값 객체/카탈로그는 frozen, 상태가 바뀌는 엔티티는 mutable로 둔다.
+
+
+@dataclass(frozen=True, slots=True)
 class Dimensions:
     width_cm: int
     depth_cm: int
     height_cm: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DanawaProduct:
     id: str
     label: str
@@ -22,7 +26,7 @@ class DanawaProduct:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
     x: int
     y: int
@@ -30,7 +34,7 @@ class BoundingBox:
     height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FurnitureDetected:
     id: str
     interior_id: str = ""
@@ -42,9 +46,11 @@ class FurnitureDetected:
         None  # Qdrant 이미지 인덱스 리스트
     )
     created_at: Optional[datetime] = None
+    # 생성 중 Qdrant 검색 결과(points) 원본, DB에는 저장하지 않음
+    qdrant_hits: Optional[List[dict]] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InteriorType:
     id: str
     name: str
@@ -52,7 +58,7 @@ class InteriorType:
     image_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Interior:
     id: str
     user_id: str
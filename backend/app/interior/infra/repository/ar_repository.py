@@ -1,20 +1,137 @@
-from app.mongo import db
-from typing import List, Optional
+import time
+from datetime import datetime
+from app.mongo import db, ar_documents_collection, ar_dimension_stats_collection
+from app.config import get_settings
+from typing import Dict, List, Optional, Set, Tuple
+
+settings = get_settings()
+
+DIMENSION_FIELDS = ("width_cm", "depth_cm", "height_cm")
+PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+# 프로세스(워커) 단위 label별 치수 통계 캐시: label -> (만료 시각, 통계 문서)
+_dimension_stats_cache: Dict[str, Tuple[float, Optional[dict]]] = {}
+
+# 프로세스(워커) 단위 AR 모델이 존재하는 label 목록 캐시: (만료 시각, label 집합)
+_known_labels_cache: Optional[Tuple[float, Set[str]]] = None
+
+
+def _dimension_stats_pipeline(refreshed_at: datetime) -> List[dict]:
+    """danawa_products를 label별로 묶어 치수 통계를 계산하고 ar_dimension_stats에 반영하는 파이프라인"""
+    group_stage: dict = {"_id": "$label", "count": {"$sum": 1}}
+    project_stage: dict = {
+        "_id": 1,
+        "label": "$_id",
+        "count": 1,
+        "updated_at": {"$literal": refreshed_at},
+    }
+    for field in DIMENSION_FIELDS:
+        value = f"$dimensions.{field}"
+        group_stage[f"{field}_count"] = {
+            "$sum": {"$cond": [{"$isNumber": value}, 1, 0]}
+        }
+        group_stage[f"{field}_mean"] = {"$avg": value}
+        group_stage[f"{field}_min"] = {"$min": value}
+        group_stage[f"{field}_max"] = {"$max": value}
+        # $avg, $percentile 모두 숫자가 아닌 값(None 등)은 무시한다 (MongoDB 7.0+)
+        group_stage[f"{field}_percentiles"] = {
+            "$percentile": {
+                "input": value,
+                "p": list(PERCENTILES),
+                "method": "approximate",
+            }
+        }
+        percentiles = f"${field}_percentiles"
+        project_stage[field] = {
+            "count": f"${field}_count",
+            "mean": f"${field}_mean",
+            "min": f"${field}_min",
+            "max": f"${field}_max",
+            "p25": {"$arrayElemAt": [percentiles, 0]},
+            "median": {"$arrayElemAt": [percentiles, 1]},
+            "p75": {"$arrayElemAt": [percentiles, 2]},
+            "p90": {"$arrayElemAt": [percentiles, 3]},
+        }
+    return [
+        {"$match": {"label": {"$type": "string"}}},
+        {"$group": group_stage},
+        {"$project": project_stage},
+        {
+            "$merge": {
+                "into": ar_dimension_stats_collection.name,
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
 
 
 class ARRepository:
     def __init__(self):
         self.danawa_collection = db["danawa_products"]
+        self.ar_documents_collection = ar_documents_collection
+        self.dimension_stats_collection = ar_dimension_stats_collection
+
+    async def ensure_indexes(self):
+        """AR 관련 컬렉션 인덱스 생성 (이미 있으면 무시됨)"""
+        await self.ar_documents_collection.create_index([("label", 1)])
+
+    async def get_known_labels(self) -> Set[str]:
+        """AR 모델이 존재하는 label 목록 조회 (프로세스 내 캐시)"""
+        global _known_labels_cache
+        if _known_labels_cache and _known_labels_cache[0] > time.monotonic():
+            return _known_labels_cache[1]
+
+        labels = set(await self.ar_documents_collection.distinct("label"))
+        _known_labels_cache = (
+            time.monotonic() + settings.AR_LABELS_CACHE_TTL_SECONDS,
+            labels,
+        )
+        return labels
 
     async def get_ar_documents_by_label(
         self, label: str, limit: int = 10
     ) -> List[dict]:
-        # label에 따라 컬렉션명을 동적으로 선택
-        ar_collection_name = f"ar_{label}_documents"
-        ar_collection = db[ar_collection_name]
-        return await ar_collection.find({"label": label}).to_list(length=limit)
+        # 알 수 없는 label은 DB 조회 없이 바로 빈 결과 반환
+        if label not in await self.get_known_labels():
+            return []
+        return await self.ar_documents_collection.find({"label": label}).to_list(
+            length=limit
+        )
 
-    async def get_danawa_products_by_label(
-        self, label: str, limit: int = 20
-    ) -> List[dict]:
-        return await self.danawa_collection.find({"label": label}).to_list(length=limit)
+    async def get_dimension_stats(self, label: str) -> Optional[dict]:
+        """label별 치수 통계 조회 (프로세스 내 캐시 우선, 없으면 ar_dimension_stats 조회)"""
+        cached = _dimension_stats_cache.get(label)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        stats = await self.dimension_stats_collection.find_one({"_id": label})
+        _dimension_stats_cache[label] = (
+            time.monotonic() + settings.AR_STATS_CACHE_TTL_SECONDS,
+            stats,
+        )
+        return stats
+
+    async def refresh_dimension_stats(self) -> int:
+        """
+        danawa_products 전체를 대상으로 label별 치수 통계를 다시 계산
+
+        카탈로그 시딩/수정 후 또는 주기적으로 호출한다.
+        카탈로그에서 사라진 label의 통계는 삭제하고, 프로세스 내 캐시를 비운다.
+        여러 워커가 동시에 실행해도 되도록 갱신 시각이 아니라 현재 label 목록 기준으로 삭제한다
+        (다른 워커가 방금 반영한 통계를 지우지 않음).
+
+        Returns:
+            갱신된 label 수
+        """
+        refreshed_at = datetime.utcnow()
+        await self.danawa_collection.aggregate(
+            _dimension_stats_pipeline(refreshed_at)
+        ).to_list(length=None)
+        labels = await self.danawa_collection.distinct(
+            "label", {"label": {"$type": "string"}}
+        )
+        await self.dimension_stats_collection.delete_many({"_id": {"$nin": labels}})
+        _dimension_stats_cache.clear()
+        return await self.dimension_stats_collection.count_documents({})
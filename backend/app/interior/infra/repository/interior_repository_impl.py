@@ -42,6 +42,7 @@ class InteriorRepositoryImpl(InteriorRepository):
             "deleted_at": interior.deleted_at,
         }
 
+    # _dict_to_* 는 라이브러리 조회 시 문서마다 호출되므로 중첩 dict는 한 번만 꺼낸다.
     def _dict_to_interior(self, doc: dict) -> Interior:
         """MongoDB 문서를 Interior 객체로 변환"""
         return Interior(
@@ -96,15 +97,13 @@ class InteriorRepositoryImpl(InteriorRepository):
 
     def _dict_to_furniture_detected(self, doc: dict) -> FurnitureDetected:
         """MongoDB 문서를 FurnitureDetected 객체로 변환"""
+        bbox = doc["bounding_box"]
         return FurnitureDetected(
             id=doc["_id"],
             interior_id=doc["interior_id"],
             label=doc["label"],
             bounding_box=BoundingBox(
-                x=doc["bounding_box"]["x"],
-                y=doc["bounding_box"]["y"],
-                width=doc["bounding_box"]["width"],
-                height=doc["bounding_box"]["height"],
+                x=bbox["x"], y=bbox["y"], width=bbox["width"], height=bbox["height"]
             ),
             danawa_products_id=doc["danawa_products_id"],
             danawa_products_image_index=doc.get("danawa_products_image_index"),
@@ -130,6 +129,7 @@ class InteriorRepositoryImpl(InteriorRepository):
 
     def _dict_to_danawa_product(self, doc: dict) -> DanawaProduct:
         """MongoDB 문서를 DanawaProduct 객체로 변환"""
+        dims = doc["dimensions"]
         return DanawaProduct(
             id=doc["_id"],
             label=doc["label"],
@@ -137,9 +137,9 @@ class InteriorRepositoryImpl(InteriorRepository):
             product_url=doc["product_url"],
             image_url=doc["image_url"],
             dimensions=Dimensions(
-                width_cm=doc["dimensions"]["width_cm"],
-                depth_cm=doc["dimensions"]["depth_cm"],
-                height_cm=doc["dimensions"]["height_cm"],
+                width_cm=dims["width_cm"],
+                depth_cm=dims["depth_cm"],
+                height_cm=dims["height_cm"],
             ),
             created_at=doc.get("created_at"),
             updated_at=doc.get("updated_at"),
@@ -27,28 +27,13 @@ async def get_similar_ar_objects(request: ARSimilarObjectRequest):
             "objects": [],
         }
 
-    # 2. danawa_products에서 label로 상품 정보 조회
-    danawa_docs = await ar_repository.get_danawa_products_by_label(label)
+    # 2. label별 치수 통계 조회 (미리 계산된 ar_dimension_stats, 프로세스 내 캐시)
+    stats = await ar_repository.get_dimension_stats(label) or {}
 
-    # 3. 상품 크기 정보 추출 (평균값 계산)
-    widths = [
-        d["dimensions"]["width_cm"]
-        for d in danawa_docs
-        if d.get("dimensions") and d["dimensions"].get("width_cm") is not None
-    ]
-    depths = [
-        d["dimensions"]["depth_cm"]
-        for d in danawa_docs
-        if d.get("dimensions") and d["dimensions"].get("depth_cm") is not None
-    ]
-    heights = [
-        d["dimensions"]["height_cm"]
-        for d in danawa_docs
-        if d.get("dimensions") and d["dimensions"].get("height_cm") is not None
-    ]
-    avg_width = sum(widths) / len(widths) if widths else None
-    avg_depth = sum(depths) / len(depths) if depths else None
-    avg_height = sum(heights) / len(heights) if heights else None
+    # 3. 상품 크기 정보 추출 (label 전체 상품 기준 평균값)
+    avg_width = (stats.get("width_cm") or {}).get("mean")
+    avg_depth = (stats.get("depth_cm") or {}).get("mean")
+    avg_height = (stats.get("height_cm") or {}).get("mean")
 
     # 4. AR 객체에 크기 정보 추가
     objects = []
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Request
 from app.user.dependencies import get_current_user_id_bearer
 from app.interior.dependencies import get_interior_service, get_gcs_service
 from app.interior.application.interior_service import InteriorService
+from app.interior.application.style_catalog_cache import style_catalog_cache
 from app.integrations.gcs import GCSService
+from app.config import get_settings
 from app.utils.logger import get_logger
+from app.utils.response_cache import cached_json_response
+from app.utils.fast_response import fast_json_response
 from app.interior.schemas.interior_schema import (
     InteriorGenerateRequest,
     InteriorGenerateResponse,
@@ -16,14 +20,11 @@ from app.interior.schemas.interior_schema import (
     ImageUploadResponse,
     ErrorResponse,  # 추가
 )
-from app.interior.schemas.mappers import (
-    interior_type_to_style_info_item,
-    interior_type_to_style_info_response,
-    domain_to_user_library_interior,
-)
+from app.interior.schemas.mappers import domain_to_user_library_interior
 
 router = APIRouter(prefix="/interiors", tags=["Interior Api"])
 logger = get_logger("interior_controller")
+settings = get_settings()
 
 # JWT 토큰 검증은 user 모듈의 의존성 함수를 사용합니다
 # 쿠키 기반: get_current_user_id
@@ -146,6 +147,8 @@ async def generate_interior(
         )
 
         logger.info(f"인테리어 생성 성공 - 사용자: {user_id}")
+        if settings.FAST_RESPONSE_SERIALIZATION:
+            return fast_json_response(response)
         return response
 
     except Exception as e:
@@ -161,40 +164,59 @@ async def generate_interior(
         )
 
 
+async def _style_info_response(
+    request: Request, style_name: str, interior_service: InteriorService
+):
+    try:
+        cached = await style_catalog_cache.get_by_name(interior_service, style_name)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"서버 내부 오류가 발생했습니다: {str(e)}"
+        )
+    if not cached:
+        raise HTTPException(status_code=404, detail="해당 스타일을 찾을 수 없습니다.")
+    return cached_json_response(
+        request, cached, settings.STYLE_CATALOG_MAX_AGE_SECONDS
+    )
+
+
 @router.post("/style-info", response_model=StyleInfoResponse)
 async def get_style_info(
-    request: StyleInfoRequest,
+    body: StyleInfoRequest,
+    request: Request,
     interior_service: InteriorService = Depends(get_interior_service),
 ):
     """
     스타일 name을 기반으로 인테리어 스타일 정보를 조회합니다.
     """
-    try:
-        style_info = await interior_service.get_style_info_by_name(request.style_name)
-        if not style_info:
-            raise HTTPException(
-                status_code=404, detail="해당 스타일을 찾을 수 없습니다."
-            )
-        return interior_type_to_style_info_response(style_info)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"서버 내부 오류가 발생했습니다: {str(e)}"
-        )
+    return await _style_info_response(request, body.style_name, interior_service)
+
+
+@router.get("/style-info", response_model=StyleInfoResponse)
+async def get_style_info_cacheable(
+    style_name: str,
+    request: Request,
+    interior_service: InteriorService = Depends(get_interior_service),
+):
+    """
+    스타일 name을 기반으로 인테리어 스타일 정보를 조회합니다. (GET, ETag/304 지원)
+    """
+    return await _style_info_response(request, style_name, interior_service)
 
 
 @router.get("/style-info/all", response_model=StyleInfoListResponse)
 async def get_all_style_info(
+    request: Request,
     interior_service: InteriorService = Depends(get_interior_service),
 ):
     """
-    전체 인테리어 스타일 정보를 조회합니다.
+    전체 인테리어 스타일 정보를 조회합니다. (ETag/304 지원)
     """
     try:
-        styles = await interior_service.get_all_interior_types()
-        data = [interior_type_to_style_info_item(style) for style in styles]
-        return StyleInfoListResponse(status="success", data=data)
+        cached = await style_catalog_cache.get_all(interior_service)
+        return cached_json_response(
+            request, cached, settings.STYLE_CATALOG_MAX_AGE_SECONDS
+        )
     except Exception:
         return {
             "status": "error",
@@ -242,6 +264,9 @@ async def get_user_library(
             domain_to_user_library_interior(i, furniture_map, products_map)
             for i in interiors
         ]
-        return UserLibraryResponse(status="success", interiors=result)
+        response = UserLibraryResponse(status="success", interiors=result)
+        if settings.FAST_RESPONSE_SERIALIZATION:
+            return fast_json_response(response)
+        return response
     except Exception as e:
         return {"status": "error", "message": "인증되지 않은 사용자입니다."}
@@ -1,5 +1,7 @@
 from app.config import get_settings
+from app.utils.tracing import setup_tracing
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 settings = get_settings()
 
@@ -11,3 +13,16 @@ celery_app = Celery(
     broker=CELERY_BROKER_URL,
     backend=CELERY_RESULT_BACKEND,
 )
+
+
+@worker_process_init.connect(weak=False)
+def init_worker_tracing(*args, **kwargs):
+    # prefork 워커 프로세스마다 TracerProvider 설정 및 태스크 계측
+    setup_tracing("team_k_celery_worker")
+
+
+@worker_process_shutdown.connect(weak=False)
+def close_worker_qdrant_client(*args, **kwargs):
+    from app.qdrant import close_qdrant_client
+
+    close_qdrant_client()
@@ -1,20 +1,8 @@
-import os
 from app.interior.tasks.celery_app import celery_app
-import requests
-
-QDRANT_SEARCH_URL = os.getenv(
-    "QDRANT_SEARCH_URL", "http://qdrant:6333/collections/danawa_products/points/search"
-)
+from app.qdrant import search_similar_products_sync
 
 
 @celery_app.task
 def qdrant_search_task(label, embedding, top_k=5):
-    payload = {
-        "query": embedding,
-        "top": top_k,
-        "with_payload": True,
-        "filter": {"must": {"key": "label", "match": {"value": label}}},
-    }
-    resp = requests.post(QDRANT_SEARCH_URL, json=payload, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    # 워커 프로세스마다 재사용하는 Qdrant 클라이언트로 검색 (기존 REST 응답과 같은 형태로 반환)
+    return {"result": search_similar_products_sync(label, embedding, top_k)}
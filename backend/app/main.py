@@ -1,18 +1,129 @@
 # app/main.py
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.user.interface.controller import user_controller
 from app.interior.interface.controller import interior_controller
 from prometheus_fastapi_instrumentator import Instrumentator
 from fastapi.middleware.cors import CORSMiddleware
-from app.utils.logger import setup_logger
+from app.utils.logger import setup_logger, stop_log_listener
 from app.config import get_settings
+from app.interior.infra.repository.ar_repository import ARRepository
+from app.interior.application.style_catalog_cache import style_catalog_cache
+from app.interior.dependencies import get_interior_service
+from app.user.infra.repository.user_repo import UserRepository
+from app.utils.tracing import instrument_fastapi_app, setup_tracing, shutdown_tracing
+from app.utils.request_context import RequestContextMiddleware
+from app.utils.profiling import enable_slow_callback_detection, monitor_event_loop_lag
+from app.utils.blocking_detector import start_blocking_detector
+from app.common.interface.controller import debug_controller
+from app.qdrant import close_async_qdrant_client
+from app.redis_client import redis_client
 
 # 로깅 설정
 settings = get_settings()
-logger = setup_logger("team_k_backend", settings.LOG_LEVEL, log_file=settings.LOG_FILE)
+logger = setup_logger(
+    "team_k_backend",
+    settings.LOG_LEVEL,
+    log_file=settings.LOG_FILE,
+    json_format=settings.LOG_FORMAT.lower() == "json",
+)
 logger.info("🚀 FastAPI 애플리케이션 시작")
 
-app = FastAPI()
+# 여러 워커(컨테이너) 중 한 곳에서만 AR 치수 통계를 재계산하기 위한 Redis 락
+AR_STATS_REFRESH_LOCK_KEY = "lock:ar_dimension_stats_refresh"
+AR_STATS_STARTUP_LOCK_SECONDS = 300  # 주기적 재계산이 꺼져 있을 때 시작 시 계산 락 유지 시간
+
+
+async def refresh_ar_dimension_stats_periodically(interval_seconds: int):
+    """
+    label별 AR 치수 통계를 주기적으로 재계산
+
+    모든 워커에서 실행되지만 주기마다 Redis 락을 잡은 워커 하나만 재계산한다.
+    락은 주기만큼 유지되므로 다른 워커는 다음 주기까지 건너뛰고,
+    각 워커의 통계 캐시는 AR_STATS_CACHE_TTL_SECONDS 뒤에 새 통계를 읽는다.
+    """
+    ar_repository = ARRepository()
+    lock_seconds = (
+        interval_seconds if interval_seconds > 0 else AR_STATS_STARTUP_LOCK_SECONDS
+    )
+    while True:
+        try:
+            acquired = await redis_client.set(
+                AR_STATS_REFRESH_LOCK_KEY, "1", nx=True, ex=lock_seconds
+            )
+            if acquired:
+                try:
+                    count = await ar_repository.refresh_dimension_stats()
+                except Exception:
+                    # 실패하면 락을 풀어 다른 워커가 다음 주기를 기다리지 않고 재시도하게 함
+                    await redis_client.delete(AR_STATS_REFRESH_LOCK_KEY)
+                    raise
+                logger.info(f"📐 AR 치수 통계 갱신 완료: {count}개 label")
+        except Exception as e:
+            logger.warning(f"AR 치수 통계 갱신 실패: {str(e)}")
+        if interval_seconds <= 0:
+            return
+        await asyncio.sleep(interval_seconds)
+
+
+async def ensure_user_indexes_with_retry(retry_seconds: int):
+    """users 인덱스가 생성될 때까지 재시도 (Mongo 장애 시 워커가 재시작을 반복하지 않도록)"""
+    user_repository = UserRepository()
+    while True:
+        try:
+            await user_repository.ensure_indexes()
+            return
+        except Exception as e:
+            # 이메일 중복 방지를 unique 인덱스에 의존하므로 생성될 때까지 계속 시도
+            logger.error(f"users 인덱스 생성 실패 ({retry_seconds}초 후 재시도): {str(e)}")
+        await asyncio.sleep(retry_seconds)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # TracerProvider는 워커 프로세스마다 생성 (gunicorn preload_app 이후 fork 고려)
+    setup_tracing("team_k_backend")
+    try:
+        await ARRepository().ensure_indexes()
+    except Exception as e:
+        logger.warning(f"AR 인덱스 생성 실패: {str(e)}")
+    user_index_task = asyncio.create_task(
+        ensure_user_indexes_with_retry(settings.USER_INDEX_RETRY_SECONDS)
+    )
+    try:
+        await style_catalog_cache.warm(get_interior_service())
+    except Exception as e:
+        logger.warning(f"스타일 카탈로그 캐시 생성 실패: {str(e)}")
+    # 시작 시 AR 치수 통계를 한 번 계산하고, 이후 설정된 주기로 재계산
+    stats_task = asyncio.create_task(
+        refresh_ar_dimension_stats_periodically(
+            settings.AR_STATS_REFRESH_INTERVAL_SECONDS
+        )
+    )
+    loop_lag_task = None
+    if settings.EVENT_LOOP_LAG_MONITOR_ENABLED:
+        loop_lag_task = asyncio.create_task(
+            monitor_event_loop_lag(settings.EVENT_LOOP_LAG_INTERVAL_SECONDS)
+        )
+    if settings.ASYNCIO_SLOW_CALLBACK_SECONDS > 0:
+        enable_slow_callback_detection(settings.ASYNCIO_SLOW_CALLBACK_SECONDS)
+    if settings.BLOCKING_DETECTOR_ENABLED:
+        start_blocking_detector(
+            asyncio.get_running_loop(), settings.BLOCKING_DETECTOR_THRESHOLD_SECONDS
+        )
+    yield
+    user_index_task.cancel()
+    stats_task.cancel()
+    if loop_lag_task:
+        loop_lag_task.cancel()
+    await close_async_qdrant_client()
+    shutdown_tracing()
+    stop_log_listener()
+
+
+app = FastAPI(lifespan=lifespan)
+instrument_fastapi_app(app)
 
 
 # 허용할 origin 리스트
@@ -36,13 +147,20 @@ app.add_middleware(
         "Accept",
         "Origin",
         "Referer",
+        "X-Request-ID",
     ],
+    expose_headers=["X-Request-ID"],
 )
+# 요청 ID를 로그 컨텍스트에 설정 (가장 바깥에서 실행되도록 마지막에 추가)
+app.add_middleware(RequestContextMiddleware)
 
 
 # 라우터 등록
 app.include_router(user_controller.router)
 app.include_router(interior_controller.router)
+# 프로파일링/루프 막힘 엔드포인트 (admin 토큰 필요)
+if settings.PROFILING_ENABLED or settings.BLOCKING_DETECTOR_ENABLED:
+    app.include_router(debug_controller.router)
 # 👉 Prometheus metrics 등록
 Instrumentator().instrument(app).expose(app)
 
@@ -1,8 +1,11 @@
 # app/mongo.py
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.config import get_settings  # 설정에서 MONGO_URI 가져오기
+from app.utils.tracing import instrument_pymongo
 
 settings = get_settings()
+# 클라이언트 생성 시 전역 command listener가 복사되므로 계측을 먼저 등록
+instrument_pymongo()
 client = AsyncIOMotorClient(settings.MONGO_URI)
 db = client["interior_db"]  # 원하는 DB 이름
 
@@ -14,3 +17,7 @@ interior_collection = db["interiors"]  # 인테리어 메인 컬렉션
 interior_type_collection = db["interior_types"]  # 인테리어 스타일 타입 컬렉션
 furniture_detected_collection = db["furniture_detected"]  # 가구 인식 결과 컬렉션
 danawa_products_collection = db["danawa_products"]  # 다나와 제품 컬렉션
+
+# AR 관련 컬렉션
+ar_documents_collection = db["ar_documents"]  # label별 3D 모델 통합 컬렉션
+ar_dimension_stats_collection = db["ar_dimension_stats"]  # label별 치수 통계 컬렉션
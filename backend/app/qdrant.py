@@ -0,0 +1,132 @@
+# app/qdrant.py
+import os
+from typing import List, Optional
+import httpx
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+from app.config import get_settings  # 설정에서 QDRANT_HOST/PORT 가져오기
+
+settings = get_settings()
+
+# qdrant_payload_to_danawa_product / merge_qdrant_hits_with_products가 읽는 필드만 받는다
+PRODUCT_PAYLOAD_FIELDS = [
+    "id",
+    "label",
+    "product_name",
+    "product_url",
+    "image_url",
+    "width_cm",
+    "depth_cm",
+    "height_cm",
+    "created_at",
+    "updated_at",
+]
+
+_async_client: Optional[AsyncQdrantClient] = None
+_sync_client: Optional[QdrantClient] = None
+_sync_client_pid: Optional[int] = None
+
+
+def _client_kwargs() -> dict:
+    return dict(
+        host=settings.QDRANT_HOST,
+        port=settings.QDRANT_PORT,
+        grpc_port=settings.QDRANT_GRPC_PORT,
+        prefer_grpc=settings.QDRANT_PREFER_GRPC,
+        api_key=settings.QDRANT_API_KEY,
+        timeout=settings.QDRANT_TIMEOUT_SECONDS,
+        # 생성 시 서버 버전 확인 요청을 보내지 않음
+        check_compatibility=False,
+        # 기본값은 keep-alive 연결을 두지 않으므로 풀 크기를 명시
+        limits=httpx.Limits(
+            max_connections=settings.QDRANT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.QDRANT_MAX_CONNECTIONS,
+        ),
+    )
+
+
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    """
+    API 프로세스에서 공유하는 async Qdrant 클라이언트
+
+    gunicorn preload_app으로 fork되기 전에 연결(특히 gRPC 채널)이 만들어지지 않도록
+    처음 사용할 때 생성한다.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncQdrantClient(**_client_kwargs())
+    return _async_client
+
+
+async def close_async_qdrant_client():
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
+
+def get_qdrant_client() -> QdrantClient:
+    """
+    Celery 워커 프로세스마다 하나씩 재사용하는 동기 Qdrant 클라이언트
+
+    prefork 워커는 부모의 연결을 물려받으면 안 되므로 pid가 바뀌면 새로 만든다.
+    """
+    global _sync_client, _sync_client_pid
+    if _sync_client is None or _sync_client_pid != os.getpid():
+        _sync_client = QdrantClient(**_client_kwargs())
+        _sync_client_pid = os.getpid()
+    return _sync_client
+
+
+def close_qdrant_client():
+    global _sync_client, _sync_client_pid
+    if _sync_client is not None and _sync_client_pid == os.getpid():
+        _sync_client.close()
+    _sync_client = None
+    _sync_client_pid = None
+
+
+def _search_kwargs(label: str, embedding: List[float], top_k: int) -> dict:
+    search_params = None
+    if settings.QDRANT_SEARCH_HNSW_EF is not None or settings.QDRANT_SEARCH_EXACT:
+        search_params = models.SearchParams(
+            hnsw_ef=settings.QDRANT_SEARCH_HNSW_EF,
+            exact=settings.QDRANT_SEARCH_EXACT,
+        )
+    return dict(
+        collection_name=settings.QDRANT_COLLECTION,
+        query=embedding,
+        query_filter=models.Filter(
+            must=[
+                models.FieldCondition(key="label", match=models.MatchValue(value=label))
+            ]
+        ),
+        search_params=search_params,
+        limit=top_k,
+        with_payload=PRODUCT_PAYLOAD_FIELDS,
+    )
+
+
+def _points_to_dicts(points) -> List[dict]:
+    # 기존 REST 검색 응답의 result와 같은 형태 (Celery 결과로 JSON 직렬화 가능)
+    return [
+        {"id": point.id, "score": point.score, "payload": point.payload or {}}
+        for point in points
+    ]
+
+
+async def search_similar_products(
+    label: str, embedding: List[float], top_k: int = 5
+) -> List[dict]:
+    """label 필터 안에서 embedding과 가까운 상품 points 검색 (async)"""
+    response = await get_async_qdrant_client().query_points(
+        **_search_kwargs(label, embedding, top_k)
+    )
+    return _points_to_dicts(response.points)
+
+
+def search_similar_products_sync(
+    label: str, embedding: List[float], top_k: int = 5
+) -> List[dict]:
+    """label 필터 안에서 embedding과 가까운 상품 points 검색 (Celery 워커용)"""
+    response = get_qdrant_client().query_points(**_search_kwargs(label, embedding, top_k))
+    return _points_to_dicts(response.points)
@@ -0,0 +1,11 @@
+# app/redis_client.py
+from redis.asyncio import Redis
+from app.config import get_settings  # 설정에서 REDIS_HOST/PORT 가져오기
+
+settings = get_settings()
+redis_client = Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    socket_connect_timeout=1,
+    socket_timeout=1,
+)
@@ -3,13 +3,22 @@ from app.user.domain.repository.user_repo import IUserRepository
 from datetime import datetime
 from typing import Optional
 import ulid
-import bcrypt
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from app.user.schemas.user_schema import (
     UserResponse,
     ProfileResponse,
 )
 from app.mongo import user_collection
+from app.user.application.user_status_cache import user_status_cache
+from app.user.infra.repository.user_repo import ACTIVE_USER_FILTER
 from app.utils.jwt_utils import create_access_token, create_refresh_token
+from app.utils.password_hasher import (
+    PasswordHashQueueFull,
+    hash_password,
+    verify_password,
+    needs_rehash,
+)
 
 # from app.user.schemas.user_schema import UserResponse
 
@@ -25,15 +34,10 @@ class UserService:
         password: str,
         profile_image_url: Optional[str] = None,
     ) -> UserResponse:
-        # 1. 이메일 중복 확인 나중에 구현하자
-        existing_user = await user_collection.find_one({"email": email})
-        if existing_user:
-            raise ValueError("이미 사용 중인 이메일입니다.")
+        # 1. 이메일 중복은 탈퇴하지 않은 사용자 대상 email unique 인덱스로 삽입 시점에 확인 (4번)
 
-        # 2. 비밀번호 암호화
-        hashed_pw = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
-            "utf-8"
-        )
+        # 2. 비밀번호 암호화 (전용 스레드 풀에서 실행)
+        hashed_pw = await hash_password(password)
 
         # 3. 사용자 딕셔너리 생성
         now = datetime.now()
@@ -49,8 +53,11 @@ class UserService:
             "updated_at": now,
         }
 
-        # 4. MongoDB에 삽입
-        await user_collection.insert_one(user_dict)
+        # 4. MongoDB에 삽입 (이메일 중복 시 DuplicateKeyError)
+        try:
+            await user_collection.insert_one(user_dict)
+        except DuplicateKeyError:
+            raise ValueError("이미 사용 중인 이메일입니다.")
 
         # 5. 비밀번호 제거 후 응답용 데이터 반환
         del user_dict["password"]
@@ -59,21 +66,26 @@ class UserService:
         return UserResponse(**user_dict)
 
     async def login_user(self, email: str, password: str):
-        user = await user_collection.find_one({"email": email})
+        # 탈퇴한 사용자와 같은 이메일로 다시 가입할 수 있으므로 탈퇴하지 않은 사용자만 조회
+        # (email partial 인덱스의 조건과 같아야 인덱스를 사용함)
+        user = await user_collection.find_one(
+            {"email": email, **ACTIVE_USER_FILTER}
+        )
         if not user:
             raise ValueError("존재하지 않는 이메일입니다.")
 
-        if not bcrypt.checkpw(
-            password.encode("utf-8"), user["password"].encode("utf-8")
-        ):
+        if not await verify_password(password, user["password"]):
             raise ValueError("비밀번호가 일치하지 않습니다.")
 
-        # 로그인 성공 시 last_login_at 업데이트
-        from datetime import datetime
+        # 로그인 성공 시 last_login_at 업데이트 (비용 설정이 바뀌었으면 재해시)
+        update_fields: dict[str, object] = {"last_login_at": datetime.now()}
+        if needs_rehash(user["password"]):
+            try:
+                update_fields["password"] = await hash_password(password)
+            except PasswordHashQueueFull:
+                pass  # 재해시는 부가 작업이므로 대기열이 가득 차면 다음 로그인으로 미룬다
 
-        await user_collection.update_one(
-            {"_id": user["_id"]}, {"$set": {"last_login_at": datetime.now()}}
-        )
+        await user_collection.update_one({"_id": user["_id"]}, {"$set": update_fields})
 
         # JWT 토큰 발급
         user_id = user["_id"]
@@ -83,7 +95,7 @@ class UserService:
 
     async def get_user_by_id(self, user_id: str) -> Optional[ProfileResponse]:
         """사용자 ID로 사용자 프로필 정보 조회 (최소 정보만)"""
-        user = await user_collection.find_one({"_id": user_id, "deleted_at": None})
+        user = await user_collection.find_one({"_id": user_id, **ACTIVE_USER_FILTER})
         if not user:
             return None
         return ProfileResponse(
@@ -100,22 +112,7 @@ class UserService:
         email: Optional[str] = None,
         profile_image_url: Optional[str] = None,
     ) -> ProfileResponse:
-        """사용자 프로필 수정"""
-        # 사용자 존재 확인
-        existing_user = await user_collection.find_one(
-            {"_id": user_id, "deleted_at": None}
-        )
-        if not existing_user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
-
-        # 이메일 중복 확인 (이메일이 변경되는 경우)
-        if email and email != existing_user.get("email"):
-            email_exists = await user_collection.find_one(
-                {"email": email, "deleted_at": None}
-            )
-            if email_exists:
-                raise ValueError("이미 사용 중인 이메일입니다.")
-
+        """사용자 프로필 수정 (조회·중복 확인·수정을 한 번의 요청으로 처리)"""
         # 업데이트할 필드 구성
         update_fields: dict[str, object] = {"updated_at": datetime.now()}
         if name is not None:
@@ -125,24 +122,31 @@ class UserService:
         if profile_image_url is not None:
             update_fields["profile_image_url"] = profile_image_url
 
-        # MongoDB 업데이트
-        await user_collection.update_one({"_id": user_id}, {"$set": update_fields})
-
-        # 업데이트된 사용자 정보 반환
-        updated_user = await user_collection.find_one({"_id": user_id})
-        if updated_user:
-            return ProfileResponse(
-                id=str(updated_user["_id"]),
-                name=updated_user["name"],
-                email=updated_user["email"],
-                profile_image_url=updated_user.get("profile_image_url"),
+        # MongoDB 업데이트 후 수정된 문서 반환 (이메일 중복은 unique 인덱스로 확인)
+        try:
+            updated_user = await user_collection.find_one_and_update(
+                {"_id": user_id, **ACTIVE_USER_FILTER},
+                {"$set": update_fields},
+                projection={"password": 0},
+                return_document=ReturnDocument.AFTER,
             )
-        else:
-            raise ValueError("사용자 정보 업데이트 후 조회에 실패했습니다.")
+        except DuplicateKeyError:
+            raise ValueError("이미 사용 중인 이메일입니다.")
+        user_status_cache.invalidate(user_id)
+
+        if not updated_user:
+            raise ValueError("사용자를 찾을 수 없습니다.")
+        return ProfileResponse(
+            id=str(updated_user["_id"]),
+            name=updated_user["name"],
+            email=updated_user["email"],
+            profile_image_url=updated_user.get("profile_image_url"),
+        )
 
     async def delete_user(self, user_id: str) -> bool:
         """사용자 삭제 (소프트 삭제)"""
         result = await user_collection.update_one(
             {"_id": user_id}, {"$set": {"deleted_at": datetime.now()}}
         )
+        user_status_cache.invalidate(user_id)
         return result.modified_count > 0
@@ -0,0 +1,50 @@
+import time
+from typing import Dict, Tuple
+from app.mongo import user_collection
+from app.config import get_settings
+from app.user.infra.repository.user_repo import ACTIVE_USER_FILTER
+
+settings = get_settings()
+
+USER_STATUS_CACHE_SIZE = 10000  # 캐시 최대 항목 수
+
+
+class UserStatusCache:
+    """
+    사용자 존재/삭제 여부를 짧은 TTL로 캐시 (워커 프로세스 단위)
+
+    같은 워커에서 사용자 삭제/프로필 수정 시 invalidate로 즉시 반영되며,
+    다른 워커에는 최대 USER_STATUS_CACHE_TTL_SECONDS 뒤에 반영된다.
+    """
+
+    def __init__(self):
+        self._items: Dict[str, Tuple[float, bool]] = {}
+
+    async def is_active(self, user_id: str) -> bool:
+        item = self._items.get(user_id)
+        if item and item[0] > time.monotonic():
+            return item[1]
+
+        doc = await user_collection.find_one(
+            {"_id": user_id, **ACTIVE_USER_FILTER}, projection={"_id": 1}
+        )
+        active = doc is not None
+        if len(self._items) >= USER_STATUS_CACHE_SIZE:
+            self._prune()
+        self._items[user_id] = (
+            time.monotonic() + settings.USER_STATUS_CACHE_TTL_SECONDS,
+            active,
+        )
+        return active
+
+    def _prune(self):
+        now = time.monotonic()
+        self._items = {k: v for k, v in self._items.items() if v[0] > now}
+        if len(self._items) >= USER_STATUS_CACHE_SIZE:
+            self._items.clear()
+
+    def invalidate(self, user_id: str):
+        self._items.pop(user_id, None)
+
+
+user_status_cache = UserStatusCache()
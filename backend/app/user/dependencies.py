@@ -1,10 +1,19 @@
 from fastapi import HTTPException, Depends, Cookie, Request
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from typing import Optional
-from app.utils.jwt_utils import decode_token
+import hashlib
+from app.utils.jwt_utils import decode_token_cached
 from app.user.application.user_service import UserService
+from app.user.application.user_status_cache import user_status_cache
+from app.config import get_settings
+from app.redis_client import redis_client
+from app.utils.rate_limiter import SlidingWindowRateLimiter
+from app.utils.logger import user_id_var
 from app.user.infra.repository.user_repo import UserRepository
 
+settings = get_settings()
+login_rate_limiter = SlidingWindowRateLimiter(redis_client, prefix="ratelimit:login")
+
 
 def get_user_repository() -> UserRepository:
     """UserRepository 의존성 함수"""
@@ -22,12 +31,14 @@ def get_user_service(
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
 
-def get_current_user_id_bearer(token: str = Depends(oauth2_scheme)) -> str:
+async def get_current_user_id_bearer(token: str = Depends(oauth2_scheme)) -> str:
     """
     Bearer 토큰을 검증하고 사용자 ID를 반환하는 의존성 함수
+    검증된 토큰은 exp까지 캐시되며, AUTH_CHECK_USER_STATUS가 켜져 있으면
+    탈퇴/미존재 사용자를 캐시된 상태 조회로 거부한다.
     """
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
         if not payload or payload.get("type") != "access":
             raise HTTPException(
                 status_code=401,
@@ -43,6 +54,17 @@ def get_current_user_id_bearer(token: str = Depends(oauth2_scheme)) -> str:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        if settings.AUTH_CHECK_USER_STATUS and not await user_status_cache.is_active(
+            user_id
+        ):
+            raise HTTPException(
+                status_code=401,
+                detail="존재하지 않거나 탈퇴한 사용자입니다.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        # 이후 요청 처리 중 남기는 로그에 user_id 포함
+        user_id_var.set(user_id)
         return user_id
     except HTTPException:
         raise
@@ -54,7 +76,7 @@ def get_current_user_id_bearer(token: str = Depends(oauth2_scheme)) -> str:
         )
 
 
-def get_current_user_id_bearer_optional(
+async def get_current_user_id_bearer_optional(
     token: str = Depends(oauth2_scheme),
 ) -> Optional[str]:
     """
@@ -62,17 +84,19 @@ def get_current_user_id_bearer_optional(
     토큰이 없거나 유효하지 않아도 None을 반환
     """
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
         if not payload or payload.get("type") != "access":
             return None
 
         user_id = payload.get("user_id")
+        if user_id:
+            user_id_var.set(user_id)
         return user_id if user_id else None
     except Exception:
         return None
 
 
-def get_current_user_id(access_token: str = Cookie(None)) -> str:
+async def get_current_user_id(access_token: str = Cookie(None)) -> str:
     """
     JWT 토큰을 검증하고 사용자 ID를 반환하는 의존성 함수 (쿠키 기반)
     """
@@ -80,7 +104,7 @@ def get_current_user_id(access_token: str = Cookie(None)) -> str:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
 
     try:
-        payload = decode_token(access_token)
+        payload = decode_token_cached(access_token)
         if not payload or payload.get("type") != "access":
             raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
 
@@ -97,7 +121,7 @@ def get_current_user_id(access_token: str = Cookie(None)) -> str:
         raise HTTPException(status_code=401, detail=f"토큰 검증 실패: {str(e)}")
 
 
-def get_current_user_id_optional(access_token: str = Cookie(None)) -> Optional[str]:
+async def get_current_user_id_optional(access_token: str = Cookie(None)) -> Optional[str]:
     """
     JWT 토큰을 검증하고 사용자 ID를 반환하는 의존성 함수 (선택적)
     토큰이 없거나 유효하지 않아도 None을 반환
@@ -106,7 +130,7 @@ def get_current_user_id_optional(access_token: str = Cookie(None)) -> Optional[s
         return None
 
     try:
-        payload = decode_token(access_token)
+        payload = decode_token_cached(access_token)
         if not payload or payload.get("type") != "access":
             return None
 
@@ -125,7 +149,7 @@ def verify_token_from_request(request: Request) -> str:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
 
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
         if not payload or payload.get("type") != "access":
             raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
 
@@ -140,3 +164,47 @@ def verify_token_from_request(request: Request) -> str:
         raise
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"토큰 검증 실패: {str(e)}")
+
+
+def _client_ip(request: Request) -> str:
+    """
+    신뢰할 수 있는 프록시(Traefik)가 X-Forwarded-For에 덧붙인 클라이언트 IP
+
+    앞쪽 항목은 클라이언트가 임의로 보낼 수 있으므로, 프록시가 오른쪽에 덧붙인
+    TRUSTED_PROXY_HOPS번째 항목을 사용한다. 헤더가 없거나 짧으면 직접 연결한 IP.
+    """
+    hops = settings.TRUSTED_PROXY_HOPS
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for and hops > 0:
+        addresses = [ip.strip() for ip in forwarded_for.split(",") if ip.strip()]
+        if len(addresses) >= hops:
+            return addresses[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+async def enforce_login_rate_limit(
+    request: Request, form_data: OAuth2PasswordRequestForm = Depends()
+):
+    """
+    로그인 시도를 IP별/이메일별로 제한하는 의존성 함수
+    Mongo 조회와 bcrypt 검증 전에 실행되어 초과 요청을 429로 바로 거부한다.
+    """
+    if not settings.LOGIN_RATE_LIMIT_ENABLED:
+        return
+
+    window = settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS
+    email_digest = hashlib.sha256(
+        form_data.username.strip().lower().encode("utf-8")
+    ).hexdigest()
+    checks = [
+        ("login_ip", _client_ip(request), settings.LOGIN_RATE_LIMIT_PER_IP),
+        ("login_email", email_digest, settings.LOGIN_RATE_LIMIT_PER_EMAIL),
+    ]
+    for scope, identifier, limit in checks:
+        result = await login_rate_limiter.hit(scope, identifier, limit, window)
+        if not result.allowed:
+            raise HTTPException(
+                status_code=429,
+                detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(result.retry_after_seconds)},
+            )
@@ -7,7 +7,36 @@ from app.mongo import user_collection
 from datetime import datetime
 
 
+# 탈퇴(소프트 삭제)하지 않은 사용자끼리만 이메일 중복을 막는 인덱스
+ACTIVE_EMAIL_INDEX = "email_active_unique"
+LEGACY_EMAIL_INDEX = "email_1"
+# 탈퇴하지 않은 사용자 조건 (deleted_at 필드가 없는 문서는 ensure_indexes에서 null로 채움)
+ACTIVE_USER_FILTER = {"deleted_at": {"$type": "null"}}
+
+
 class UserRepository(IUserRepository):
+    async def ensure_indexes(self):
+        """
+        users 컬렉션 인덱스 생성 (이메일 중복 방지용 partial unique 인덱스)
+
+        deleted_at이 null인 문서만 인덱싱하므로 탈퇴한 사용자의 이메일은 다시 가입하거나
+        프로필 이메일로 사용할 수 있다. 탈퇴한 사용자까지 막던 이전 전체 unique 인덱스는 삭제한다.
+        deleted_at 필드가 없는 이전 문서는 null로 채워 ACTIVE_USER_FILTER 조건과 맞춘다.
+        """
+        await user_collection.update_many(
+            {"deleted_at": {"$exists": False}}, {"$set": {"deleted_at": None}}
+        )
+        indexes = await user_collection.index_information()
+        legacy = indexes.get(LEGACY_EMAIL_INDEX)
+        if legacy and legacy.get("unique") and "partialFilterExpression" not in legacy:
+            await user_collection.drop_index(LEGACY_EMAIL_INDEX)
+        await user_collection.create_index(
+            [("email", 1)],
+            name=ACTIVE_EMAIL_INDEX,
+            unique=True,
+            partialFilterExpression=ACTIVE_USER_FILTER,
+        )
+
     async def save(self, user: User):
         doc = {
             "_id": user.id,
@@ -17,6 +46,7 @@ class UserRepository(IUserRepository):
             "memo": user.memo,
             "created_at": user.created_at,
             "updated_at": user.updated_at,
+            "deleted_at": None,
         }
         await user_collection.insert_one(doc)
 
@@ -14,14 +14,19 @@ from app.user.dependencies import (
     get_current_user_id,
     get_user_service,
     get_current_user_id_bearer,
+    enforce_login_rate_limit,
 )
 import logging
 from app.interior.dependencies import get_interior_service
 from app.interior.application.interior_service import InteriorService
 from app.utils.logger import get_logger
+from app.utils.fast_response import fast_json_response
+from app.utils.password_hasher import PasswordHashQueueFull
+from app.config import get_settings
 
 router = APIRouter(prefix="/users", tags=["User Api"])
 logger = get_logger("user_controller")
+settings = get_settings()
 
 # OAuth2 스키마 정의
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
@@ -54,6 +59,11 @@ async def create_user(
             f"회원가입 실패 (검증 오류) - 이메일: {user.email}, 오류: {str(e)}"
         )
         raise HTTPException(status_code=400, detail=str(e))
+    except PasswordHashQueueFull as e:
+        logger.warning(f"회원가입 지연 (해시 대기열 초과) - 이메일: {user.email}")
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error(
             f"회원가입 실패 (서버 오류) - 이메일: {user.email}, 오류: {str(e)}"
@@ -91,7 +101,7 @@ async def create_user(
 #         raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
 
 
-@router.post("/login")
+@router.post("/login", dependencies=[Depends(enforce_login_rate_limit)])
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     user_service: UserService = Depends(get_user_service),
@@ -120,6 +130,11 @@ async def login(
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    except PasswordHashQueueFull as e:
+        logger.warning(f"로그인 지연 (해시 대기열 초과) - 사용자: {form_data.username}")
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
 
@@ -235,7 +250,10 @@ async def get_mypage(
             if interior.saved
         ]
 
-        return {"status": "success", "user": user_info, "interiors": saved_interiors}
+        response = {"status": "success", "user": user_info, "interiors": saved_interiors}
+        if settings.FAST_RESPONSE_SERIALIZATION:
+            return fast_json_response(response)
+        return response
 
     except HTTPException:
         raise
@@ -0,0 +1,206 @@
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from prometheus_client import Counter
+from app.utils.logger import get_logger
+
+logger = get_logger("blocking_detector")
+
+EVENT_LOOP_BLOCKED_TOTAL = Counter(
+    "event_loop_blocked_total",
+    "threshold보다 오래 이벤트 루프를 막은 호출 수",
+)
+
+# 호출 위치를 찾을 때 우선하는 소스 경로 (app 패키지)
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_MAX_STACK_FRAMES = 20
+
+
+@dataclass
+class BlockingEvent:
+    location: str  # 루프를 막은 것으로 보이는 app 코드 위치 "file:line in func"
+    duration_seconds: float
+    stack: List[str]
+    detected_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class _LocationSummary:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seen: float = 0.0
+    last_stack: List[str] = field(default_factory=list)
+
+
+def _format_frame(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+
+
+def _attribute(frame) -> Tuple[str, List[str]]:
+    """
+    가장 안쪽 프레임부터 올라가며 app 패키지 안의 첫 프레임을 호출 위치로 사용
+    (PIL, bcrypt, requests 등 라이브러리 내부가 아니라 그걸 부른 우리 코드를 가리키도록)
+    """
+    stack = []
+    location = None
+    while frame is not None:
+        formatted = _format_frame(frame)
+        stack.append(formatted)
+        if location is None and frame.f_code.co_filename.startswith(_APP_DIR):
+            location = formatted
+        frame = frame.f_back
+    if location is None and stack:
+        location = stack[0]
+    return location or "<unknown>", list(reversed(stack[:_MAX_STACK_FRAMES]))
+
+
+class BlockingDetector:
+    """
+    이벤트 루프를 threshold 이상 막는 동기 호출 감지기
+
+    루프에서는 call_later로 heartbeat만 갱신하고, 별도 감시 스레드가
+    heartbeat가 threshold 이상 멈춘 순간 루프 스레드의 스택을 찍어 호출 위치를 기록한다.
+    uvloop에서도 동작한다.
+    """
+
+    def __init__(self, threshold_seconds: float = 0.1, max_events: int = 100):
+        self.threshold_seconds = threshold_seconds
+        self.max_events = max_events
+        self._check_interval = max(threshold_seconds / 4, 0.005)
+        self._lock = threading.Lock()
+        self._loop = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._current: Optional[BlockingEvent] = None
+        self._events: List[BlockingEvent] = []
+        self._summary: Dict[str, _LocationSummary] = {}
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def events(self) -> List[BlockingEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def attach(self, loop):
+        """감시할 이벤트 루프 지정 (루프가 실행되면 heartbeat 시작)"""
+        with self._lock:
+            self._loop = loop
+            self._loop_thread_id = None
+            self._current = None
+        loop.call_soon_threadsafe(self._beat, loop)
+
+    def start(self, loop):
+        self.attach(loop)
+        if self._watchdog is None:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="blocking-detector", daemon=True
+            )
+            self._watchdog.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _beat(self, loop):
+        if loop is not self._loop or loop.is_closed():
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._loop_thread_id = threading.get_ident()
+            if self._current is not None:
+                # 막힘이 끝났으므로 실제 소요 시간으로 갱신
+                self._finish_current(now)
+            self._last_beat = now
+        loop.call_later(self._check_interval, self._beat, loop)
+
+    def _watch(self):
+        while not self._stopped.wait(self._check_interval):
+            loop = self._loop
+            if loop is None or loop.is_closed() or not loop.is_running():
+                # 루프가 멈춰 있던 시간은 막힘으로 세지 않음
+                self._last_beat = time.monotonic()
+                continue
+            with self._lock:
+                if self._current is not None or self._loop_thread_id is None:
+                    continue
+                stalled = time.monotonic() - self._last_beat
+                if stalled < self.threshold_seconds:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is None:
+                    continue
+                location, stack = _attribute(frame)
+                self._current = BlockingEvent(
+                    location=location, duration_seconds=stalled, stack=stack
+                )
+            logger.warning(
+                "🧱 이벤트 루프 막힘 감지 (%.3fs 이상): %s",
+                stalled,
+                location,
+            )
+
+    def _finish_current(self, now: float):
+        event = self._current
+        self._current = None
+        event.duration_seconds = max(event.duration_seconds, now - self._last_beat)
+
+        EVENT_LOOP_BLOCKED_TOTAL.inc()
+        self._events.append(event)
+        del self._events[: -self.max_events]
+
+        summary = self._summary.setdefault(event.location, _LocationSummary())
+        summary.count += 1
+        summary.total_seconds += event.duration_seconds
+        summary.max_seconds = max(summary.max_seconds, event.duration_seconds)
+        summary.last_seen = event.detected_at
+        summary.last_stack = event.stack
+
+    def flush(self):
+        """루프가 멈춰 아직 끝나지 않은 것으로 남은 막힘을 기록으로 확정"""
+        with self._lock:
+            if self._current is not None:
+                self._finish_current(time.monotonic())
+
+    def summary(self) -> dict:
+        """호출 위치별 막힘 횟수/시간 (총 시간 내림차순)"""
+        with self._lock:
+            locations = sorted(
+                self._summary.items(), key=lambda item: item[1].total_seconds, reverse=True
+            )
+            return {
+                "threshold_seconds": self.threshold_seconds,
+                "locations": [
+                    {
+                        "location": location,
+                        "count": s.count,
+                        "total_seconds": round(s.total_seconds, 4),
+                        "max_seconds": round(s.max_seconds, 4),
+                        "last_seen": s.last_seen,
+                        "last_stack": s.last_stack,
+                    }
+                    for location, s in locations
+                ],
+            }
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self._summary.clear()
+
+
+# 워커 프로세스당 하나 (BLOCKING_DETECTOR_ENABLED일 때 lifespan에서 시작)
+blocking_detector: Optional[BlockingDetector] = None
+
+
+def start_blocking_detector(loop, threshold_seconds: float) -> BlockingDetector:
+    global blocking_detector
+    if blocking_detector is None:
+        blocking_detector = BlockingDetector(threshold_seconds)
+    blocking_detector.start(loop)
+    logger.info(f"🧱 이벤트 루프 막힘 감지 활성화 (threshold={threshold_seconds}s)")
+    return blocking_detector
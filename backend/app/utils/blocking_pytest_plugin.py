@@ -0,0 +1,77 @@
+"""
+이벤트 루프를 막는 동기 호출이 있으면 테스트를 실패시키는 pytest 플러그인
+
+저장소 루트의 conftest.py에서 등록하므로 저장소 루트에서 pytest를 실행하면 항상 적용된다.
+threshold는 pyproject.toml의 blocking_threshold_ms 또는 옵션으로 바꾼다.
+    pytest --blocking-threshold-ms=200
+
+- 테스트 중 새로 만들어지는 이벤트 루프(pytest-asyncio, anyio, TestClient)를 모두 감시한다.
+- 의도적으로 막는 테스트는 @pytest.mark.allow_blocking 으로 제외한다.
+"""
+
+import asyncio
+import pytest
+from app.utils.blocking_detector import BlockingDetector
+
+_detector: BlockingDetector = None
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("blocking", "event loop blocking detector")
+    group.addoption(
+        "--blocking-threshold-ms",
+        type=float,
+        default=None,
+        help="이 시간 이상 이벤트 루프를 막으면 테스트 실패 (기본: ini blocking_threshold_ms)",
+    )
+    parser.addini(
+        "blocking_threshold_ms", "이벤트 루프 막힘 threshold (ms)", default="100"
+    )
+
+
+def pytest_configure(config):
+    global _detector
+    config.addinivalue_line(
+        "markers", "allow_blocking: 이벤트 루프 막힘 감지에서 제외"
+    )
+    threshold_ms = config.getoption("--blocking-threshold-ms") or float(
+        config.getini("blocking_threshold_ms")
+    )
+    _detector = BlockingDetector(threshold_ms / 1000)
+
+    # 새 이벤트 루프가 만들어질 때마다 감시 대상으로 등록
+    policy = asyncio.get_event_loop_policy()
+    original_new_event_loop = policy.new_event_loop
+
+    def new_event_loop():
+        loop = original_new_event_loop()
+        _detector.start(loop)
+        return loop
+
+    policy.new_event_loop = new_event_loop
+
+
+def pytest_unconfigure(config):
+    if _detector is not None:
+        _detector.stop()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    _detector.flush()
+    _detector.reset()
+    result = yield
+    _detector.flush()
+    if item.get_closest_marker("allow_blocking"):
+        return result
+    new_events = _detector.events
+    if new_events:
+        lines = [
+            f"  {event.duration_seconds:.3f}s at {event.location}" for event in new_events
+        ]
+        pytest.fail(
+            "이벤트 루프를 막는 동기 호출 감지 "
+            f"(threshold={_detector.threshold_seconds}s):\n" + "\n".join(lines),
+            pytrace=False,
+        )
+    return result
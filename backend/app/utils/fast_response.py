@@ -0,0 +1,26 @@
+from typing import Any
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+def fast_json_response(content: Any, status_code: int = 200) -> Response:
+    """
+    응답 본문을 pydantic-core로 한 번에 JSON 직렬화한 Response 반환
+
+    FastAPI는 핸들러가 모델을 반환하면 response_model로 다시 검증하고
+    jsonable_encoder + json.dumps를 거치지만, Response를 반환하면 그대로 전송한다.
+    매퍼에서 이미 검증한 모델이나 JSON 호환 dict에만 사용한다.
+
+    Args:
+        content: Pydantic 모델 또는 JSON 호환 dict/list
+        status_code: HTTP 상태 코드
+
+    Returns:
+        application/json Response
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json().encode("utf-8")
+    else:
+        body = to_json(content)
+    return Response(content=body, media_type="application/json", status_code=status_code)
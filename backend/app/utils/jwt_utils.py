@@ -1,4 +1,8 @@
 import jwt
+import time
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Tuple, Optional
 from fastapi import Cookie, HTTPException, status, Depends
@@ -7,6 +11,7 @@ JWT_SECRET = "your_jwt_secret"  # 실제 환경에서는 환경변수로 관리
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+VERIFIED_TOKEN_CACHE_SIZE = 10000  # 검증된 토큰 claims 캐시 최대 개수
 
 
 def create_access_token(user_id: str) -> str:
@@ -31,4 +36,67 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
+class VerifiedTokenCache:
+    """
+    검증이 끝난 토큰 claims를 보관하는 LRU 캐시
+
+    키는 토큰 원문이 아닌 SHA256 digest이며, 각 항목은 토큰의 exp 시각에 만료된다.
+    호출자가 claims를 수정해도 캐시에 영향이 없도록 저장·조회 시 복사본을 사용한다.
+    """
+
+    def __init__(self, maxsize: int = VERIFIED_TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, payload = item
+            if expires_at <= time.time():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return dict(payload)
+
+    def set(self, token: str, payload: dict):
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._items[key] = (float(exp), dict(payload))
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+verified_token_cache = VerifiedTokenCache()
+
+
+def decode_token_cached(token: str) -> Optional[dict]:
+    """
+    decode_token과 동일하지만 한 번 검증된 토큰은 exp까지 서명 검증을 생략
+    유효하지 않은 토큰은 캐시하지 않는다.
+    """
+    payload = verified_token_cache.get(token)
+    if payload is not None:
+        return payload
+    payload = decode_token(token)
+    if payload:
+        verified_token_cache.set(token, payload)
+    return payload
+
+
 # get_current_user_id 함수는 app.user.dependencies에서 관리됩니다
@@ -1,28 +1,123 @@
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from typing import Optional
 
+APP_LOGGER_NAME = "team_k_backend"
+
+# 요청 단위 컨텍스트 (요청 ID 미들웨어와 인증 의존성에서 설정)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# 텍스트 포맷에서 요청 밖(시작/종료, 백그라운드 작업) 로그의 request_id 자리 표시
+NO_REQUEST_ID = "-"
+
+
+class ContextFilter(logging.Filter):
+    """로그 발생 시점의 request_id/user_id를 레코드에 복사"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or NO_REQUEST_ID
+        record.user_id = user_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    extra={"sample_rate": 0.1}처럼 sample_rate가 지정된 레코드만 확률적으로 남김
+    (Qdrant polling 진행 상황처럼 자주 찍히는 로그용)
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        sample_rate = getattr(record, "sample_rate", None)
+        if sample_rate is None:
+            return True
+        return random.random() < sample_rate
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    기본 QueueHandler.prepare는 예외 traceback을 message 뒤에 붙여버리므로
+    message와 예외 텍스트를 따로 보관한 채로 큐에 넣는다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _plain_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_plain_formatter = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나 (promtail docker 수집 후 Loki json 파서로 조회 가능)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id and request_id != NO_REQUEST_ID:
+            log["request_id"] = request_id
+        user_id = getattr(record, "user_id", None)
+        if user_id:
+            log["user_id"] = user_id
+        if record.exc_info:
+            log["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log["exc_info"] = record.exc_text
+        return json.dumps(log, ensure_ascii=False, default=str)
+
 
 def setup_logger(
-    name: str = "team_k_backend",
+    name: str = APP_LOGGER_NAME,
     level: str = "INFO",
     log_format: Optional[str] = None,
     log_file: Optional[str] = None,
+    json_format: bool = False,
 ) -> logging.Logger:
     """
     애플리케이션 로거 설정
 
+    로거에는 QueueHandler만 붙이고, 실제 콘솔/파일 출력은 별도 스레드의
+    QueueListener가 처리하므로 로그 I/O가 이벤트 루프를 막지 않는다.
+    gunicorn preload_app처럼 설정 후 fork되면 자식 프로세스에서 리스너를 다시 시작한다.
+
     Args:
         name: 로거 이름
         level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_format: 로그 포맷 문자열
+        log_format: 로그 포맷 문자열 (json_format=False일 때)
         log_file: 로그 파일 경로 (선택사항)
+        json_format: True면 JSON 한 줄 형식으로 출력
 
     Returns:
         설정된 로거 인스턴스
     """
+    global _listener
+
     if log_format is None:
-        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        log_format = (
+            "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+        )
 
     # 로거 생성
     logger = logging.getLogger(name)
@@ -32,44 +127,86 @@ def setup_logger(
     if logger.handlers:
         return logger
 
+    # 포맷터 설정
+    formatter = JsonFormatter() if json_format else logging.Formatter(log_format)
+
     # 콘솔 핸들러 설정
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-
-    # 포맷터 설정
-    formatter = logging.Formatter(log_format)
     console_handler.setFormatter(formatter)
-
-    # 핸들러 추가
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # 파일 핸들러 설정 (선택사항)
     if log_file:
         try:
             # 로그 디렉토리 생성
-            import os
-
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
 
             file_handler = logging.FileHandler(log_file, encoding="utf-8")
-            file_handler.setLevel(getattr(logging, level.upper()))
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             # 파일 핸들러 생성 실패 시 콘솔에만 로그
             print(f"로그 파일 핸들러 생성 실패: {e}")
 
+    # 로거 → QueueHandler → (백그라운드 스레드) QueueListener → 콘솔/파일
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _ContextQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+    queue_handler.addFilter(ContextFilter())
+    logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_log_listener)
+
     return logger
 
 
-def get_logger(name: str = "team_k_backend") -> logging.Logger:
+def _pause_log_listener_before_fork():
+    # 리스너 스레드가 출력 도중(스트림 lock 보유)에 fork되면 자식에서 교착되므로
+    # 큐를 모두 비우고 스레드를 멈춘 뒤 fork한다
+    if _listener is not None:
+        _listener.stop()
+
+
+def _resume_log_listener_after_fork():
+    # fork된 자식 프로세스에는 리스너 스레드가 없어 큐를 아무도 읽지 않으므로
+    # 부모/자식 모두 같은 큐와 핸들러로 리스너를 다시 시작한다
+    # (preload된 gunicorn 워커, Celery prefork 워커)
+    if _listener is not None:
+        _listener.start()
+
+
+os.register_at_fork(
+    before=_pause_log_listener_before_fork,
+    after_in_parent=_resume_log_listener_after_fork,
+    after_in_child=_resume_log_listener_after_fork,
+)
+
+
+def stop_log_listener():
+    """남은 로그를 모두 출력하고 QueueListener 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str = APP_LOGGER_NAME) -> logging.Logger:
     """
     기존 로거 가져오기 또는 새로 생성
 
+    모듈 로거는 앱 로거(team_k_backend)의 하위 로거로 만들어
+    setup_logger에서 설정한 핸들러와 레벨을 그대로 사용한다.
+
     Args:
         name: 로거 이름
 
     Returns:
         로거 인스턴스
     """
-    return logging.getLogger(name)
+    if name == APP_LOGGER_NAME or name.startswith(f"{APP_LOGGER_NAME}."):
+        return logging.getLogger(name)
+    return logging.getLogger(f"{APP_LOGGER_NAME}.{name}")
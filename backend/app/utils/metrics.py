@@ -0,0 +1,108 @@
+import time
+from contextlib import contextmanager
+from typing import Iterable
+from prometheus_client import Counter, Histogram
+from app.config import get_settings
+
+settings = get_settings()
+
+# 인테리어 생성 파이프라인 단계
+STAGE_REPLICATE_CREATE = "replicate_create"
+STAGE_REPLICATE_WAIT = "replicate_wait"
+STAGE_IMAGE_DOWNLOAD = "image_download"
+STAGE_GCS_UPLOAD = "gcs_upload"
+STAGE_YOLO_CLIP = "yolo_clip"
+STAGE_QDRANT_SEARCH = "qdrant_search"
+STAGE_MONGO_ENRICH = "mongo_enrich"
+STAGE_MONGO_WRITE = "mongo_write"
+STAGE_TOTAL = "total"
+
+GENERATION_STAGE_SECONDS = Histogram(
+    "interior_generation_stage_seconds",
+    "인테리어 생성 파이프라인 단계별 소요 시간",
+    ["stage", "style", "room_type", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120),
+)
+GENERATION_DETECTED_OBJECTS = Histogram(
+    "interior_generation_detected_objects",
+    "인테리어 생성 1회당 인식된 가구 수",
+    ["style", "room_type"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 20),
+)
+DETECTED_OBJECTS_TOTAL = Counter(
+    "interior_detected_objects_total",
+    "인식된 가구 수 (label별)",
+    ["label"],
+)
+
+# style/room_type은 요청의 자유 문자열이므로 알려진 값만 label로 쓰고 나머지는 "other"로 묶는다
+# (label 조합 수가 무한히 늘어나지 않도록)
+OTHER_LABEL = "other"
+
+
+def _parse_values(values: str) -> set:
+    return {value.strip().lower() for value in values.split(",") if value.strip()}
+
+
+_known_styles = _parse_values(settings.METRICS_STYLES)
+_known_room_types = _parse_values(settings.METRICS_ROOM_TYPES)
+
+
+def register_styles(styles: Iterable[str]):
+    """스타일 카탈로그에 있는 스타일을 메트릭 label로 허용"""
+    _known_styles.update(style.strip().lower() for style in styles if style)
+
+
+def _style_label(style: str) -> str:
+    style = (style or "").strip().lower()
+    return style if style in _known_styles else OTHER_LABEL
+
+
+def _room_type_label(room_type: str) -> str:
+    room_type = (room_type or "").strip().lower()
+    return room_type if room_type in _known_room_types else OTHER_LABEL
+
+
+class StageTimer:
+    """observe_stage 블록 안에서 결과(outcome)를 직접 지정할 때 사용"""
+
+    def __init__(self):
+        self.outcome = "success"
+
+
+@contextmanager
+def observe_stage(stage: str, style: str = "", room_type: str = ""):
+    """
+    with 블록의 소요 시간을 단계별 히스토그램에 기록
+    예외가 발생하면 outcome="error"로 기록하고 예외는 그대로 전달한다.
+    """
+    timer = StageTimer()
+    started_at = time.perf_counter()
+    try:
+        yield timer
+    except BaseException:
+        timer.outcome = "error"
+        raise
+    finally:
+        GENERATION_STAGE_SECONDS.labels(
+            stage, _style_label(style), _room_type_label(room_type), timer.outcome
+        ).observe(time.perf_counter() - started_at)
+
+
+def record_stage(
+    stage: str, seconds: float, style: str = "", room_type: str = "", outcome="success"
+):
+    """이미 측정한 소요 시간을 단계별 히스토그램에 기록"""
+    GENERATION_STAGE_SECONDS.labels(
+        stage, _style_label(style), _room_type_label(room_type), outcome
+    ).observe(seconds)
+
+
+def record_detected_objects(labels, style: str = "", room_type: str = ""):
+    """생성 1회에서 인식된 가구 수와 label별 개수 기록"""
+    labels = list(labels)
+    GENERATION_DETECTED_OBJECTS.labels(
+        _style_label(style), _room_type_label(room_type)
+    ).observe(len(labels))
+    for label in labels:
+        DETECTED_OBJECTS_TOTAL.labels(label).inc()
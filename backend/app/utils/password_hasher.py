@@ -0,0 +1,92 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+from prometheus_client import Counter, Histogram
+from app.config import get_settings
+
+settings = get_settings()
+
+# bcrypt는 해싱 중 GIL을 놓기 때문에 전용 스레드 풀에서 실행하면 이벤트 루프가 멈추지 않는다
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+# 실행 중 + 대기 중인 해시 작업 수 (이벤트 루프 스레드에서만 변경)
+_pending = 0
+
+PASSWORD_HASH_QUEUE_SECONDS = Histogram(
+    "password_hash_queue_seconds",
+    "비밀번호 해시 작업이 스레드 풀에서 대기한 시간",
+    ["operation"],
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "비밀번호 해시 작업 실행 시간",
+    ["operation"],
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "대기열이 가득 차 거부된 비밀번호 해시 작업 수",
+    ["operation"],
+)
+
+
+class PasswordHashQueueFull(Exception):
+    """비밀번호 해시 대기열이 가득 찼을 때 발생"""
+
+
+def _timed(operation: str, submitted_at: float, func, *args):
+    started_at = time.perf_counter()
+    PASSWORD_HASH_QUEUE_SECONDS.labels(operation).observe(started_at - submitted_at)
+    try:
+        return func(*args)
+    finally:
+        PASSWORD_HASH_SECONDS.labels(operation).observe(
+            time.perf_counter() - started_at
+        )
+
+
+async def _run(operation: str, func, *args):
+    global _pending
+    limit = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE
+    if _pending >= limit:
+        PASSWORD_HASH_REJECTED.labels(operation).inc()
+        raise PasswordHashQueueFull("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+
+    _pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _executor, _timed, operation, time.perf_counter(), func, *args
+        )
+    finally:
+        _pending -= 1
+
+
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode(
+        "utf-8"
+    )
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+
+async def hash_password(password: str) -> str:
+    """BCRYPT_ROUNDS 비용으로 비밀번호 해시 생성"""
+    return await _run("hash", _hash, password, settings.BCRYPT_ROUNDS)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """비밀번호와 bcrypt 해시 일치 여부 확인"""
+    return await _run("verify", _verify, password, hashed)
+
+
+def needs_rehash(hashed: str) -> bool:
+    """해시의 비용(rounds)이 현재 BCRYPT_ROUNDS와 다르면 True"""
+    try:
+        # 형식: $2b$<rounds>$<salt+hash>
+        return int(hashed.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
@@ -0,0 +1,125 @@
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from prometheus_client import Gauge
+from app.utils.logger import APP_LOGGER_NAME, get_logger
+
+logger = get_logger("profiling")
+
+EVENT_LOOP_LAG_SECONDS = Gauge(
+    "event_loop_lag_seconds",
+    "이벤트 루프 지연 시간 (예약한 sleep보다 늦게 깨어난 시간)",
+)
+
+# 워커 프로세스당 한 번에 하나의 캡처만 허용 (cProfile은 스레드당 하나만 활성화 가능)
+_capture_lock = asyncio.Lock()
+
+
+class ProfilerBusy(Exception):
+    """이미 다른 프로파일링 캡처가 진행 중인 경우"""
+
+
+async def monitor_event_loop_lag(interval_seconds: float):
+    """
+    interval마다 sleep 후 실제로 깨어난 시각과의 차이를 게이지에 기록
+    루프를 막는 동기 호출이 있으면 이 값이 커진다.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started_at = loop.time()
+        await asyncio.sleep(interval_seconds)
+        lag = loop.time() - started_at - interval_seconds
+        EVENT_LOOP_LAG_SECONDS.set(max(0.0, lag))
+
+
+def enable_slow_callback_detection(threshold_seconds: float):
+    """
+    asyncio 디버그 모드로 threshold보다 오래 걸린 콜백/코루틴 step을 경고 로그로 남긴다.
+    ("Executing <Task ... coro=<...>> took 0.250 seconds")
+
+    디버그 모드는 오버헤드가 있으므로 dev/staging에서만 켠다.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = threshold_seconds
+
+    # asyncio 로거는 앱 로거 하위가 아니므로 앱 로그 핸들러(JSON, 큐)를 그대로 연결
+    asyncio_logger = logging.getLogger("asyncio")
+    asyncio_logger.setLevel(logging.WARNING)
+    for handler in logging.getLogger(APP_LOGGER_NAME).handlers:
+        if handler not in asyncio_logger.handlers:
+            asyncio_logger.addHandler(handler)
+    asyncio_logger.propagate = False
+    logger.info(f"🐢 slow callback 감지 활성화 (threshold={threshold_seconds}s)")
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def sample_thread_stacks(
+    thread_id: int, seconds: float, interval_seconds: float
+) -> Counter:
+    """
+    py-spy처럼 대상 스레드의 스택을 주기적으로 샘플링해 collapsed stack별 횟수 반환
+    반드시 대상 스레드가 아닌 다른 스레드에서 호출한다.
+    """
+    stacks: Counter = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(_frame_name(frame))
+            frame = frame.f_back
+        if stack:
+            stacks[";".join(reversed(stack))] += 1
+        time.sleep(interval_seconds)
+    return stacks
+
+
+def to_collapsed(stacks: Counter) -> str:
+    """flamegraph.pl / speedscope에서 바로 읽을 수 있는 collapsed stack 형식"""
+    return "".join(
+        f"{stack} {count}\n" for stack, count in stacks.most_common()
+    )
+
+
+async def capture_sampling_profile(seconds: float, interval_seconds: float) -> str:
+    """이벤트 루프 스레드를 N초 동안 샘플링해 collapsed stack 문자열 반환"""
+    if _capture_lock.locked():
+        raise ProfilerBusy()
+    async with _capture_lock:
+        loop_thread_id = threading.get_ident()
+        stacks = await asyncio.to_thread(
+            sample_thread_stacks, loop_thread_id, seconds, interval_seconds
+        )
+    return to_collapsed(stacks)
+
+
+async def capture_cprofile(seconds: float, sort_by: str = "cumulative", limit: int = 50) -> str:
+    """
+    이벤트 루프 스레드에서 N초 동안 cProfile을 켜서 pstats 텍스트 반환
+    그 사이 이 워커에서 실행된 모든 코루틴이 포함된다.
+    """
+    if _capture_lock.locked():
+        raise ProfilerBusy()
+    async with _capture_lock:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats(sort_by).print_stats(limit)
+    return output.getvalue()
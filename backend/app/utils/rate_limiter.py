@@ -0,0 +1,80 @@
+import time
+import uuid
+from dataclasses import dataclass
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from app.utils.logger import get_logger
+
+logger = get_logger("rate_limiter")
+
+RATE_LIMIT_REJECTED = Counter(
+    "rate_limit_rejected_total",
+    "요청 제한으로 거부된 요청 수",
+    ["scope"],
+)
+
+# 윈도우 밖의 기록을 지우고, 한도 미만일 때만 이번 요청을 기록 (원자적으로 실행)
+# 반환값: {허용 여부(1/0), 재시도까지 남은 ms}
+_SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= limit then
+  local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+  return {0, tonumber(oldest[2]) + window - now}
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, window)
+return {1, 0}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    retry_after_seconds: int = 0
+
+
+class SlidingWindowRateLimiter:
+    """
+    Redis sorted set 기반 슬라이딩 윈도우 요청 제한기
+
+    Redis에 접근할 수 없으면 요청을 막지 않고 허용한다 (fail-open).
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "ratelimit"):
+        self.redis = redis
+        self.prefix = prefix
+        self._script = redis.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    async def hit(
+        self, scope: str, identifier: str, limit: int, window_seconds: int
+    ) -> RateLimitResult:
+        """
+        scope/identifier 조합에 요청 1회를 기록하고 허용 여부 반환
+
+        Args:
+            scope: 제한 종류 (예: "login_ip", "login_email")
+            identifier: 제한 대상 (IP, 이메일 등)
+            limit: 윈도우당 허용 요청 수
+            window_seconds: 윈도우 길이(초)
+        """
+        key = f"{self.prefix}:{scope}:{identifier}"
+        now_ms = int(time.time() * 1000)
+        window_ms = window_seconds * 1000
+        try:
+            allowed, retry_after_ms = await self._script(
+                keys=[key], args=[now_ms, window_ms, limit, uuid.uuid4().hex]
+            )
+        except Exception as e:
+            logger.warning(f"요청 제한 확인 실패 (허용 처리) - {scope}: {str(e)}")
+            return RateLimitResult(allowed=True)
+
+        if allowed:
+            return RateLimitResult(allowed=True)
+        RATE_LIMIT_REJECTED.labels(scope).inc()
+        return RateLimitResult(
+            allowed=False, retry_after_seconds=max(1, -(-int(retry_after_ms) // 1000))
+        )
@@ -0,0 +1,51 @@
+import re
+import uuid
+from app.utils.logger import request_id_var, user_id_var
+
+REQUEST_ID_HEADER = "x-request-id"
+
+# 클라이언트가 보낸 값은 로그 주입을 막기 위해 짧은 영숫자/-/_만 허용
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9_\-]{1,64}$")
+
+
+class RequestContextMiddleware:
+    """
+    요청마다 request_id를 정해 로그 컨텍스트에 넣고 응답 헤더(X-Request-ID)로 돌려준다.
+
+    BaseHTTPMiddleware는 별도 태스크에서 다음 앱을 실행해 contextvar가 끊길 수 있어
+    순수 ASGI 미들웨어로 구현한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER.encode():
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex
+
+        request_token = request_id_var.set(request_id)
+        user_token = user_id_var.set(None)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER.encode(), request_id.encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(request_token)
+            user_id_var.reset(user_token)
@@ -0,0 +1,60 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """미리 직렬화된 JSON 응답 본문과 ETag"""
+
+    body: bytes
+    etag: str
+
+
+def build_cached_response(model: BaseModel, version: str = "") -> CachedResponse:
+    """
+    Pydantic 모델을 JSON 바이트로 한 번만 직렬화하고 강한 ETag 생성
+
+    Args:
+        model: 응답 모델
+        version: ETag에 함께 반영할 캐시 버전 (버전이 바뀌면 ETag도 바뀜)
+
+    Returns:
+        CachedResponse 인스턴스
+    """
+    body = model.model_dump_json().encode("utf-8")
+    digest = hashlib.sha256(version.encode("utf-8") + b":" + body).hexdigest()
+    return CachedResponse(body=body, etag=f'"{digest[:32]}"')
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # W/ 접두사가 붙은 약한 비교도 허용 (If-None-Match는 약한 비교 사용)
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def cached_json_response(
+    request: Request, cached: CachedResponse, max_age: int
+) -> Response:
+    """
+    캐시된 응답 반환
+
+    GET/HEAD 요청의 If-None-Match가 ETag와 일치하면 본문 없이 304를 반환한다.
+    """
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if request.method in ("GET", "HEAD") and _etag_matches(
+        request.headers.get("if-none-match"), cached.etag
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=cached.body, media_type="application/json", headers=headers
+    )
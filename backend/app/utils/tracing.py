@@ -0,0 +1,120 @@
+import os
+from fastapi import FastAPI
+from app.config import get_settings
+from app.utils.logger import get_logger
+
+settings = get_settings()
+logger = get_logger("tracing")
+
+_initialized = False
+
+
+def instrument_fastapi_app(app: FastAPI):
+    """
+    FastAPI 앱에 OpenTelemetry 미들웨어 추가
+
+    미들웨어는 앱 시작 전에만 추가할 수 있으므로 app 생성 직후 호출한다.
+    실제 TracerProvider는 워커 프로세스마다 setup_tracing에서 설정된다.
+    """
+    if not settings.OTEL_ENABLED:
+        return
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    FastAPIInstrumentor.instrument_app(app, excluded_urls="metrics")
+
+
+def instrument_pymongo():
+    """
+    pymongo(Motor 포함) 명령 계측
+
+    MongoClient는 생성 시점에 등록된 전역 listener만 복사하므로 app.mongo에서 클라이언트를
+    만들기 전에 호출한다. TracerProvider가 설정되기 전에는 ProxyTracer를 쓰다가
+    setup_tracing 이후(fork된 워커 포함) 실제 provider로 span을 보낸다.
+    """
+    if not settings.OTEL_ENABLED:
+        return
+    from opentelemetry.instrumentation.pymongo import PymongoInstrumentor
+
+    instrumentor = PymongoInstrumentor()
+    if not instrumentor.is_instrumented_by_opentelemetry:
+        instrumentor.instrument()
+
+
+def _build_exporter():
+    exporter = settings.OTEL_EXPORTER.lower()
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT)
+
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if exporter == "file":
+        # 오프라인 분석용: span 하나당 JSON 한 줄
+        directory = os.path.dirname(settings.OTEL_FILE_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return ConsoleSpanExporter(
+            out=open(settings.OTEL_FILE_PATH, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+    if exporter == "console":
+        return ConsoleSpanExporter()
+    raise ValueError(f"지원하지 않는 OTEL_EXPORTER: {settings.OTEL_EXPORTER}")
+
+
+def setup_tracing(service_name: str):
+    """
+    OpenTelemetry TracerProvider 설정 및 라이브러리 자동 계측
+
+    - httpx, requests(Replicate, YOLO+CLIP, Qdrant 호출) 자동 계측
+    - pymongo(Motor 포함)는 클라이언트 생성 전에 instrument_pymongo로 계측한다
+    - Celery: 태스크 발행 시 trace context를 태스크 헤더에 실어 보내고
+      워커에서 이어받는다 (FastAPI, 워커 양쪽 모두 계측 필요)
+
+    워커 프로세스마다 한 번 호출한다 (fork 이후).
+
+    Args:
+        service_name: 서비스 이름 (service.name 리소스 속성)
+    """
+    global _initialized
+    if not settings.OTEL_ENABLED or _initialized:
+        return
+
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.requests import RequestsInstrumentor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.OTEL_SAMPLE_RATIO)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(_build_exporter()))
+    trace.set_tracer_provider(provider)
+
+    HTTPXClientInstrumentor().instrument()
+    RequestsInstrumentor().instrument()
+    CeleryInstrumentor().instrument()
+
+    _initialized = True
+    logger.info(
+        f"🔭 OpenTelemetry tracing 활성화 ({service_name}, exporter={settings.OTEL_EXPORTER})"
+    )
+
+
+def shutdown_tracing():
+    """남은 span을 내보내고 TracerProvider 종료"""
+    if not _initialized:
+        return
+    from opentelemetry import trace
+
+    provider = trace.get_tracer_provider()
+    if hasattr(provider, "shutdown"):
+        provider.shutdown()
@@ -0,0 +1,2 @@
+# pyproject.toml의 pythonpath(backend)가 적용된 뒤 로드되므로 app 패키지를 import할 수 있음
+pytest_plugins = ["app.utils.blocking_pytest_plugin"]
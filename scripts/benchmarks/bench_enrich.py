@@ -0,0 +1,250 @@
+import sys
+import random
+import asyncio
+import argparse
+from bench_mappers import measure
+from app.interior.domain.interior import DanawaProduct, Dimensions
+from app.interior.application.interior_service import (
+    merge_qdrant_hits_with_products,
+    qdrant_payload_to_danawa_product,
+)
+
+# 생성 파이프라인 상품 enrich 단계 동등성 검사 + 벤치마크
+#
+# 이전 구현(검색 단계에서 DB 조회 → _enrich_furnitures_with_db_and_qdrant에서 같은 id 재조회 +
+# 상품마다 hits 선형 탐색)을 그대로 옮긴 legacy_* 함수와 merge_qdrant_hits_with_products 결과를
+# 무작위 검색 결과(DB에 없는 상품, 중복 id, str/list image_url 포함)로 비교합니다.
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/benchmarks/bench_enrich.py --cases 500
+#   python scripts/benchmarks/bench_enrich.py --objects 8 --top 50
+
+
+class CountingRepository:
+    """get_danawa_products_by_ids 호출 횟수를 세는 인메모리 저장소"""
+
+    def __init__(self, products, latency=0.0):
+        self.products = {p.id: p for p in products}
+        self.latency = latency
+        self.calls = 0
+
+    async def get_danawa_products_by_ids(self, ids):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [self.products[i] for i in ids if i in self.products]
+
+
+# ---------- 이전 구현 (비교 기준) ----------
+
+
+async def legacy_search_stage(repo, all_hits):
+    all_product_ids = []
+    for points in all_hits:
+        for point in points:
+            pid = point.get("payload", {}).get("id")
+            if pid:
+                all_product_ids.append(pid)
+    products = await repo.get_danawa_products_by_ids(list(set(all_product_ids)))
+    products_map = {p.id: p for p in products}
+
+    furnitures = []
+    for points in all_hits:
+        danawa_products = []
+        danawa_products_image_index = []
+        for point in points:
+            payload = point.get("payload", {})
+            qdrant_image_urls = payload.get("image_url", [])
+            db_product = products_map.get(payload.get("id"))
+            db_image_url = db_product.image_url if db_product else ""
+            try:
+                img_idx = db_image_url.index(qdrant_image_urls)
+            except ValueError:
+                img_idx = 0
+            danawa_products_image_index.append(img_idx)
+            danawa_products.append(qdrant_payload_to_danawa_product(payload))
+        furnitures.append(
+            {
+                "danawa_products": danawa_products,
+                "danawa_products_image_index": danawa_products_image_index,
+                "qdrant_hits": points,
+            }
+        )
+    return furnitures
+
+
+async def legacy_enrich_stage(repo, furnitures):
+    all_product_ids = [p.id for f in furnitures for p in f["danawa_products"]]
+    products = await repo.get_danawa_products_by_ids(all_product_ids)
+    products_map = {p.id: p for p in products}
+
+    for furniture in furnitures:
+        enriched_products = []
+        for i, product in enumerate(furniture["danawa_products"]):
+            payload = None
+            qdrant_image_urls = []
+            for point in furniture["qdrant_hits"]:
+                if point.get("payload", {}).get("id") == product.id:
+                    payload = point.get("payload", {})
+                    qdrant_image_urls = payload.get("image_url", [])
+                    if isinstance(qdrant_image_urls, str):
+                        qdrant_image_urls = [qdrant_image_urls]
+                    break
+            index = furniture["danawa_products_image_index"]
+            idx = index[i] if index and len(index) > i else 0
+            image_url = (
+                qdrant_image_urls[idx]
+                if qdrant_image_urls and len(qdrant_image_urls) > idx
+                else (qdrant_image_urls[0] if qdrant_image_urls else "")
+            )
+            db = products_map.get(product.id, product)
+            payload = payload or {}
+            enriched_products.append(
+                DanawaProduct(
+                    id=db.id,
+                    label=payload.get("label", db.label),
+                    product_name=payload.get("product_name", db.product_name),
+                    product_url=payload.get("product_url", db.product_url),
+                    image_url=image_url,
+                    dimensions=Dimensions(
+                        width_cm=payload.get("width_cm", db.dimensions.width_cm),
+                        depth_cm=payload.get("depth_cm", db.dimensions.depth_cm),
+                        height_cm=payload.get("height_cm", db.dimensions.height_cm),
+                    ),
+                    created_at=payload.get("created_at", db.created_at),
+                    updated_at=payload.get("updated_at", db.updated_at),
+                )
+            )
+        furniture["danawa_products"] = enriched_products
+    return [
+        (f["danawa_products"], f["danawa_products_image_index"]) for f in furnitures
+    ]
+
+
+async def legacy_pipeline(repo, all_hits):
+    furnitures = await legacy_search_stage(repo, all_hits)
+    return await legacy_enrich_stage(repo, furnitures)
+
+
+# ---------- 현재 구현 ----------
+
+
+async def merged_pipeline(repo, all_hits):
+    all_product_ids = {
+        point.get("payload", {}).get("id")
+        for points in all_hits
+        for point in points
+        if point.get("payload", {}).get("id")
+    }
+    products = await repo.get_danawa_products_by_ids(list(all_product_ids))
+    products_map = {p.id: p for p in products}
+    return [merge_qdrant_hits_with_products(points, products_map) for points in all_hits]
+
+
+# ---------- 합성 데이터 ----------
+
+
+def build_catalog(rng, size):
+    products = []
+    for i in range(size):
+        pid = f"product-{i}"
+        products.append(
+            DanawaProduct(
+                id=pid,
+                label=rng.choice(["bed", "chair", "desk", "sofa"]),
+                product_name=f"DB 상품 {i}",
+                product_url=f"https://example.com/db/{pid}",
+                image_url=[f"https://example.com/images/{pid}-{n}.jpg" for n in range(3)],
+                dimensions=Dimensions(rng.randint(30, 200), rng.randint(30, 100), 80),
+            )
+        )
+    return products
+
+
+def build_hits(rng, catalog, objects, top):
+    """가구별 Qdrant points (DB에 없는 상품, 중복 id, 다양한 image_url 형식 포함)"""
+    all_hits = []
+    for _ in range(objects):
+        points = []
+        for _ in range(top):
+            if rng.random() < 0.1:
+                pid = f"missing-{rng.randrange(1000)}"
+                images = [f"https://example.com/images/{pid}-0.jpg"]
+            else:
+                product = rng.choice(catalog)
+                pid = product.id
+                images = product.image_url
+            payload = {
+                "id": pid,
+                "label": rng.choice(["bed", "chair", "desk", "sofa"]),
+                "product_name": f"Qdrant 상품 {pid}",
+                "product_url": f"https://example.com/qdrant/{pid}",
+                "width_cm": rng.randint(30, 200),
+                "depth_cm": rng.randint(30, 100),
+                "created_at": "2025-01-01T00:00:00",
+            }
+            kind = rng.random()
+            if pid.startswith("missing-"):
+                # 이전 구현은 DB에 없는 상품의 image_url이 str이 아니면 TypeError로 실패하므로 제외
+                kind = 0.7
+            if kind < 0.6:
+                payload["image_url"] = list(images)
+            elif kind < 0.9:
+                payload["image_url"] = rng.choice(images)  # 대표 이미지 하나
+            if rng.random() < 0.2:
+                payload.pop("product_name")
+            points.append({"id": rng.randrange(10**6), "score": rng.random(), "payload": payload})
+        if points and rng.random() < 0.3:
+            points.append(dict(rng.choice(points)))  # 같은 상품 중복 hit
+        all_hits.append(points)
+    return all_hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상품 enrich 단계 동등성 검사 + 벤치마크")
+    parser.add_argument("--cases", type=int, default=300, help="무작위 동등성 검사 횟수")
+    parser.add_argument("--objects", type=int, default=4, help="생성 1회당 탐지 객체 수")
+    parser.add_argument("--top", type=int, default=5, help="객체당 Qdrant hit 수")
+    parser.add_argument("--catalog", type=int, default=200, help="DB 상품 수")
+    parser.add_argument("--mongo-latency-ms", type=float, default=0.0, help="DB 조회 1회 지연")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalog = build_catalog(rng, args.catalog)
+    loop = asyncio.new_event_loop()
+
+    mismatches = 0
+    for case in range(args.cases):
+        all_hits = build_hits(rng, catalog, rng.randint(1, args.objects), rng.randint(0, args.top))
+        legacy = loop.run_until_complete(legacy_pipeline(CountingRepository(catalog), all_hits))
+        merged = loop.run_until_complete(merged_pipeline(CountingRepository(catalog), all_hits))
+        if legacy != merged:
+            mismatches += 1
+            print(f"[ERROR] case {case}: 결과가 다릅니다.")
+    print(f"[INFO] 동등성 검사 {args.cases}건, 불일치 {mismatches}건")
+
+    all_hits = build_hits(rng, catalog, args.objects, args.top)
+    latency = args.mongo_latency_ms / 1000
+    results = {}
+    for name, pipeline in [("legacy", legacy_pipeline), ("merged", merged_pipeline)]:
+        repo = CountingRepository(catalog, latency)
+        loop.run_until_complete(pipeline(repo, all_hits))
+        median, _, _ = measure(
+            lambda: loop.run_until_complete(pipeline(repo, all_hits)), 0.5, 5
+        )
+        repo.calls = 0
+        loop.run_until_complete(pipeline(repo, all_hits))
+        results[name] = (median, repo.calls)
+        print(
+            f"{name:<8}{median * 1e6:>12.1f} µs/생성{repo.calls:>6}회 DB 조회"
+            f" ({args.objects}개 객체 × {args.top} hits)"
+        )
+    loop.close()
+    print(f"[INFO] 속도 향상: {results['legacy'][0] / results['merged'][0]:.1f}x")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
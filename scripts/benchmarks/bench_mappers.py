@@ -0,0 +1,347 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+import subprocess
+from dataclasses import replace
+from datetime import datetime, timezone
+
+# 응답 매퍼(mappers.py)와 InteriorRepositoryImpl 변환 함수 마이크로 벤치마크
+#
+# 합성 라이브러리(인테리어 10/100/1000개 × 가구 N개 × 상품 5개)로 각 함수를 반복 실행해
+# 항목당 시간을 측정합니다. 결과는 커밋별로 results/<commit>.json에 남고,
+# --compare로 기준(baseline.json)보다 threshold 이상 느려진 경우 실패(exit 1)합니다.
+# 측정값은 머신마다 다르므로 results/와 baseline.json은 커밋하지 않고(.gitignore)
+# 각자 로컬에서 --save-baseline으로 기준을 만든 뒤 비교합니다.
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/benchmarks/bench_mappers.py                    # 측정 + results/에 저장
+#   python scripts/benchmarks/bench_mappers.py --save-baseline    # 현재 결과를 기준으로 저장
+#   python scripts/benchmarks/bench_mappers.py --compare          # 기준 대비 회귀 검사
+#   python scripts/benchmarks/bench_mappers.py --history          # 커밋별 결과 비교표
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(BENCH_DIR, "..", "..", "backend")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+# Settings에 필요한 환경변수 (변환 함수만 쓰므로 실제 접속은 하지 않음)
+for key in [
+    "MONGO_URI",
+    "MONGO_ROOT_USERNAME",
+    "MONGO_ROOT_PASSWORD",
+    "MONGO_HOST",
+    "MONGO_ADMIN_USERNAME",
+    "MONGO_ADMIN_PASSWORD",
+    "MONGO_EXPRESS_USER",
+    "MONGO_EXPRESS_PASS",
+    "RABBITMQ_USER",
+    "RABBITMQ_PASS",
+    "RABBITMQ_HOST",
+    "RABBITMQ_QUEUE",
+    "REDIS_HOST",
+    "QDRANT_HOST",
+    "QDRANT_SEARCH_URL",
+    "REPLICATE_API_KEY",
+    "GCS_BUCKET",
+    "GOOGLE_APPLICATION_CREDENTIALS",
+    "CELERY_BROKER_URL",
+    "CELERY_RESULT_BACKEND",
+]:
+    os.environ.setdefault(key, "bench")
+for key in ["MONGO_PORT", "REDIS_PORT", "QDRANT_PORT"]:
+    os.environ.setdefault(key, "0")
+os.environ["MONGO_URI"] = os.environ["MONGO_URI"].replace("bench", "mongodb://localhost")
+sys.path.insert(0, os.path.abspath(BACKEND_DIR))
+
+from app.interior.domain.interior import (  # noqa: E402
+    BoundingBox,
+    DanawaProduct,
+    Dimensions,
+    FurnitureDetected,
+    Interior,
+)
+from app.interior.infra.repository.interior_repository_impl import (  # noqa: E402
+    InteriorRepositoryImpl,
+)
+from app.interior.schemas.interior_schema import UserLibraryResponse  # noqa: E402
+from app.interior.schemas.mappers import (  # noqa: E402
+    domain_to_interior_generate_response,
+    domain_to_user_library_interior,
+)
+
+LIBRARY_SIZES = [10, 100, 1000]
+PRODUCTS_PER_PART = 5
+LABELS = ["bed", "chair", "desk", "sofa", "table", "lamp", "shelf", "cabinet"]
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def build_library(n_interiors, parts_per_interior, seed=42):
+    """(interiors, furniture_map, products_map) 합성 라이브러리"""
+    rng = random.Random(seed)
+    interiors, furniture_map, products_map = [], {}, {}
+    for i in range(n_interiors):
+        part_ids = []
+        for k in range(parts_per_interior):
+            label = rng.choice(LABELS)
+            product_ids = []
+            for p in range(PRODUCTS_PER_PART):
+                pid = f"product-{i}-{k}-{p}"
+                product_ids.append(pid)
+                products_map[pid] = DanawaProduct(
+                    id=pid,
+                    label=label,
+                    product_name=f"{label} 상품 {pid}",
+                    product_url=f"https://example.com/products/{pid}",
+                    image_url=[f"https://example.com/images/{pid}-{n}.jpg" for n in range(3)],
+                    dimensions=Dimensions(
+                        width_cm=rng.randint(30, 220),
+                        depth_cm=rng.randint(30, 120),
+                        height_cm=rng.choice([None, rng.randint(30, 200)]),
+                    ),
+                    created_at=NOW,
+                    updated_at=NOW,
+                )
+            part_id = f"part-{i}-{k}"
+            part_ids.append(part_id)
+            furniture_map[part_id] = FurnitureDetected(
+                id=part_id,
+                interior_id=f"interior-{i}",
+                label=label,
+                bounding_box=BoundingBox(
+                    x=rng.randint(0, 300),
+                    y=rng.randint(0, 300),
+                    width=rng.randint(50, 200),
+                    height=rng.randint(50, 200),
+                ),
+                danawa_products_id=product_ids,
+                danawa_products_image_index=[rng.randrange(3) for _ in product_ids],
+                created_at=NOW,
+            )
+        interiors.append(
+            Interior(
+                id=f"interior-{i}",
+                user_id="bench-user",
+                original_image_url=f"https://example.com/rooms/{i}.jpg",
+                interior_type_id="modern",
+                room_type_id="livingroom",
+                status="done",
+                saved=True,
+                generated_image_url=f"https://example.com/generated/{i}.jpg",
+                detected_parts=part_ids,
+                created_at=NOW,
+                updated_at=NOW,
+            )
+        )
+    return interiors, furniture_map, products_map
+
+
+def generate_inputs(interiors, furniture_map, products_map):
+    """생성 응답용 (interior, 상품이 채워진 가구 목록) 목록"""
+    inputs = []
+    for interior in interiors:
+        furnitures = []
+        for part_id in interior.detected_parts:
+            furniture = furniture_map[part_id]
+            products = []
+            for pid in furniture.danawa_products_id:
+                product = products_map[pid]
+                # 생성 직후 상품 image_url은 대표 이미지 하나(str)
+                products.append(replace(product, image_url=product.image_url[0]))
+            furnitures.append(replace(furniture, danawa_products=products))
+        inputs.append((interior, furnitures))
+    return inputs
+
+
+def build_cases(n_interiors, parts_per_interior):
+    """{이름: (실행 함수, 처리 항목 수)}"""
+    repo = InteriorRepositoryImpl()
+    interiors, furniture_map, products_map = build_library(n_interiors, parts_per_interior)
+    furnitures = list(furniture_map.values())
+    products = list(products_map.values())
+    interior_docs = [repo._interior_to_dict(i) for i in interiors]
+    furniture_docs = [repo._furniture_detected_to_dict(f) for f in furnitures]
+    product_docs = [repo._danawa_product_to_dict(p) for p in products]
+    generate_args = generate_inputs(interiors, furniture_map, products_map)
+
+    def user_library():
+        return [
+            domain_to_user_library_interior(i, furniture_map, products_map)
+            for i in interiors
+        ]
+
+    def user_library_json():
+        return UserLibraryResponse(status="success", interiors=user_library()).model_dump_json()
+
+    return {
+        "domain_to_user_library_interior": (user_library, len(interiors)),
+        "user_library_response_json": (user_library_json, len(interiors)),
+        "domain_to_interior_generate_response": (
+            lambda: [domain_to_interior_generate_response(i, f) for i, f in generate_args],
+            len(interiors),
+        ),
+        "_interior_to_dict": (
+            lambda: [repo._interior_to_dict(i) for i in interiors],
+            len(interiors),
+        ),
+        "_dict_to_interior": (
+            lambda: [repo._dict_to_interior(d) for d in interior_docs],
+            len(interior_docs),
+        ),
+        "_furniture_detected_to_dict": (
+            lambda: [repo._furniture_detected_to_dict(f) for f in furnitures],
+            len(furnitures),
+        ),
+        "_dict_to_furniture_detected": (
+            lambda: [repo._dict_to_furniture_detected(d) for d in furniture_docs],
+            len(furniture_docs),
+        ),
+        "_danawa_product_to_dict": (
+            lambda: [repo._danawa_product_to_dict(p) for p in products],
+            len(products),
+        ),
+        "_dict_to_danawa_product": (
+            lambda: [repo._dict_to_danawa_product(d) for d in product_docs],
+            len(product_docs),
+        ),
+    }
+
+
+def measure(func, min_time, min_rounds):
+    """min_time 이상, min_rounds회 이상 반복해 (중앙값 초, 최솟값 초, 반복 횟수) 반환"""
+    timings = []
+    started_at = time.perf_counter()
+    while len(timings) < min_rounds or time.perf_counter() - started_at < min_time:
+        t0 = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t0)
+    return statistics.median(timings), min(timings), len(timings)
+
+
+def git_commit():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR, stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return "unknown"
+
+
+def run(sizes, parts, min_time, min_rounds, only):
+    results = {}
+    for n in sizes:
+        cases = build_cases(n, parts)
+        for name, (func, items) in cases.items():
+            if only and only not in name:
+                continue
+            median, best, rounds = measure(func, min_time, min_rounds)
+            key = f"{name}[{n}x{parts}]"
+            results[key] = {
+                "median_ms": round(median * 1000, 4),
+                "min_ms": round(best * 1000, 4),
+                "per_item_us": round(median / items * 1e6, 3),
+                "rounds": rounds,
+            }
+            print(
+                f"{key:<52}{results[key]['median_ms']:>12.3f} ms"
+                f"{results[key]['per_item_us']:>12.2f} µs/item"
+            )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """기준보다 threshold 비율 이상 느려진 케이스 목록"""
+    regressions = []
+    for key, value in results.items():
+        base = baseline.get("results", {}).get(key)
+        if not base:
+            continue
+        ratio = value["median_ms"] / base["median_ms"] if base["median_ms"] else 1.0
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{key:<52}{base['median_ms']:>10.3f} → {value['median_ms']:>10.3f} ms ({ratio:.2f}x) {marker}")
+        if marker:
+            regressions.append(key)
+    return regressions
+
+
+def print_history():
+    files = sorted(
+        (os.path.join(RESULTS_DIR, f) for f in os.listdir(RESULTS_DIR) if f.endswith(".json")),
+        key=os.path.getmtime,
+    )
+    runs = []
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            runs.append(json.load(f))
+    if not runs:
+        print("[INFO] 저장된 결과가 없습니다.")
+        return
+    keys = sorted({key for run in runs for key in run["results"]})
+    print(f"{'case (median ms)':<52}" + "".join(f"{run['commit']:>12}" for run in runs))
+    for key in keys:
+        row = "".join(
+            f"{run['results'][key]['median_ms']:>12.3f}" if key in run["results"] else f"{'-':>12}"
+            for run in runs
+        )
+        print(f"{key:<52}{row}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="매퍼/리포지토리 변환 함수 마이크로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=LIBRARY_SIZES)
+    parser.add_argument("--parts", type=int, default=4, help="인테리어당 가구 수")
+    parser.add_argument("--min-time", type=float, default=0.5, help="케이스당 최소 측정 시간(초)")
+    parser.add_argument("--min-rounds", type=int, default=5)
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true", help="baseline.json 대비 회귀 검사")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용 회귀 비율 (0.2 = 20%%)")
+    parser.add_argument("--history", action="store_true", help="results/의 커밋별 결과 출력")
+    args = parser.parse_args()
+
+    if args.history:
+        print_history()
+        return
+
+    results = run(args.sizes, args.parts, args.min_time, args.min_rounds, args.only)
+    report = {
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    result_path = os.path.join(RESULTS_DIR, f"{report['commit']}.json")
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[INFO] 결과 저장: {result_path}")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"[INFO] 기준 저장: {BASELINE_PATH}")
+
+    if args.compare:
+        if not os.path.exists(BASELINE_PATH):
+            print("[ERROR] baseline.json이 없습니다. --save-baseline으로 먼저 저장하세요.")
+            sys.exit(1)
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\n[INFO] 기준({baseline['commit']}) 대비 비교 (threshold={args.threshold:.0%})")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"[ERROR] 성능 회귀 {len(regressions)}건")
+            sys.exit(1)
+        print("[INFO] 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import gc
+import argparse
+import tracemalloc
+from dataclasses import MISSING, fields, make_dataclass
+from dataclasses import field as dc_field
+from bench_mappers import build_library
+from app.interior.domain.interior import (
+    BoundingBox,
+    DanawaProduct,
+    Dimensions,
+    FurnitureDetected,
+    Interior,
+)
+
+# 도메인 객체 메모리 벤치마크
+#
+# 현재 도메인 클래스(slots=True)와 같은 필드의 일반 @dataclass 사본으로 같은 값을 가진
+# 객체를 N개씩 만들어 tracemalloc으로 객체당 할당량을 비교합니다.
+# 필드 값(문자열, 리스트 등)은 두 경우 모두 같은 객체를 공유하므로 인스턴스 자체 크기만 측정됩니다.
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/benchmarks/bench_memory.py
+#   python scripts/benchmarks/bench_memory.py --count 100000 --library 1000 --parts 4
+
+CLASSES = [Dimensions, BoundingBox, DanawaProduct, FurnitureDetected, Interior]
+
+
+def plain_twin(cls):
+    """slots/frozen 없이 같은 필드를 가진 일반 dataclass"""
+    twin_fields = []
+    for f in fields(cls):
+        if f.default is not MISSING:
+            twin_fields.append((f.name, f.type, dc_field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            twin_fields.append((f.name, f.type, dc_field(default_factory=f.default_factory)))
+        else:
+            twin_fields.append((f.name, f.type))
+    return make_dataclass(f"Plain{cls.__name__}", twin_fields)
+
+
+def bytes_per_object(cls, kwargs, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(**kwargs) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # 리스트 자체(포인터 배열)는 두 경우 같으므로 빼고 계산
+    list_bytes = objects.__sizeof__()
+    del objects
+    return (after - before - list_bytes) / count
+
+
+def sample_kwargs(library):
+    interiors, furniture_map, products_map = library
+    furniture = next(iter(furniture_map.values()))
+    product = next(iter(products_map.values()))
+    samples = {
+        Dimensions: product.dimensions,
+        BoundingBox: furniture.bounding_box,
+        DanawaProduct: product,
+        FurnitureDetected: furniture,
+        Interior: interiors[0],
+    }
+    return {
+        cls: {f.name: getattr(obj, f.name) for f in fields(cls)}
+        for cls, obj in samples.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도메인 객체 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=50000, help="클래스별 생성 객체 수")
+    parser.add_argument("--library", type=int, default=1000, help="라이브러리 인테리어 수")
+    parser.add_argument("--parts", type=int, default=4, help="인테리어당 가구 수")
+    args = parser.parse_args()
+
+    library = build_library(args.library, args.parts)
+    interiors, furniture_map, products_map = library
+    counts = {
+        Dimensions: len(products_map),
+        BoundingBox: len(furniture_map),
+        DanawaProduct: len(products_map),
+        FurnitureDetected: len(furniture_map),
+        Interior: len(interiors),
+    }
+
+    print(f"{'class':<20}{'plain B/obj':>14}{'slots B/obj':>14}{'saved':>10}")
+    total_plain = total_slots = 0
+    for cls, kwargs in sample_kwargs(library).items():
+        plain = bytes_per_object(plain_twin(cls), kwargs, args.count)
+        slotted = bytes_per_object(cls, kwargs, args.count)
+        total_plain += plain * counts[cls]
+        total_slots += slotted * counts[cls]
+        print(f"{cls.__name__:<20}{plain:>14.1f}{slotted:>14.1f}{1 - slotted / plain:>9.0%}")
+
+    print(
+        f"\n[INFO] 라이브러리 {args.library}x{args.parts} 도메인 객체: "
+        f"{total_plain / 1024:.0f} KiB → {total_slots / 1024:.0f} KiB "
+        f"({1 - total_slots / total_plain:.0%} 감소)"
+    )
+
+
+if __name__ == "__main__":
+    main()
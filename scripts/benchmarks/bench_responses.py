@@ -0,0 +1,125 @@
+import sys
+import json
+import asyncio
+import argparse
+from bench_mappers import (
+    LIBRARY_SIZES,
+    build_library,
+    generate_inputs,
+    measure,
+)
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from app.interior.schemas.interior_schema import (
+    InteriorGenerateResponse,
+    UserLibraryResponse,
+)
+from app.interior.schemas.mappers import (
+    domain_to_interior_generate_response,
+    domain_to_user_library_interior,
+)
+from app.utils.fast_response import fast_json_response
+
+# FAST_RESPONSE_SERIALIZATION 응답 경로 벤치마크
+#
+# 같은 응답 객체를 두 경로로 직렬화해 본문이 같은지 확인하고 시간을 비교합니다.
+#   default: 핸들러가 모델/dict 반환 → response_model 재검증 + jsonable_encoder + json.dumps
+#            (FastAPI가 라우트에서 실행하는 serialize_response + JSONResponse와 동일)
+#   fast   : fast_json_response()로 pydantic-core가 바로 직렬화
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/benchmarks/bench_responses.py
+#   python scripts/benchmarks/bench_responses.py --sizes 1000 --parts 8
+
+
+def build_payloads(n_interiors, parts):
+    """{이름: (응답 객체, response_model)}"""
+    interiors, furniture_map, products_map = build_library(n_interiors, parts)
+    library = UserLibraryResponse(
+        status="success",
+        interiors=[
+            domain_to_user_library_interior(i, furniture_map, products_map)
+            for i in interiors
+        ],
+    )
+    interior, furnitures = generate_inputs(interiors, furniture_map, products_map)[0]
+    generate = domain_to_interior_generate_response(interior, furnitures)
+    # /users/mypage는 response_model 없이 dict 반환 (최대 6개)
+    mypage = {
+        "status": "success",
+        "user": {"name": "벤치마크", "email": "bench@example.com", "profile_image_url": None},
+        "interiors": [
+            {
+                "id": i.id,
+                "generated_image_url": i.generated_image_url,
+                "room_type_id": i.room_type_id,
+                "interior_type_id": i.interior_type_id,
+                "saved": i.saved,
+                "created_at": i.created_at.isoformat(),
+            }
+            for i in interiors[:6]
+        ],
+    }
+    return {
+        "user_library": (library, UserLibraryResponse),
+        "generate": (generate, InteriorGenerateResponse),
+        "mypage": (mypage, None),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 경로 비교 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=LIBRARY_SIZES)
+    parser.add_argument("--parts", type=int, default=4, help="인테리어당 가구 수")
+    parser.add_argument("--min-time", type=float, default=0.5, help="케이스당 최소 측정 시간(초)")
+    parser.add_argument("--min-rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    mismatches = []
+    print(f"{'case':<28}{'default ms':>14}{'fast ms':>12}{'speedup':>10}{'bytes':>10}")
+    for n in args.sizes:
+        for name, (content, response_model) in build_payloads(n, args.parts).items():
+            field = (
+                create_model_field(name="Response", type_=response_model, mode="serialization")
+                if response_model
+                else None
+            )
+
+            def default_path():
+                serialized = loop.run_until_complete(
+                    serialize_response(field=field, response_content=content)
+                )
+                return JSONResponse(serialized).body
+
+            def fast_path():
+                return fast_json_response(content).body
+
+            default_body, fast_body = default_path(), fast_path()
+            if default_body != fast_body:
+                # 바이트가 다르면 JSON 값이라도 같은지 확인
+                same = json.loads(default_body) == json.loads(fast_body)
+                mismatches.append((f"{name}[{n}x{args.parts}]", same))
+
+            default_median, _, _ = measure(default_path, args.min_time, args.min_rounds)
+            fast_median, _, _ = measure(fast_path, args.min_time, args.min_rounds)
+            print(
+                f"{name + f'[{n}x{args.parts}]':<28}{default_median * 1000:>14.3f}"
+                f"{fast_median * 1000:>12.3f}{default_median / fast_median:>9.1f}x"
+                f"{len(fast_body):>10}"
+            )
+    loop.close()
+
+    for key, same in mismatches:
+        if same:
+            print(f"[WARN] {key}: 바이트는 다르지만 JSON 값은 같습니다.")
+        else:
+            print(f"[ERROR] {key}: 두 경로의 응답 본문이 다릅니다.")
+    if any(not same for _, same in mismatches):
+        sys.exit(1)
+    print("[INFO] 모든 케이스에서 두 경로의 응답이 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,67 +1,275 @@
+import os
 import csv
 import json
-import os
 import uuid
+import heapq
+import hashlib
+import argparse
+from itertools import groupby
 from datetime import datetime, timezone
-from collections import defaultdict
-
-# 경로 설정
-base_input_dir = "./data/gcs_furniture_csv/"
-output_path = "./data/mongo/collections/danawa_products.json"
-
-# 임시 저장 딕셔너리: name 기준으로 병합
-product_map = defaultdict(
-    lambda: {
-        "_id": None,
-        "label": "",
-        "product_name": "",
-        "product_url": "",
-        "image_url": [],
-        "dimensions": {},
-        "created_at": "",
-        "updated_at": "",
-    }
-)
-
-# 파일 순회 (폴더 X)
-for file in os.listdir(base_input_dir):
-    if not file.endswith(".csv"):
-        continue
-
-    file_path = os.path.join(base_input_dir, file)
-
-    # 파일명 기준 label 추출
+from concurrent.futures import ProcessPoolExecutor
+
+# 다나와 label별 CSV → danawa_products 문서 변환
+#
+# - label 파일(예: desk_gcs.csv)마다 프로세스 풀에서 병렬로 읽어, 상품명으로 정렬한
+#   파일별 캐시(NDJSON)를 만든다.
+# - 캐시들을 상품명 기준으로 병합(heapq.merge)하면서 한 줄씩 출력하므로 전체 상품을
+#   메모리에 모으지 않는다. 같은 상품명이 여러 파일에 있으면 파일명 순서가 앞선 쪽의
+#   필드를 쓰고 image_url만 순서대로 합친다 (실행할 때마다 결과가 같음).
+# - 상태 파일에 CSV별 크기/mtime/sha1을 기록해 다음 실행에서는 바뀐 CSV만 다시 읽는다.
+# - 이전 출력에 있던 상품은 _id/created_at을 유지하고, 내용이 바뀐 경우에만 updated_at을
+#   갱신한다. 새 상품의 _id는 상품명으로 만든 UUIDv5이다.
+#   --previous를 주지 않으면 --output 파일, 없으면 같은 이름의 기존 JSON 배열 출력
+#   (danawa_products.json)에서 이어받는다 (Qdrant payload가 기존 _id를 참조하므로).
+#
+# 출력은 기본 NDJSON(mongoimport는 --jsonArray 없이 사용), --format json이면 기존과 같은 배열.
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/convert_danawa_csv_to_json.py
+#   python scripts/convert_danawa_csv_to_json.py --workers 8 --full
+#   python scripts/convert_danawa_csv_to_json.py --format json -o ./data/mongo/collections/danawa_products.json \
+#       --previous ./data/mongo/collections/danawa_products.json
+
+# 상품명 → _id 변환용 네임스페이스 (uuid5(NAMESPACE_URL, "danawa_products/product_name"))
+PRODUCT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "danawa_products/product_name")
+CACHE_VERSION = 1  # 캐시 형식이 바뀌면 올려서 전체 재처리
+
+
+def label_from_filename(file):
     filename = os.path.splitext(file)[0]  # 예: desk_gcs
-    label = filename.replace("_gcs", "")  # 예: desk
+    return filename.replace("_gcs", "")  # 예: desk
+
+
+def file_sha1(path, chunk_size=1 << 20):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def to_cm(value):
+    return int(float(value)) if value else None
 
+
+def convert_csv(file_path, label, cache_path):
+    """CSV 하나를 상품명 기준으로 합쳐 정렬된 NDJSON 캐시로 저장 (프로세스 풀 작업)"""
+    products = {}
     with open(file_path, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
+        for row in csv.DictReader(csvfile):
             name = row["name"]
-            if name not in product_map:
-                product_map[name]["_id"] = str(uuid.uuid4())
-                product_map[name]["label"] = label
-                product_map[name]["product_name"] = name
-                product_map[name]["product_url"] = row["product_url"]
-                product_map[name]["dimensions"] = {
-                    "width_cm": int(float(row["width"])) if row["width"] else None,
-                    "depth_cm": int(float(row["depth"])) if row["depth"] else None,
-                    "height_cm": int(float(row["height"])) if row["height"] else None,
+            product = products.get(name)
+            if product is None:
+                product = products[name] = {
+                    "product_name": name,
+                    "label": label,
+                    "product_url": row["product_url"],
+                    "dimensions": {
+                        "width_cm": to_cm(row["width"]),
+                        "depth_cm": to_cm(row["depth"]),
+                        "height_cm": to_cm(row["height"]),
+                    },
+                    "image_url": [],
                 }
-                now = datetime.now(timezone.utc).isoformat() + "Z"
-                product_map[name]["created_at"] = now
-                product_map[name]["updated_at"] = now
-
             # image_url 중복 없이 추가
             image_url = row["image_url"]
-            if image_url and image_url not in product_map[name]["image_url"]:
-                product_map[name]["image_url"].append(image_url)
+            if image_url and image_url not in product["image_url"]:
+                product["image_url"].append(image_url)
+
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for name in sorted(products):
+            f.write(json.dumps(products[name], ensure_ascii=False) + "\n")
+    os.replace(tmp_path, cache_path)
+    return len(products)
+
+
+def iter_cache(cache_path, order):
+    with open(cache_path, encoding="utf-8") as f:
+        for line in f:
+            product = json.loads(line)
+            yield product["product_name"], order, product
+
+
+def merge_products(cache_paths):
+    """파일별 정렬된 캐시를 상품명 순으로 병합하는 generator (앞선 파일 우선, image_url은 합침)"""
+    streams = [iter_cache(path, order) for order, path in enumerate(cache_paths)]
+    merged = heapq.merge(*streams, key=lambda entry: (entry[0], entry[1]))
+    for _, group in groupby(merged, key=lambda entry: entry[0]):
+        _, _, product = next(group)
+        for _, _, other in group:
+            for image_url in other["image_url"]:
+                if image_url not in product["image_url"]:
+                    product["image_url"].append(image_url)
+        yield product
+
+
+def content_digest(product):
+    return hashlib.sha1(
+        json.dumps(product, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def load_previous(path):
+    """이전 출력(NDJSON 또는 JSON 배열)의 상품명 → (_id, created_at, updated_at, 내용 digest)"""
+    previous = {}
+    if not path or not os.path.exists(path):
+        return previous
+    with open(path, encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        docs = json.load(f) if first == "[" else (json.loads(line) for line in f if line.strip())
+        for doc in docs:
+            content = {k: v for k, v in doc.items() if k not in ("_id", "created_at", "updated_at")}
+            previous[doc["product_name"]] = (
+                doc["_id"],
+                doc.get("created_at"),
+                doc.get("updated_at"),
+                content_digest(content),
+            )
+    print(f"[INFO] 이전 출력에서 상품 {len(previous)}개의 _id/created_at 유지: {path}")
+    return previous
+
+
+def default_previous(output_path):
+    """--previous를 주지 않았을 때 _id를 이어받을 이전 출력 (없으면 None)"""
+    legacy_path = os.path.splitext(output_path)[0] + ".json"
+    for path in (output_path, legacy_path):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def iter_documents(products, previous):
+    now = datetime.now(timezone.utc).isoformat() + "Z"
+    stats = {"added": 0, "changed": 0, "unchanged": 0}
+    for product in products:
+        prev = previous.get(product["product_name"])
+        if prev is None:
+            stats["added"] += 1
+            product_id = str(uuid.uuid5(PRODUCT_ID_NAMESPACE, product["product_name"]))
+            created_at = updated_at = now
+        else:
+            product_id, created_at, updated_at, digest = prev
+            if digest == content_digest(product):
+                stats["unchanged"] += 1
+            else:
+                stats["changed"] += 1
+                updated_at = now
+        yield {"_id": product_id, **product, "created_at": created_at, "updated_at": updated_at}
+    print(
+        f"[INFO] 추가 {stats['added']}개, 변경 {stats['changed']}개, "
+        f"변경 없음 {stats['unchanged']}개"
+    )
+
+
+def write_documents(documents, output_path, output_format):
+    tmp_path = output_path + ".tmp"
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        if output_format == "json":
+            f.write("[\n")
+        for doc in documents:
+            line = json.dumps(doc, ensure_ascii=False)
+            if output_format == "json":
+                f.write((",\n" if count else "") + line)
+            else:
+                f.write(line + "\n")
+            count += 1
+        if output_format == "json":
+            f.write("\n]\n")
+    os.replace(tmp_path, output_path)
+    return count
+
+
+def load_state(path):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") == CACHE_VERSION:
+            return state
+    return {"version": CACHE_VERSION, "files": {}}
+
+
+def save_state(path, state):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다나와 CSV → danawa_products NDJSON/JSON 변환")
+    parser.add_argument("--input-dir", default="./data/gcs_furniture_csv/")
+    parser.add_argument(
+        "-o", "--output", default="./data/mongo/collections/danawa_products.ndjson"
+    )
+    parser.add_argument("--format", choices=["ndjson", "json"], default="ndjson")
+    parser.add_argument(
+        "--previous",
+        help="_id/created_at을 이어받을 이전 출력 (기본: --output 파일, 없으면 같은 이름의 .json)",
+    )
+    parser.add_argument("--cache-dir", default="./data/mongo/.danawa_csv_cache")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--full", action="store_true", help="상태 파일을 무시하고 모든 CSV 재처리")
+    args = parser.parse_args()
+
+    if args.previous and not os.path.exists(args.previous):
+        print(f"[ERROR] --previous 파일이 없습니다: {args.previous}")
+        exit(1)
+    previous_path = args.previous or default_previous(args.output)
+    if previous_path is None:
+        print("[WARN] 이전 출력이 없어 모든 상품에 새 _id를 만듭니다. 기존 출력이 있으면 --previous로 지정하세요.")
+
+    os.makedirs(args.cache_dir, exist_ok=True)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    state_path = os.path.join(args.cache_dir, "state.json")
+    state = {"version": CACHE_VERSION, "files": {}} if args.full else load_state(state_path)
+
+    # 파일 순회 (폴더 X), 병합 우선순위가 실행마다 같도록 파일명 순으로 정렬
+    files = sorted(f for f in os.listdir(args.input_dir) if f.endswith(".csv"))
+    cache_paths, pending, new_files = [], [], {}
+    for file in files:
+        file_path = os.path.join(args.input_dir, file)
+        cache_path = os.path.join(args.cache_dir, file + ".ndjson")
+        cache_paths.append(cache_path)
+        stat = os.stat(file_path)
+        entry = state["files"].get(file)
+        cached = entry is not None and os.path.exists(cache_path)
+        if cached and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            new_files[file] = entry
+            continue
+        sha1 = file_sha1(file_path)
+        new_files[file] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha1": sha1}
+        if cached and entry["sha1"] == sha1:
+            continue  # 내용은 같고 mtime만 바뀜
+        pending.append((file, file_path, cache_path))
+    for file in set(state["files"]) - set(new_files):
+        # 삭제된 CSV의 캐시는 병합에서 빠지도록 정리
+        stale = os.path.join(args.cache_dir, file + ".ndjson")
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    print(f"[INFO] CSV {len(files)}개 중 {len(pending)}개 변환 (workers={args.workers})")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            file: executor.submit(convert_csv, file_path, label_from_filename(file), cache_path)
+            for file, file_path, cache_path in pending
+        }
+        for file, future in futures.items():
+            print(f"[INFO] {file}: 상품 {future.result()}개")
 
+    previous = load_previous(previous_path)
+    documents = iter_documents(merge_products(cache_paths), previous)
+    count = write_documents(documents, args.output, args.format)
 
-# JSON 파일로 저장
-os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # 출력까지 끝난 뒤에 상태를 저장해야 중간에 실패해도 다음 실행에서 다시 처리됨
+    state["files"] = new_files
+    save_state(state_path, state)
+    print(f"✅ {args.format.upper()} saved to {args.output} ({count} items)")
 
-with open(output_path, "w", encoding="utf-8") as jsonfile:
-    json.dump(list(product_map.values()), jsonfile, ensure_ascii=False, indent=2)
 
-print(f"✅ JSON saved to {output_path} ({len(product_map)} items)")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne
+from pymongo.errors import ConnectionFailure, PyMongoError
+from qdrant_client import AsyncQdrantClient, models
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "qdrant-init"))
+from embedding_store import (  # noqa: E402
+    image_key,
+    is_vector_store,
+    iter_raw_points,
+    legacy_point_id,
+    open_vector_store,
+    point_id,
+    point_payload,
+)
+
+# 다나와 상품을 MongoDB(danawa_products)와 Qdrant에 한 번에 적재하는 스크립트
+#
+# - convert_danawa_csv_to_json.py 출력(NDJSON 또는 JSON 배열)을 배치 단위로 읽어
+#   Mongo에는 _id 기준 unordered bulk_write(ReplaceOne upsert),
+#   Qdrant에는 같은 상품의 이미지 임베딩마다 point_id(_id, image_url) 포인트로 upsert한다.
+#   Qdrant payload는 Mongo 문서와 해당 이미지의 image_url로 만들기 때문에 두 저장소의 id/내용이 항상 같다.
+# - 배치 여러 개를 동시에(--concurrency) 처리하고, 일시적 오류는 백오프로 재시도한다.
+#   모두 upsert이므로 여러 번 실행해도 결과가 같다.
+# - 마지막에 두 저장소의 id를 비교한 일관성 리포트를 출력한다 (--report로 JSON 저장).
+#
+# 임베딩 파일은 upload_qdrant.py와 같은 형식(.npy + .parquet 권장, .json/.ndjson은 메모리에 모두 올림).
+# Qdrant 컬렉션(벡터 크기, HNSW, label 인덱스)은 qdrant-seed(upload_qdrant.py)로 먼저 만들어 두어야 합니다.
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/load_danawa_catalog.py data/mongo/collections/danawa_products.ndjson \
+#       --embeddings data/qdrant/collections/furniture_embeddings.npy --report load_report.json
+
+SAMPLE_LIMIT = 20  # 리포트에 출력할 id 개수
+
+
+class EmbeddingIndex:
+    """
+    상품 id → 이미지별 벡터 조회 (.npy는 memory map에서 필요한 행만 읽음)
+
+    임베딩은 상품 이미지마다 하나이므로 상품 id별로 (image_key, image_url, 순번, 벡터 또는 행)
+    목록을 보관한다. image_key/순번은 upload_qdrant.py와 같은 규칙이라 포인트 id가 같다.
+    """
+
+    def __init__(self, path):
+        self.vectors = None
+        self.rows = {}
+        if is_vector_store(path):
+            self.vectors, payloads = open_vector_store(path)
+            row = 0
+            for batch in payloads.iter_batches(columns=["id", "payload"]):
+                ids = batch.column("id").to_pylist()
+                payload_texts = batch.column("payload").to_pylist()
+                for product_id, payload_text in zip(ids, payload_texts):
+                    self._add(product_id, json.loads(payload_text or "{}"), row)
+                    row += 1
+        else:
+            print(f"[WARN] {path}는 JSON 형식이라 모든 벡터를 메모리에 올립니다.")
+            for item in iter_raw_points(path):
+                if item.get("id") is not None and item.get("vector"):
+                    self._add(item["id"], item.get("payload") or {}, item["vector"])
+        self.used = set()
+        count = sum(len(images) for images in self.rows.values())
+        print(f"[INFO] 임베딩 {count}개 (상품 {len(self.rows)}개) 로드: {path}")
+
+    def _add(self, product_id, payload, vector_or_row):
+        images = self.rows.setdefault(str(product_id), [])
+        position = len(images)
+        key = image_key(payload, position)
+        if any(image[0] == key for image in images):
+            return  # 같은 이미지가 여러 번 나오면 첫 항목만 사용 (upload_qdrant.py와 같음)
+        image_url = payload.get("image_url") if key == payload.get("image_url") else None
+        images.append((key, image_url, position, vector_or_row))
+
+    def get(self, product_id):
+        """[(image_key, image_url 또는 None, 상품 내 순번, 벡터), ...], 임베딩이 없으면 None"""
+        images = self.rows.get(product_id)
+        if not images:
+            return None
+        self.used.add(product_id)
+        if self.vectors is None:
+            return images
+        return [
+            (key, image_url, position, self.vectors[row].tolist())
+            for key, image_url, position, row in images
+        ]
+
+    def unused_ids(self):
+        return sorted(set(self.rows) - self.used)
+
+
+def qdrant_payload(doc, image_url):
+    """
+    Mongo 문서 + 이미지 하나 → Qdrant payload 원본 값 (point_payload로 정리해 적재)
+
+    image_url은 포인트에 해당하는 이미지 URL 하나이다 (검색 결과에서 Mongo image_url 목록의
+    몇 번째 이미지인지 찾는 데 사용).
+    """
+    dimensions = doc.get("dimensions") or {}
+    return {
+        "id": doc["_id"],
+        "label": doc.get("label"),
+        "product_name": doc.get("product_name"),
+        "product_url": doc.get("product_url"),
+        "image_url": image_url,
+        "width_cm": dimensions.get("width_cm"),
+        "depth_cm": dimensions.get("depth_cm"),
+        "height_cm": dimensions.get("height_cm"),
+        "created_at": doc.get("created_at"),
+        "updated_at": doc.get("updated_at"),
+    }
+
+
+def iter_batches(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def is_transient(error):
+    """재시도하면 성공할 수 있는 오류 (연결 문제, 5xx/429, Mongo 재시도 가능 쓰기 오류)"""
+    if isinstance(error, (ConnectionFailure, ResponseHandlingException)):
+        return True
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code >= 500 or error.status_code == 429
+    if isinstance(error, PyMongoError):
+        return error.has_error_label("RetryableWriteError")
+    return False
+
+
+async def with_retries(name, make_call, retries):
+    """일시적 오류는 지수 백오프로 재시도, 그 외 오류는 바로 실패"""
+    for attempt in range(retries + 1):
+        try:
+            return await make_call()
+        except Exception as e:
+            if attempt == retries or not is_transient(e):
+                raise
+            delay = min(30, 2**attempt) * random.uniform(0.5, 1.0)
+            print(f"[WARN] {name} 재시도 {attempt + 1}/{retries} ({delay:.1f}초 후): {e}")
+            await asyncio.sleep(delay)
+
+
+class CatalogLoader:
+    def __init__(self, products, qdrant, collection, embeddings, retries):
+        self.products = products
+        self.qdrant = qdrant
+        self.collection = collection
+        self.embeddings = embeddings
+        self.retries = retries
+        self.stats = {
+            "source": 0,
+            "mongo_upserted": 0,
+            "mongo_modified": 0,
+            "mongo_unchanged": 0,
+            "qdrant_upserted": 0,
+        }
+        self.missing_embedding = []
+        self.failed_batches = 0
+
+    async def load_batch(self, docs):
+        """배치 하나 적재, 어떤 오류든 실패한 배치로 기록 (재시도는 with_retries에서 처리)"""
+        try:
+            await self._load_batch(docs)
+        except Exception as e:
+            self.failed_batches += 1
+            print(f"[ERROR] 배치 적재 실패 ({len(docs)}개): {e!r}")
+
+    async def _load_batch(self, docs):
+        points = []
+        for doc in docs:
+            images = self.embeddings.get(doc["_id"]) if self.embeddings else None
+            if images is None:
+                self.missing_embedding.append(doc["_id"])
+                continue
+            doc_images = doc.get("image_url") or []
+            if isinstance(doc_images, str):
+                doc_images = [doc_images]
+            for key, image_url, position, vector in images:
+                if image_url is None and position < len(doc_images):
+                    # 임베딩에 image_url이 없으면 상품 이미지 목록의 같은 순번 이미지로 간주
+                    image_url = doc_images[position]
+                payload = point_payload(doc["_id"], qdrant_payload(doc, image_url), vector)
+                points.append(
+                    models.PointStruct(
+                        id=point_id(doc["_id"], key), vector=vector, payload=payload
+                    )
+                )
+
+        calls = [
+            with_retries(
+                "Mongo bulk_write",
+                lambda: self.products.bulk_write(
+                    [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs],
+                    ordered=False,
+                ),
+                self.retries,
+            )
+        ]
+        if points:
+            calls.append(
+                with_retries(
+                    "Qdrant upsert",
+                    lambda: self.qdrant.upsert(self.collection, points=points, wait=True),
+                    self.retries,
+                )
+            )
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            raise errors[0]
+        mongo_result = results[0]
+        self.stats["mongo_upserted"] += mongo_result.upserted_count
+        self.stats["mongo_modified"] += mongo_result.modified_count
+        self.stats["mongo_unchanged"] += mongo_result.matched_count - mongo_result.modified_count
+        self.stats["qdrant_upserted"] += len(points)
+
+    async def load(self, docs, batch_size, concurrency):
+        """배치를 최대 concurrency개까지 동시에 적재 (입력은 필요한 만큼만 읽음)"""
+        pending = set()
+        started = time.perf_counter()
+        for batch in iter_batches(docs, batch_size):
+            self.stats["source"] += len(batch)
+            pending.add(asyncio.ensure_future(self.load_batch(batch)))
+            if len(pending) >= concurrency:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if pending:
+            await asyncio.wait(pending)
+        elapsed = time.perf_counter() - started
+        print(
+            f"[INFO] 상품 {self.stats['source']}개 처리 ({elapsed:.1f}초): "
+            f"Mongo 추가 {self.stats['mongo_upserted']}개, 변경 {self.stats['mongo_modified']}개, "
+            f"변경 없음 {self.stats['mongo_unchanged']}개 / Qdrant upsert {self.stats['qdrant_upserted']}개"
+        )
+
+
+async def scroll_qdrant_ids(qdrant, collection, page_size=1000):
+    """Qdrant 포인트의 payload 상품 id와 이전 방식 id(순번, 상품당 UUID)로 남아 있는 포인트 수"""
+    product_ids = set()
+    mismatched = 0
+    offset = None
+    while True:
+        points, offset = await qdrant.scroll(
+            collection,
+            limit=page_size,
+            offset=offset,
+            with_payload=["id"],
+            with_vectors=False,
+        )
+        for point in points:
+            product_id = (point.payload or {}).get("id")
+            if product_id is None:
+                mismatched += 1
+                continue
+            product_ids.add(str(product_id))
+            # 순번 id로 올라간 포인트, 상품당 포인트 하나였던 때의 포인트
+            if isinstance(point.id, int) or str(point.id) == legacy_point_id(product_id):
+                mismatched += 1
+        if offset is None:
+            return product_ids, mismatched
+
+
+async def consistency_report(products, qdrant, collection, loader):
+    mongo_ids = {str(doc["_id"]) async for doc in products.find({}, {"_id": 1})}
+    qdrant_ids, mismatched = await scroll_qdrant_ids(qdrant, collection)
+    mongo_only = sorted(mongo_ids - qdrant_ids)
+    qdrant_only = sorted(qdrant_ids - mongo_ids)
+    report = {
+        "collection": collection,
+        "source_products": loader.stats["source"],
+        "load": loader.stats,
+        "failed_batches": loader.failed_batches,
+        "mongo_count": len(mongo_ids),
+        "qdrant_count": len(qdrant_ids),
+        "missing_embedding": sorted(loader.missing_embedding),
+        "unused_embeddings": loader.embeddings.unused_ids() if loader.embeddings else [],
+        "mongo_only": mongo_only,
+        "qdrant_only": qdrant_only,
+        "qdrant_point_id_mismatch": mismatched,
+    }
+    print(
+        f"[INFO] 일관성 리포트: Mongo {len(mongo_ids)}개, Qdrant {len(qdrant_ids)}개, "
+        f"Mongo에만 {len(mongo_only)}개 (임베딩 없는 상품 {len(loader.missing_embedding)}개 포함), "
+        f"Qdrant에만 {len(qdrant_only)}개, 이전 방식 id 포인트 {mismatched}개"
+    )
+    for key in ("unused_embeddings", "mongo_only", "qdrant_only"):
+        ids = report[key]
+        if ids:
+            more = f" 외 {len(ids) - SAMPLE_LIMIT}개" if len(ids) > SAMPLE_LIMIT else ""
+            print(f"[WARN] {key} {len(ids)}개: {', '.join(ids[:SAMPLE_LIMIT])}{more}")
+    return report
+
+
+async def run(args):
+    mongo = AsyncIOMotorClient(args.mongo_uri)
+    products = mongo[args.db]["danawa_products"]
+    qdrant = AsyncQdrantClient(
+        url=args.qdrant_url,
+        api_key=args.qdrant_api_key,
+        timeout=120,
+        check_compatibility=False,
+    )
+    try:
+        if not await qdrant.collection_exists(args.collection):
+            print(
+                f"[ERROR] Qdrant 컬렉션 '{args.collection}'이 없습니다. "
+                "qdrant-seed(upload_qdrant.py)로 먼저 생성하세요."
+            )
+            return 1
+        embeddings = EmbeddingIndex(args.embeddings) if args.embeddings else None
+        loader = CatalogLoader(products, qdrant, args.collection, embeddings, args.retries)
+        await loader.load(iter_raw_points(args.products), args.batch_size, args.concurrency)
+
+        report = await consistency_report(products, qdrant, args.collection, loader)
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"[INFO] 리포트 저장: {args.report}")
+
+        if loader.failed_batches:
+            print("[ERROR] 실패한 배치가 있습니다. 다시 실행하면 같은 결과로 덮어씁니다.")
+            return 1
+        if args.fail_on_drift and (report["mongo_only"] or report["qdrant_only"]):
+            print("[ERROR] Mongo와 Qdrant의 상품 id가 일치하지 않습니다.")
+            return 1
+        print("[INFO] 모든 작업이 완료되었습니다.")
+        return 0
+    finally:
+        await qdrant.close()
+        mongo.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다나와 상품 Mongo + Qdrant 일괄 적재")
+    parser.add_argument("products", help="상품 NDJSON 또는 JSON 배열 (convert_danawa_csv_to_json.py 출력)")
+    parser.add_argument("--embeddings", help="상품 임베딩 (.npy + .parquet, .json, .ndjson)")
+    parser.add_argument(
+        "--mongo-uri",
+        default=os.environ.get("MONGO_URI", "mongodb://localhost:27017"),
+        help="MongoDB 접속 URI (기본값: 환경변수 MONGO_URI)",
+    )
+    parser.add_argument("--db", default="interior_db", help="DB 이름")
+    parser.add_argument(
+        "--qdrant-url", default=os.environ.get("QDRANT_URL", "http://localhost:6333")
+    )
+    parser.add_argument("--qdrant-api-key", default=os.environ.get("QDRANT_API_KEY"))
+    parser.add_argument(
+        "--collection", default=os.environ.get("QDRANT_COLLECTION", "danawa_products")
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 적재할 배치 수")
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument("--report", help="일관성 리포트 JSON 저장 경로")
+    parser.add_argument(
+        "--fail-on-drift",
+        action="store_true",
+        help="한쪽 저장소에만 있는 상품이 있으면 exit 1",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
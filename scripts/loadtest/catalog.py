@@ -0,0 +1,90 @@
+import hashlib
+import math
+import random
+from datetime import datetime, timezone
+
+# 부하 테스트용 합성 데이터
+# fake_services.py(Qdrant/YOLO+CLIP 대역)와 seed_mongo.py가 같은 seed로 같은 상품 목록을 만들어
+# Qdrant 검색 결과의 상품 id가 Mongo danawa_products에 실제로 존재하도록 맞춘다.
+
+LABELS = ["bed", "chair", "desk", "sofa", "table", "lamp", "shelf", "cabinet"]
+VECTOR_SIZE = 768
+PRODUCTS_PER_LABEL = 200
+CREATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def product_id(label: str, index: int) -> str:
+    return f"loadtest-{label}-{index:05d}"
+
+
+def unit_vector(seed: str, size: int = VECTOR_SIZE) -> list:
+    """seed 문자열로 항상 같은 L2 정규화 벡터 생성"""
+    rng = random.Random(hashlib.sha256(seed.encode()).hexdigest())
+    vector = [rng.gauss(0, 1) for _ in range(size)]
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def build_products(seed: int = 42, per_label: int = PRODUCTS_PER_LABEL) -> list:
+    """label별 합성 상품 목록 (Mongo danawa_products 문서 형식)"""
+    rng = random.Random(seed)
+    products = []
+    for label in LABELS:
+        for i in range(per_label):
+            pid = product_id(label, i)
+            products.append(
+                {
+                    "_id": pid,
+                    "label": label,
+                    "product_name": f"{label} 테스트 상품 {i}",
+                    "product_url": f"https://example.com/products/{pid}",
+                    "image_url": [
+                        f"https://example.com/images/{pid}-{n}.jpg" for n in range(3)
+                    ],
+                    "dimensions": {
+                        "width_cm": round(rng.uniform(30, 220), 1),
+                        "depth_cm": round(rng.uniform(30, 120), 1),
+                        "height_cm": round(rng.uniform(30, 200), 1),
+                    },
+                    "created_at": CREATED_AT,
+                    "updated_at": CREATED_AT,
+                }
+            )
+    return products
+
+
+def product_to_qdrant_payload(product: dict) -> dict:
+    """upload_qdrant.py가 올리는 payload와 같은 형식"""
+    payload = {key: value for key, value in product.items() if key != "_id"}
+    payload["id"] = product["_id"]
+    payload.update(payload.pop("dimensions"))
+    payload["created_at"] = product["created_at"].isoformat()
+    payload["updated_at"] = product["updated_at"].isoformat()
+    return payload
+
+
+def build_ar_documents(models_per_label: int = 4) -> list:
+    """label별 합성 AR 모델 (ar_documents 문서 형식)"""
+    documents = []
+    for label in LABELS:
+        for i in range(models_per_label):
+            documents.append(
+                {
+                    "_id": f"loadtest-ar-{label}-{i}",
+                    "label": label,
+                    "model_url": f"https://example.com/models/{label}-{i}.glb",
+                    "image_url": f"https://example.com/models/{label}-{i}.png",
+                    "position": {"x": 0.0, "y": 0.0, "z": -1.5},
+                    "rotation": 0.0,
+                    "scale": 1.0,
+                }
+            )
+    return documents
+
+
+def loadtest_user(index: int) -> dict:
+    return {
+        "email": f"loadtest{index}@example.com",
+        "name": f"loadtest{index}",
+        "password": f"loadtest-password-{index}",
+    }
@@ -0,0 +1,346 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import random
+import time
+import uuid
+import google_crc32c
+import numpy as np
+from fastapi import FastAPI, Form, HTTPException, Request, Response
+from PIL import Image
+from catalog import LABELS, build_products, product_to_qdrant_payload, unit_vector
+
+# 부하 테스트용 외부 서비스 대역 (하나의 프로세스에서 모두 제공)
+#
+#   Replicate     : POST /replicate/v1/predictions, GET /replicate/v1/predictions/{id}
+#                   → 백엔드 REPLICATE_API_BASE_URL=http://<host>:9100/replicate/v1
+#   생성 이미지    : GET /images/{name}
+#   YOLO+CLIP     : POST /yolo-clip/process (768차원 clip_embedding 포함 탐지 결과)
+#                   → YOLO_CLIP_API_URL=http://<host>:9100/yolo-clip/process
+#   Qdrant 검색    : POST /collections/{collection}/points/query (qdrant-client query_points)
+#                   POST /collections/{collection}/points/search (이전 REST 검색)
+#                   → QDRANT_HOST=<host>, QDRANT_PORT=9100 (label 필터 + cosine)
+#   GCS JSON API  : 업로드/ACL 변경만 지원
+#                   → STORAGE_EMULATOR_HOST=http://<host>:9100
+#
+# 지연 시간/결과는 환경변수로 조절하며, 같은 seed면 같은 결과를 돌려준다.
+
+PUBLIC_URL = os.getenv("FAKE_PUBLIC_URL", "http://localhost:9100")
+SEED = int(os.getenv("FAKE_SEED", "42"))
+REPLICATE_DELAY_SECONDS = float(os.getenv("FAKE_REPLICATE_DELAY_SECONDS", "3.0"))
+REPLICATE_FAILURE_RATE = float(os.getenv("FAKE_REPLICATE_FAILURE_RATE", "0"))
+YOLO_DELAY_SECONDS = float(os.getenv("FAKE_YOLO_DELAY_SECONDS", "0.5"))
+YOLO_DETECTIONS = int(os.getenv("FAKE_YOLO_DETECTIONS", "4"))
+QDRANT_DELAY_SECONDS = float(os.getenv("FAKE_QDRANT_DELAY_SECONDS", "0.01"))
+GCS_DIR = os.getenv("FAKE_GCS_DIR")  # 지정하면 업로드된 객체를 파일로 저장
+
+app = FastAPI(title="loadtest fake services")
+
+_predictions = {}
+_upload_sessions = {}
+_objects = {}  # (bucket, name) → 객체 메타데이터
+_rng = random.Random(SEED)
+
+
+def _build_qdrant_index():
+    """label별 (상품 벡터 행렬, payload 목록)"""
+    index = {}
+    products = build_products(SEED)
+    for label in LABELS:
+        label_products = [p for p in products if p["label"] == label]
+        vectors = np.array(
+            [unit_vector(p["_id"]) for p in label_products], dtype=np.float32
+        )
+        payloads = [product_to_qdrant_payload(p) for p in label_products]
+        index[label] = (vectors, payloads)
+    return index
+
+
+print("[INFO] Qdrant 대역 인덱스 생성 중...")
+_qdrant_index = _build_qdrant_index()
+print(f"[INFO] Qdrant 대역 준비 완료: {len(LABELS)}개 label")
+
+
+def _png_bytes(size: int = 512) -> bytes:
+    image = Image.new("RGB", (size, size), (200, 190, 170))
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return output.getvalue()
+
+
+_image_bytes = _png_bytes()
+
+
+# ---------- Replicate ----------
+
+
+@app.post("/replicate/v1/predictions", status_code=201)
+async def create_prediction(request: Request):
+    body = await request.json()
+    prediction_id = uuid.uuid4().hex
+    failed = _rng.random() < REPLICATE_FAILURE_RATE
+    _predictions[prediction_id] = (time.monotonic(), failed)
+    return {
+        "id": prediction_id,
+        "status": "starting",
+        "input": body.get("input", {}),
+        "urls": {"get": f"{PUBLIC_URL}/replicate/v1/predictions/{prediction_id}"},
+    }
+
+
+@app.get("/replicate/v1/predictions/{prediction_id}")
+async def get_prediction(prediction_id: str):
+    if prediction_id not in _predictions:
+        raise HTTPException(status_code=404, detail="prediction not found")
+    created_at, failed = _predictions[prediction_id]
+    if time.monotonic() - created_at < REPLICATE_DELAY_SECONDS:
+        return {"id": prediction_id, "status": "processing"}
+    _predictions.pop(prediction_id, None)
+    if failed:
+        return {"id": prediction_id, "status": "failed", "error": "fake failure"}
+    return {
+        "id": prediction_id,
+        "status": "succeeded",
+        "output": [
+            f"{PUBLIC_URL}/images/{prediction_id}-control.png",
+            f"{PUBLIC_URL}/images/{prediction_id}.png",
+        ],
+    }
+
+
+@app.get("/images/{name}")
+async def get_image(name: str):
+    return Response(_image_bytes, media_type="image/png")
+
+
+# ---------- YOLO+CLIP ----------
+
+
+@app.post("/yolo-clip/process")
+async def yolo_clip_process(url: str = Form(...)):
+    await asyncio.sleep(YOLO_DELAY_SECONDS)
+    # 이미지 URL별로 항상 같은 탐지 결과
+    rng = random.Random(hashlib.sha256(url.encode()).hexdigest())
+    detections = []
+    for i in range(YOLO_DETECTIONS):
+        label = rng.choice(LABELS)
+        detections.append(
+            {
+                "label": label,
+                "confidence": round(rng.uniform(0.5, 0.99), 3),
+                "bbox": [
+                    rng.randint(0, 300),
+                    rng.randint(0, 300),
+                    rng.randint(50, 200),
+                    rng.randint(50, 200),
+                ],
+                "clip_embedding": unit_vector(f"{url}-{i}"),
+            }
+        )
+    return detections
+
+
+# ---------- Qdrant ----------
+
+
+def _label_from_filter(query_filter) -> str:
+    must = (query_filter or {}).get("must") or []
+    if isinstance(must, dict):
+        must = [must]
+    for condition in must:
+        if condition.get("key") == "label":
+            return condition.get("match", {}).get("value")
+    return None
+
+
+def _search_points(body: dict) -> list:
+    """label 필터 + cosine 상위 top개 (payload는 with_payload에 따라 전체/일부/없음)"""
+    query = body.get("query") or body.get("vector")
+    if isinstance(query, dict):
+        query = query.get("nearest")  # Query API: {"nearest": [...]}
+    top = int(body.get("top") or body.get("limit") or 5)
+    label = _label_from_filter(body.get("filter"))
+    labels = [label] if label in _qdrant_index else list(_qdrant_index)
+    with_payload = body.get("with_payload")
+
+    query_vector = np.asarray(query, dtype=np.float32)
+    hits = []
+    for label in labels:
+        vectors, payloads = _qdrant_index[label]
+        scores = vectors @ query_vector
+        for idx in np.argsort(-scores)[:top]:
+            payload = payloads[idx]
+            if isinstance(with_payload, list):
+                payload = {k: v for k, v in payload.items() if k in with_payload}
+            elif not with_payload:
+                payload = None
+            hits.append(
+                {
+                    "id": payloads[idx]["id"],
+                    "version": 0,
+                    "score": float(scores[idx]),
+                    "payload": payload,
+                }
+            )
+    return sorted(hits, key=lambda hit: hit["score"], reverse=True)[:top]
+
+
+@app.post("/collections/{collection}/points/search")
+async def qdrant_search(collection: str, request: Request):
+    body = await request.json()
+    started_at = time.perf_counter()
+    hits = _search_points(body)
+    await asyncio.sleep(QDRANT_DELAY_SECONDS)
+    return {
+        "result": hits,
+        "status": "ok",
+        "time": time.perf_counter() - started_at,
+    }
+
+
+@app.post("/collections/{collection}/points/query")
+async def qdrant_query(collection: str, request: Request):
+    # qdrant-client query_points()가 호출하는 Query API
+    body = await request.json()
+    started_at = time.perf_counter()
+    hits = _search_points(body)
+    await asyncio.sleep(QDRANT_DELAY_SECONDS)
+    return {
+        "result": {"points": hits},
+        "status": "ok",
+        "time": time.perf_counter() - started_at,
+    }
+
+
+# ---------- GCS (JSON API 일부) ----------
+
+
+def _object_resource(bucket: str, name: str, data: bytes, content_type: str) -> dict:
+    # 클라이언트가 업로드 후 체크섬을 검증하므로 crc32c/md5Hash를 함께 돌려준다
+    return {
+        "kind": "storage#object",
+        "id": f"{bucket}/{name}/1",
+        "name": name,
+        "bucket": bucket,
+        "generation": "1",
+        "metageneration": "1",
+        "contentType": content_type,
+        "size": str(len(data)),
+        "crc32c": base64.b64encode(google_crc32c.Checksum(data).digest()).decode(),
+        "md5Hash": base64.b64encode(hashlib.md5(data).digest()).decode(),
+        "mediaLink": f"{PUBLIC_URL}/download/storage/v1/b/{bucket}/o/{name}",
+    }
+
+
+def _parse_multipart_related(body: bytes, content_type: str):
+    """uploadType=multipart 요청에서 (메타데이터, 파일 데이터) 추출"""
+    boundary = content_type.split("boundary=")[-1].strip('"').encode()
+    parts = [p for p in body.split(b"--" + boundary) if p.strip(b"-\r\n")]
+    metadata, data = {}, b""
+    for i, part in enumerate(parts):
+        _, _, content = part.partition(b"\r\n\r\n")
+        if content.endswith(b"\r\n"):
+            content = content[:-2]
+        if i == 0:
+            metadata = json.loads(content or b"{}")
+        else:
+            data = content
+    return metadata, data
+
+
+def _save_object(bucket: str, name: str, data: bytes, content_type: str) -> dict:
+    if GCS_DIR:
+        path = os.path.join(GCS_DIR, bucket, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    resource = _object_resource(bucket, name, data, content_type)
+    _objects[(bucket, name)] = resource
+    return resource
+
+
+@app.post("/upload/storage/v1/b/{bucket}/o")
+async def gcs_upload(bucket: str, request: Request):
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    upload_type = request.query_params.get("uploadType")
+
+    if upload_type == "resumable":
+        # 업로드 세션 시작 → 이후 PUT으로 데이터 전송
+        metadata = json.loads(body or b"{}")
+        upload_id = uuid.uuid4().hex
+        _upload_sessions[upload_id] = (
+            bucket,
+            metadata.get("name") or request.query_params.get("name"),
+            request.headers.get("x-upload-content-type", "application/octet-stream"),
+            bytearray(),
+        )
+        location = (
+            f"{PUBLIC_URL}/upload/storage/v1/b/{bucket}/o"
+            f"?uploadType=resumable&upload_id={upload_id}"
+        )
+        return Response(status_code=200, headers={"Location": location})
+
+    if upload_type == "multipart":
+        metadata, data = _parse_multipart_related(body, content_type)
+        name = metadata.get("name") or request.query_params.get("name")
+        object_type = metadata.get("contentType", "application/octet-stream")
+    else:
+        name, data, object_type = request.query_params.get("name"), body, content_type
+    if not name:
+        raise HTTPException(status_code=400, detail="object name is required")
+    return _save_object(bucket, name, data, object_type)
+
+
+@app.put("/upload/storage/v1/b/{bucket}/o")
+async def gcs_resumable_chunk(bucket: str, request: Request):
+    upload_id = request.query_params.get("upload_id")
+    if upload_id not in _upload_sessions:
+        raise HTTPException(status_code=404, detail="upload session not found")
+    _, name, object_type, buffer = _upload_sessions[upload_id]
+    buffer.extend(await request.body())
+
+    # Content-Range: bytes 0-99/100 또는 bytes */100 (전체 크기를 모르면 *)
+    total = request.headers.get("content-range", "").rpartition("/")[2]
+    if total.isdigit() and len(buffer) >= int(total):
+        _upload_sessions.pop(upload_id, None)
+        return _save_object(bucket, name, bytes(buffer), object_type)
+    headers = {"Range": f"bytes=0-{len(buffer) - 1}"} if buffer else {}
+    return Response(status_code=308, headers=headers)
+
+
+@app.get("/storage/v1/b/{bucket}/o/{name:path}/acl")
+async def gcs_get_object_acl(bucket: str, name: str):
+    resource = _objects.get((bucket, name))
+    if resource is None:
+        raise HTTPException(status_code=404, detail="object not found")
+    return {"kind": "storage#objectAccessControls", "items": resource.get("acl", [])}
+
+
+@app.patch("/storage/v1/b/{bucket}/o/{name:path}")
+async def gcs_patch_object(bucket: str, name: str, request: Request):
+    # make_public()이 보내는 ACL 변경 요청 (내용은 그대로 돌려줌)
+    body = await request.json()
+    resource = _objects.get((bucket, name))
+    if resource is None:
+        raise HTTPException(status_code=404, detail="object not found")
+    resource.update(body)
+    return resource
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="부하 테스트용 외부 서비스 대역 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9100)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from collections import defaultdict
+import httpx
+from catalog import LABELS, loadtest_user
+
+# asyncio 기반 부하 테스트 드라이버
+#
+# 시나리오(JSON)에 정의된 비율대로 가상 사용자(concurrency)가 요청을 반복하고
+# 엔드포인트별 p50/p95/p99, RPS, 오류 수와 /metrics의 인테리어 생성 단계별 시간을 출력합니다.
+# 같은 시나리오 + seed면 요청 순서와 입력값이 같으므로 커밋 간 결과를 비교할 수 있습니다.
+#
+# 준비:
+#   1. python fake_services.py --port 9100            (Replicate, YOLO+CLIP, Qdrant, GCS 대역)
+#   2. python seed_mongo.py --mongo-uri <테스트용 Mongo>  (사용자, 상품, AR 모델, 라이브러리)
+#   3. 백엔드와 Celery 워커를 아래 환경변수로 실행
+#        REPLICATE_API_BASE_URL=http://localhost:9100/replicate/v1
+#        YOLO_CLIP_API_URL=http://localhost:9100/yolo-clip/process
+#        QDRANT_HOST=localhost QDRANT_PORT=9100
+#        STORAGE_EMULATOR_HOST=http://localhost:9100
+#        LOGIN_RATE_LIMIT_ENABLED=false
+#
+# 사용 예:
+#   python run_loadtest.py scenarios/mixed.json --base-url http://localhost:8000 --output result.json
+
+STAGE_METRIC = "interior_generation_stage_seconds"
+STYLES = ["modern", "natural", "minimal", "vintage"]
+ROOM_TYPES = ["livingroom", "bedroom", "office"]
+
+
+def percentile(sorted_values, p):
+    """nearest-rank 방식 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name, seconds, status):
+        self.latencies[name].append(seconds)
+        self.statuses[name][status] += 1
+        if status >= 400 or status == 0:
+            self.errors[name] += 1
+
+    def summary(self, elapsed):
+        result = {}
+        for name, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            result[name] = {
+                "count": len(values),
+                "errors": self.errors[name],
+                "rps": round(len(values) / elapsed, 2),
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+                "p99_ms": round(percentile(values, 99) * 1000, 1),
+                "max_ms": round(values[-1] * 1000, 1),
+                "statuses": dict(self.statuses[name]),
+            }
+        return result
+
+
+# ---------- 요청 정의 ----------
+
+
+async def login(client, rng, state):
+    user = loadtest_user(rng.randrange(state["user_count"]))
+    return await client.post(
+        "/users/login",
+        data={"username": user["email"], "password": user["password"]},
+    )
+
+
+async def user_library(client, rng, state):
+    return await client.get("/interiors/user-library", headers=state["auth"])
+
+
+async def ar_similar_object(client, rng, state):
+    return await client.post("/api/ar/similar-object", json={"label": rng.choice(LABELS)})
+
+
+async def generate(client, rng, state):
+    return await client.post(
+        "/interiors/generate",
+        headers=state["auth"],
+        json={
+            "image_url": f"https://example.com/rooms/{rng.randrange(1000)}.jpg",
+            "room_type": rng.choice(ROOM_TYPES),
+            "style": rng.choice(STYLES),
+            "prompt": "cozy and bright",
+        },
+    )
+
+
+REQUESTS = {
+    "login": login,
+    "user_library": user_library,
+    "ar_similar_object": ar_similar_object,
+    "generate": generate,
+}
+
+
+# ---------- 실행 ----------
+
+
+async def virtual_user(worker_id, client, scenario, recorder, deadline):
+    rng = random.Random(scenario.get("seed", 42) * 1000 + worker_id)
+    user_count = scenario.get("users", 50)
+    state = {"user_count": user_count, "auth": {}}
+
+    # 가상 사용자마다 고정된 계정으로 로그인해 Bearer 토큰 확보
+    user = loadtest_user(worker_id % user_count)
+    resp = await client.post(
+        "/users/login", data={"username": user["email"], "password": user["password"]}
+    )
+    if resp.status_code == 200:
+        state["auth"] = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    else:
+        print(f"[WARN] 가상 사용자 {worker_id} 로그인 실패: {resp.status_code}")
+
+    names = [r["name"] for r in scenario["requests"]]
+    weights = [r.get("weight", 1) for r in scenario["requests"]]
+    think_time = scenario.get("think_time_seconds", 0)
+    max_requests = scenario.get("requests_per_user")
+    sent = 0
+    while time.monotonic() < deadline and (max_requests is None or sent < max_requests):
+        name = rng.choices(names, weights)[0]
+        started_at = time.perf_counter()
+        try:
+            resp = await REQUESTS[name](client, rng, state)
+            status = resp.status_code
+        except httpx.HTTPError:
+            status = 0
+        recorder.record(name, time.perf_counter() - started_at, status)
+        sent += 1
+        if think_time:
+            await asyncio.sleep(think_time)
+
+
+def parse_stage_metrics(text):
+    """Prometheus 텍스트에서 단계별 (소요 시간 합, 횟수) 합계"""
+    pattern = re.compile(
+        rf'^{STAGE_METRIC}_(sum|count)\{{[^}}]*stage="([^"]+)"[^}}]*\}} ([0-9.eE+-]+)$'
+    )
+    stages = defaultdict(lambda: {"sum": 0.0, "count": 0.0})
+    for line in text.splitlines():
+        match = pattern.match(line)
+        if match:
+            kind, stage, value = match.groups()
+            stages[stage][kind] += float(value)
+    return stages
+
+
+async def fetch_stage_metrics(client):
+    try:
+        resp = await client.get("/metrics")
+        resp.raise_for_status()
+        return parse_stage_metrics(resp.text)
+    except httpx.HTTPError:
+        return {}
+
+
+def stage_breakdown(before, after):
+    # gunicorn 워커가 여러 개면 /metrics는 응답한 워커 하나의 값만 보여준다
+    breakdown = {}
+    for stage, values in after.items():
+        count = values["count"] - before.get(stage, {}).get("count", 0)
+        total = values["sum"] - before.get(stage, {}).get("sum", 0)
+        if count > 0:
+            breakdown[stage] = {
+                "count": int(count),
+                "mean_ms": round(total / count * 1000, 1),
+            }
+    return breakdown
+
+
+async def run(scenario, base_url):
+    concurrency = scenario.get("concurrency", 10)
+    duration = scenario.get("duration_seconds", 30)
+    timeout = httpx.Timeout(scenario.get("timeout_seconds", 120))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    recorder = Recorder()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        before = await fetch_stage_metrics(client)
+        print(
+            f"[INFO] 시나리오 '{scenario.get('name', 'unnamed')}' 시작 "
+            f"(concurrency={concurrency}, duration={duration}s)"
+        )
+        started_at = time.monotonic()
+        deadline = started_at + duration
+        await asyncio.gather(
+            *(
+                virtual_user(i, client, scenario, recorder, deadline)
+                for i in range(concurrency)
+            )
+        )
+        elapsed = time.monotonic() - started_at
+        after = await fetch_stage_metrics(client)
+
+    endpoints = recorder.summary(elapsed)
+    total = sum(e["count"] for e in endpoints.values())
+    return {
+        "scenario": scenario.get("name", "unnamed"),
+        "seed": scenario.get("seed", 42),
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 2),
+        "total_requests": total,
+        "total_rps": round(total / elapsed, 2) if elapsed else 0,
+        "endpoints": endpoints,
+        "stages": stage_breakdown(before, after),
+    }
+
+
+def print_report(report):
+    print(
+        f"\n[RESULT] {report['scenario']}: {report['total_requests']}건, "
+        f"{report['total_rps']} RPS, {report['elapsed_seconds']}s"
+    )
+    print(
+        f"{'endpoint':<20}{'count':>8}{'errors':>8}{'rps':>8}"
+        f"{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+    )
+    for name, e in report["endpoints"].items():
+        print(
+            f"{name:<20}{e['count']:>8}{e['errors']:>8}{e['rps']:>8}"
+            f"{e['p50_ms']:>10}{e['p95_ms']:>10}{e['p99_ms']:>10}{e['max_ms']:>10}"
+        )
+    if report["stages"]:
+        print(f"\n{'stage':<20}{'count':>8}{'mean_ms':>10}")
+        for stage, s in sorted(report["stages"].items()):
+            print(f"{stage:<20}{s['count']:>8}{s['mean_ms']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 부하 테스트")
+    parser.add_argument("scenario", help="시나리오 JSON 파일")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, help="시나리오 값 덮어쓰기")
+    parser.add_argument("--duration", type=float, help="시나리오 값 덮어쓰기")
+    parser.add_argument("--seed", type=int, help="시나리오 값 덮어쓰기")
+    parser.add_argument("--output", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    with open(args.scenario, encoding="utf-8") as f:
+        scenario = json.load(f)
+    if args.concurrency:
+        scenario["concurrency"] = args.concurrency
+    if args.duration:
+        scenario["duration_seconds"] = args.duration
+    if args.seed is not None:
+        scenario["seed"] = args.seed
+
+    report = asyncio.run(run(scenario, args.base_url))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n[INFO] 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
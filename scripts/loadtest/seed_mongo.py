@@ -0,0 +1,162 @@
+import os
+import argparse
+import random
+from datetime import datetime, timedelta, timezone
+import bcrypt
+from pymongo import MongoClient, ReplaceOne
+from catalog import (
+    LABELS,
+    build_ar_documents,
+    build_products,
+    loadtest_user,
+    product_id,
+    PRODUCTS_PER_LABEL,
+)
+
+# 부하 테스트용 Mongo 데이터 적재 스크립트
+# Motor에는 인메모리 백엔드가 없으므로, 컨테이너 없이 띄운 로컬 mongod
+# (예: mongod --dbpath /tmp/loadtest-db --port 27018)나 테스트용 DB에 적재해서 사용합니다.
+# 모든 문서 _id가 "loadtest-"로 시작하므로 --drop으로 부하 테스트 데이터만 지울 수 있습니다.
+
+LOADTEST_ID_FILTER = {"_id": {"$regex": "^loadtest-"}}
+STYLES = ["modern", "natural", "minimal", "vintage"]
+ROOM_TYPES = ["livingroom", "bedroom", "office"]
+
+
+def drop_loadtest_data(db):
+    for name in [
+        "users",
+        "danawa_products",
+        "ar_documents",
+        "interiors",
+        "furniture_detected",
+    ]:
+        result = db[name].delete_many(LOADTEST_ID_FILTER)
+        print(f"[INFO] {name}: 부하 테스트 문서 {result.deleted_count}개 삭제")
+
+
+def upsert_all(collection, documents, batch_size=1000):
+    for i in range(0, len(documents), batch_size):
+        batch = documents[i : i + batch_size]
+        collection.bulk_write(
+            [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in batch],
+            ordered=False,
+        )
+    print(f"[INFO] {collection.name}: {len(documents)}개 적재 완료")
+
+
+def build_users(count, rounds):
+    # 로그인 부하를 재현하려면 운영과 같은 bcrypt rounds로 해시해야 한다
+    now = datetime.now(timezone.utc)
+    users = []
+    for i in range(count):
+        user = loadtest_user(i)
+        users.append(
+            {
+                "_id": f"loadtest-user-{i}",
+                "email": user["email"],
+                "name": user["name"],
+                "password": bcrypt.hashpw(
+                    user["password"].encode(), bcrypt.gensalt(rounds)
+                ).decode(),
+                "memo": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+    return users
+
+
+def build_library(user_count, interiors_per_user, parts_per_interior, seed):
+    """사용자별 인테리어 라이브러리 (interiors + furniture_detected)"""
+    rng = random.Random(seed)
+    base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    interiors, furnitures = [], []
+    for u in range(user_count):
+        for n in range(interiors_per_user):
+            interior_id = f"loadtest-interior-{u}-{n}"
+            part_ids = []
+            for k in range(parts_per_interior):
+                label = rng.choice(LABELS)
+                part_id = f"loadtest-part-{u}-{n}-{k}"
+                part_ids.append(part_id)
+                furnitures.append(
+                    {
+                        "_id": part_id,
+                        "interior_id": interior_id,
+                        "label": label,
+                        "bounding_box": {
+                            "x": rng.randint(0, 300),
+                            "y": rng.randint(0, 300),
+                            "width": rng.randint(50, 200),
+                            "height": rng.randint(50, 200),
+                        },
+                        "danawa_products_id": [
+                            product_id(label, rng.randrange(PRODUCTS_PER_LABEL))
+                            for _ in range(5)
+                        ],
+                        "danawa_products_image_index": [
+                            rng.randrange(3) for _ in range(5)
+                        ],
+                        "created_at": base_time,
+                    }
+                )
+            created_at = base_time + timedelta(minutes=n)
+            interiors.append(
+                {
+                    "_id": interior_id,
+                    "user_id": f"loadtest-user-{u}",
+                    "original_image_url": f"https://example.com/rooms/{interior_id}.jpg",
+                    "interior_type_id": rng.choice(STYLES),
+                    "room_type_id": rng.choice(ROOM_TYPES),
+                    "status": "done",
+                    "saved": True,
+                    "generated_image_url": f"https://example.com/generated/{interior_id}.jpg",
+                    "detected_parts": part_ids,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "deleted_at": None,
+                }
+            )
+    return interiors, furnitures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 Mongo 데이터 적재")
+    parser.add_argument(
+        "--mongo-uri",
+        default=os.getenv("MONGO_URI", "mongodb://localhost:27017"),
+        help="MongoDB 접속 URI (기본값: MONGO_URI 환경변수)",
+    )
+    parser.add_argument("--db", default="interior_db")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--interiors-per-user", type=int, default=10)
+    parser.add_argument("--parts-per-interior", type=int, default=4)
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--drop", action="store_true", help="부하 테스트 문서(loadtest-*)만 삭제하고 종료"
+    )
+    args = parser.parse_args()
+
+    client = MongoClient(args.mongo_uri)
+    db = client[args.db]
+
+    if args.drop:
+        drop_loadtest_data(db)
+        return
+
+    print(f"[INFO] 부하 테스트 데이터 적재 시작 (db={args.db}, seed={args.seed})")
+    upsert_all(db["danawa_products"], build_products(args.seed))
+    upsert_all(db["ar_documents"], build_ar_documents())
+    upsert_all(db["users"], build_users(args.users, args.bcrypt_rounds))
+    interiors, furnitures = build_library(
+        args.users, args.interiors_per_user, args.parts_per_interior, args.seed
+    )
+    upsert_all(db["interiors"], interiors)
+    upsert_all(db["furniture_detected"], furnitures)
+    print("[INFO] 적재 완료")
+
+
+if __name__ == "__main__":
+    main()
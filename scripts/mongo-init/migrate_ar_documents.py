@@ -0,0 +1,121 @@
+import os
+import re
+import argparse
+from pymongo import MongoClient
+
+# label별로 나뉘어 있던 ar_{label}_documents 컬렉션을 하나의 ar_documents 컬렉션으로 병합하는 스크립트
+# 각 문서에 label 필드가 없으면 컬렉션명에서 추출한 label을 채워 넣습니다.
+# 같은 _id 문서는 덮어쓰므로 여러 번 실행해도 결과가 같습니다.
+# 서로 다른 컬렉션(label)의 문서가 같은 _id를 쓰면 한쪽이 사라지므로 병합 전에 확인하고 중단합니다.
+
+TARGET_COLLECTION = "ar_documents"
+SAMPLE_LIMIT = 20  # 출력할 충돌 _id 개수
+LEGACY_COLLECTION_PATTERN = re.compile(r"^ar_(?P<label>.+)_documents$")
+
+
+def find_legacy_collections(db):
+    legacy = []
+    for name in db.list_collection_names():
+        match = LEGACY_COLLECTION_PATTERN.match(name)
+        if match and name != TARGET_COLLECTION:
+            legacy.append((name, match.group("label")))
+    return sorted(legacy)
+
+
+def find_id_collisions(db, legacy_collections):
+    """
+    서로 다른 label의 문서가 같은 _id를 쓰는 경우 [(_id, [출처, ...]), ...]
+
+    기존 컬렉션끼리와, 이미 ar_documents에 있는 다른 label 문서와의 충돌을 모두 본다.
+    (같은 컬렉션을 다시 병합하는 경우는 같은 label이므로 충돌이 아님)
+    """
+    sources = {}
+    for collection_name, label in legacy_collections:
+        for doc in db[collection_name].find({}, {"_id": 1, "label": 1}):
+            sources.setdefault(doc["_id"], []).append(
+                (collection_name, doc.get("label") or label)
+            )
+    for doc in db[TARGET_COLLECTION].find(
+        {"_id": {"$in": list(sources)}}, {"_id": 1, "label": 1}
+    ):
+        sources[doc["_id"]].append((TARGET_COLLECTION, doc.get("label")))
+    return [
+        (doc_id, [name for name, _ in found])
+        for doc_id, found in sources.items()
+        if len({label for _, label in found}) > 1
+        or len({name for name, _ in found if name != TARGET_COLLECTION}) > 1
+    ]
+
+
+def merge_collection(db, collection_name, label):
+    before = db[TARGET_COLLECTION].count_documents({"label": label})
+    db[collection_name].aggregate(
+        [
+            {"$set": {"label": {"$ifNull": ["$label", label]}}},
+            {
+                "$merge": {
+                    "into": TARGET_COLLECTION,
+                    "on": "_id",
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert",
+                }
+            },
+        ]
+    )
+    after = db[TARGET_COLLECTION].count_documents({"label": label})
+    print(
+        f"[INFO] {collection_name} → {TARGET_COLLECTION} 병합 완료 "
+        f"(label={label}, {before} → {after}개)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="ar_{label}_documents 컬렉션을 ar_documents로 병합"
+    )
+    parser.add_argument(
+        "--mongo-uri",
+        default=os.environ.get("MONGO_URI", "mongodb://localhost:27017"),
+        help="MongoDB 접속 URI (기본값: 환경변수 MONGO_URI)",
+    )
+    parser.add_argument("--db", default="interior_db", help="DB 이름")
+    parser.add_argument(
+        "--drop-legacy",
+        action="store_true",
+        help="병합이 끝난 기존 ar_{label}_documents 컬렉션 삭제",
+    )
+    args = parser.parse_args()
+
+    db = MongoClient(args.mongo_uri)[args.db]
+
+    db[TARGET_COLLECTION].create_index([("label", 1)])
+    print(f"[INFO] {TARGET_COLLECTION}.label 인덱스 확인 완료")
+
+    legacy_collections = find_legacy_collections(db)
+    if not legacy_collections:
+        print("[INFO] 병합할 ar_{label}_documents 컬렉션이 없습니다.")
+        return
+
+    collisions = find_id_collisions(db, legacy_collections)
+    if collisions:
+        for doc_id, names in collisions[:SAMPLE_LIMIT]:
+            print(f"[ERROR] _id 충돌: {doc_id} ({', '.join(names)})")
+        print(
+            f"[ERROR] 서로 다른 컬렉션의 문서 {len(collisions)}개가 같은 _id를 씁니다. "
+            "병합하면 한쪽 문서가 사라지므로 _id를 정리한 뒤 다시 실행하세요."
+        )
+        exit(1)
+
+    for collection_name, label in legacy_collections:
+        merge_collection(db, collection_name, label)
+
+    if args.drop_legacy:
+        for collection_name, _ in legacy_collections:
+            db.drop_collection(collection_name)
+            print(f"[INFO] 기존 컬렉션 삭제: {collection_name}")
+
+    print("[INFO] 모든 작업이 완료되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,259 @@
-import json
+import os
+import argparse
+from collections import Counter
+import numpy as np
+import pyarrow.parquet as pq
+from embedding_store import (
+    is_vector_store,
+    iter_raw_points,
+    open_vector_store,
+    payload_path,
+    write_vector_store,
+)
 
-# vertor 길이 확인용 스크립트
-# Qdrant에 업로드할 벡터의 길이를 확인하고, 일치하지 않는 벡터를 출력합니다.
-# 벡터 길이가 768이 아닌 경우 경고 메시지를 출력합니다.
+# 임베딩 검증 스크립트
+# Qdrant에 업로드할 벡터를 NumPy 행렬로 읽어 한 번에(블록 단위) 검사합니다.
+#   - 벡터 길이(--dim, 기본 768)가 다른 항목
+#   - NaN/Inf가 포함된 벡터, norm이 0인 벡터
+#   - L2 norm 분포 (Cosine 거리에서는 정규화 여부만 다르고 결과는 같음)
+#   - 같은 label 안의 중복/거의 같은 벡터 (블록 행렬곱으로 cosine 유사도 계산)
+#   - label 분포
+# 임계값을 넘으면 exit 1로 끝나므로 시드 파이프라인을 멈출 수 있습니다.
+# upload_qdrant.py도 업로드 전에 validate_embeddings를 호출합니다 (QDRANT_VALIDATE).
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/qdrant-init/check_vector.py data/qdrant/collections/furniture_embeddings.json
+#   python scripts/qdrant-init/check_vector.py embeddings.npy --duplicate-threshold 0.999
+#   python scripts/qdrant-init/check_vector.py embeddings.json --normalize-output normalized.npy
 
+SAMPLE_LIMIT = 10  # 문제 항목 출력 개수
 
-# 파일 경로를 실제 파일 위치로 바꿔주세요.
-json_path = "data/qdrant/collections/furniture_embeddings.json"
 
-with open(json_path, "r", encoding="utf-8") as f:
-    data = json.load(f)
+def load_matrix(path, dim, chunk_rows=4096):
+    """
+    (벡터 행렬, id 배열, label 배열, 길이 불일치 항목 수)
 
-length_count = {}
-for idx, item in enumerate(data):
-    vec = item.get("vector")
-    if vec is not None:
-        l = len(vec)
-        length_count[l] = length_count.get(l, 0) + 1
-        if l != 768:  # Qdrant 컬렉션의 size와 다르면 샘플 출력
-            print(f"[WARN] {idx}번째 포인트의 벡터 길이: {l}")
-    else:
-        print(f"[ERROR] {idx}번째 포인트에 'vector' 필드가 없습니다.")
+    JSON 형식은 chunk_rows개씩 float32 배열로 바꿔 모으므로 Python float 리스트를
+    파일 전체만큼 쌓지 않는다.
+    """
+    if is_vector_store(path):
+        vectors, _ = open_vector_store(path)
+        table = pq.read_table(payload_path(path), columns=["id", "label"])
+        ids = np.asarray(table.column("id").to_pylist(), dtype=object)
+        labels = np.asarray(table.column("label").to_pylist(), dtype=object)
+        if vectors.shape[1] != dim:
+            print(f"[ERROR] 모든 포인트의 벡터 길이: {vectors.shape[1]} (기대값 {dim})")
+            return vectors[:0], ids[:0], labels[:0], vectors.shape[0]
+        return vectors, ids, labels, 0
 
-print(f"총 포인트 수: {len(data)}")
-print("벡터 길이별 개수:", length_count)
+    chunks, rows, ids, labels = [], [], [], []
+    mismatched = 0
+    for idx, item in enumerate(iter_raw_points(path)):
+        vec = item.get("vector")
+        if vec is None or len(vec) != dim:
+            if mismatched < SAMPLE_LIMIT:
+                print(f"[WARN] {idx}번째 포인트의 벡터 길이: {len(vec) if vec else 'None'}")
+            mismatched += 1
+            continue
+        rows.append(vec)
+        ids.append(item.get("id"))
+        labels.append((item.get("payload") or {}).get("label"))
+        if len(rows) >= chunk_rows:
+            chunks.append(np.asarray(rows, dtype=np.float32))
+            rows = []
+    chunks.append(np.asarray(rows, dtype=np.float32).reshape(len(rows), dim))
+    vectors = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+    return vectors, np.asarray(ids, dtype=object), np.asarray(labels, dtype=object), mismatched
+
+
+def vector_norms(vectors, block_rows=65536):
+    """행별 L2 norm (NaN/Inf가 있는 행은 NaN)"""
+    norms = np.empty(vectors.shape[0], dtype=np.float64)
+    for start in range(0, vectors.shape[0], block_rows):
+        block = np.asarray(vectors[start : start + block_rows], dtype=np.float64)
+        finite = np.isfinite(block).all(axis=1)
+        block_norms = np.linalg.norm(np.where(finite[:, None], block, 0.0), axis=1)
+        block_norms[~finite] = np.nan
+        norms[start : start + len(block)] = block_norms
+    return norms
+
+
+def find_near_duplicates(vectors, norms, labels, threshold, block_rows=2048):
+    """
+    같은 label 안에서 cosine 유사도가 threshold 이상인 (i, j, 유사도) 쌍 (i < j)
+
+    label별로 정규화한 행렬을 block_rows 크기로 나눠 블록끼리 곱하므로
+    메모리는 block_rows² 크기 유사도 행렬만 사용한다.
+    """
+    valid = np.isfinite(norms) & (norms > 0)
+    label_keys = labels.astype(str)
+    pairs = []
+    for label in np.unique(label_keys[valid]):
+        rows = np.flatnonzero(valid & (label_keys == label))
+        group = np.asarray(vectors[rows], dtype=np.float32) / norms[rows, None].astype(
+            np.float32
+        )
+        for start in range(0, len(rows), block_rows):
+            left = group[start : start + block_rows]
+            for other in range(start, len(rows), block_rows):
+                sims = left @ group[other : other + block_rows].T
+                if other == start:
+                    # 자기 자신과 아래 삼각형(이미 본 쌍) 제외
+                    sims[np.tril_indices(len(left), m=sims.shape[1])] = -np.inf
+                i, j = np.nonzero(sims >= threshold)
+                pairs.extend(
+                    zip(
+                        rows[start + i].tolist(),
+                        rows[other + j].tolist(),
+                        sims[i, j].tolist(),
+                    )
+                )
+    return pairs
+
+
+def validate_embeddings(
+    path,
+    dim,
+    max_invalid_ratio=0.0,
+    duplicate_threshold=0.999,
+    max_duplicate_ratio=0.01,
+    max_unlabeled_ratio=0.0,
+    min_label_count=1,
+    norm_tolerance=1e-3,
+):
+    """검증 결과를 출력하고 임계값을 모두 통과하면 True (duplicate_threshold가 None이면 중복 검사 생략)"""
+    vectors, ids, labels, mismatched = load_matrix(path, dim)
+    total = vectors.shape[0] + mismatched
+    ok = True
+    print(f"[INFO] 검증 대상: {path} (포인트 {total}개, 벡터 크기 {dim})")
+    if total == 0:
+        print("[ERROR] 포인트가 없습니다.")
+        return False
+
+    norms = vector_norms(vectors)
+    nonfinite = np.flatnonzero(np.isnan(norms))
+    zero_norm = np.flatnonzero(norms == 0)
+    for row in nonfinite[:SAMPLE_LIMIT]:
+        print(f"[ERROR] NaN/Inf 값이 있는 벡터: {ids[row]}")
+    for row in zero_norm[:SAMPLE_LIMIT]:
+        print(f"[ERROR] norm이 0인 벡터: {ids[row]}")
+    invalid = mismatched + len(nonfinite) + len(zero_norm)
+    print(
+        f"[INFO] 길이 불일치 {mismatched}개, NaN/Inf {len(nonfinite)}개, "
+        f"norm 0 {len(zero_norm)}개"
+    )
+    if invalid / total > max_invalid_ratio:
+        print(f"[ERROR] 잘못된 벡터 비율 {invalid / total:.2%} > {max_invalid_ratio:.2%}")
+        ok = False
+
+    valid_norms = norms[np.isfinite(norms) & (norms > 0)]
+    if len(valid_norms):
+        unnormalized = int((np.abs(valid_norms - 1.0) > norm_tolerance).sum())
+        print(
+            f"[INFO] L2 norm 최소 {valid_norms.min():.4f}, 평균 {valid_norms.mean():.4f}, "
+            f"최대 {valid_norms.max():.4f} (정규화되지 않은 벡터 {unnormalized}개)"
+        )
+
+    if duplicate_threshold is not None:
+        pairs = find_near_duplicates(vectors, norms, labels, duplicate_threshold)
+        duplicate_rows = {j for _, j, _ in pairs}
+        exact = sum(1 for i, j, _ in pairs if np.array_equal(vectors[i], vectors[j]))
+        for i, j, sim in pairs[:SAMPLE_LIMIT]:
+            print(f"[WARN] 중복 의심 ({labels[i]}): {ids[i]} ↔ {ids[j]} (cosine {sim:.5f})")
+        ratio = len(duplicate_rows) / total
+        print(
+            f"[INFO] cosine ≥ {duplicate_threshold} 쌍 {len(pairs)}개 (완전히 같은 벡터 {exact}쌍), "
+            f"중복 포인트 {len(duplicate_rows)}개 ({ratio:.2%})"
+        )
+        if ratio > max_duplicate_ratio:
+            print(f"[ERROR] 중복 포인트 비율 {ratio:.2%} > {max_duplicate_ratio:.2%}")
+            ok = False
+
+    label_count = Counter("<없음>" if label is None else label for label in labels.tolist())
+    print("[INFO] label 분포:")
+    for label, count in label_count.most_common():
+        print(f"  {label:<20}{count:>8} ({count / len(labels):.1%})")
+    unlabeled = label_count.get("<없음>", 0)
+    if len(labels) and unlabeled / len(labels) > max_unlabeled_ratio:
+        print(f"[ERROR] label 없는 포인트 비율 {unlabeled / len(labels):.2%} > {max_unlabeled_ratio:.2%}")
+        ok = False
+    small = [label for label, count in label_count.items() if count < min_label_count]
+    if small:
+        print(f"[ERROR] 포인트가 {min_label_count}개 미만인 label: {', '.join(map(str, small))}")
+        ok = False
+
+    print("[SUCCESS] 임베딩 검증 통과" if ok else "[ERROR] 임베딩 검증 실패")
+    return ok
+
+
+def write_normalized(path, output, dim, batch_size=4096):
+    """L2 정규화한 벡터를 .npy + .parquet으로 저장 (NaN/Inf, norm 0 벡터는 제외)"""
+
+    def normalized_items():
+        batch = []
+        for item in iter_raw_points(path):
+            vec = item.get("vector")
+            if vec is None or len(vec) != dim:
+                continue
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield from _normalize_batch(batch)
+                batch = []
+        yield from _normalize_batch(batch)
+
+    rows, _, _ = write_vector_store(normalized_items(), output, dim)
+    print(f"[INFO] 정규화된 벡터 {rows}개 저장: {output} ({payload_path(output)})")
+
+
+def _normalize_batch(batch):
+    if not batch:
+        return
+    matrix = np.asarray([item["vector"] for item in batch], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    keep = np.isfinite(norms) & (norms > 0)
+    matrix[keep] /= norms[keep, None]
+    for item, vec, valid in zip(batch, matrix, keep):
+        if valid:
+            yield dict(item, vector=vec.tolist())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임베딩 벡터 검증")
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default="data/qdrant/collections/furniture_embeddings.json",
+        help=".json(배열), .ndjson/.jsonl 또는 .npy(+ .parquet) 파일",
+    )
+    parser.add_argument("--dim", type=int, default=768, help="Qdrant 컬렉션 벡터 크기")
+    parser.add_argument("--max-invalid-ratio", type=float, default=0.0)
+    parser.add_argument(
+        "--duplicate-threshold", type=float, default=0.999, help="중복으로 볼 cosine 유사도"
+    )
+    parser.add_argument("--skip-duplicates", action="store_true", help="중복 검사 생략")
+    parser.add_argument("--max-duplicate-ratio", type=float, default=0.01)
+    parser.add_argument("--max-unlabeled-ratio", type=float, default=0.0)
+    parser.add_argument("--min-label-count", type=int, default=1)
+    parser.add_argument("--normalize-output", help="L2 정규화한 .npy(+ .parquet) 출력 경로")
+    args = parser.parse_args()
+
+    ok = validate_embeddings(
+        args.path,
+        args.dim,
+        max_invalid_ratio=args.max_invalid_ratio,
+        duplicate_threshold=None if args.skip_duplicates else args.duplicate_threshold,
+        max_duplicate_ratio=args.max_duplicate_ratio,
+        max_unlabeled_ratio=args.max_unlabeled_ratio,
+        min_label_count=args.min_label_count,
+    )
+    if args.normalize_output:
+        if os.path.abspath(args.normalize_output) == os.path.abspath(args.path):
+            print("[ERROR] 원본과 다른 출력 경로를 지정하세요.")
+            exit(1)
+        write_normalized(args.path, args.normalize_output, args.dim)
+    if not ok:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import os
+import time
+import argparse
+from embedding_store import iter_raw_points, payload_path, write_vector_store
+
+# JSON/NDJSON 임베딩 파일을 .npy(벡터) + .parquet(id/label/payload)로 변환
+#
+# 사용 예 (저장소 루트에서):
+#   python scripts/qdrant-init/convert_embeddings.py data/qdrant/collections/furniture_embeddings.json
+#   python scripts/qdrant-init/convert_embeddings.py embeddings.ndjson -o out/embeddings.npy --dim 768
+#
+# 변환된 두 파일을 같은 경로에 올리고 GCS_QDRANT_EMBEDDINGS_JSON에 .npy 경로를 지정하면
+# upload_qdrant.py가 .parquet도 함께 받아 사용합니다.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임베딩 JSON → .npy + .parquet 변환")
+    parser.add_argument("input", help="원본 .json(배열) 또는 .ndjson/.jsonl 파일")
+    parser.add_argument("-o", "--output", help="출력 .npy 경로 (기본: 입력 파일명.npy)")
+    parser.add_argument("--dim", type=int, help="벡터 크기 (기본: 첫 벡터 길이)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.splitext(args.input)[0] + ".npy"
+    if not output.endswith(".npy"):
+        print(f"[ERROR] 출력 경로는 .npy여야 합니다: {output}")
+        exit(1)
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+
+    started = time.perf_counter()
+    rows, skipped, dim = write_vector_store(iter_raw_points(args.input), output, args.dim)
+    elapsed = time.perf_counter() - started
+
+    before = os.path.getsize(args.input)
+    after = os.path.getsize(output) + os.path.getsize(payload_path(output))
+    print(f"[INFO] {rows}개 변환, {skipped}개 제외 (벡터 크기 {dim}, {elapsed:.1f}초)")
+    print(f"[INFO] 벡터: {output}")
+    print(f"[INFO] payload: {payload_path(output)}")
+    print(
+        f"[INFO] 파일 크기: {before / 2**20:.1f} MiB → {after / 2**20:.1f} MiB "
+        f"({before / max(after, 1):.1f}배 감소)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import os
+import json
+import uuid
+import hashlib
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# 임베딩 파일 읽기/쓰기
+#
+# - JSON 배열(.json) / NDJSON(.ndjson, .jsonl): [{"id", "vector", "payload"}, ...]
+# - 바이너리 형식(.npy + .parquet): 벡터는 float32 (N, dim) 행렬을 .npy로,
+#   id/label/payload는 같은 이름의 .parquet에 같은 행 순서로 저장한다.
+#   .npy는 memory map으로 열기 때문에 파일 전체를 메모리에 올리지 않고 행 단위로 잘라 읽는다.
+
+PAYLOAD_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("label", pa.string()),
+        ("payload", pa.string()),  # 상품마다 필드 구성이 달라 JSON 문자열로 저장
+    ]
+)
+
+
+# 상품 이미지 → 포인트 id 변환용 네임스페이스 (uuid5(NAMESPACE_URL, "danawa_products"))
+# 값을 바꾸면 모든 포인트 id가 바뀌므로 고정한다.
+POINT_ID_NAMESPACE = uuid.UUID("b125c189-9f15-5f87-aa35-2e696039e46e")
+
+
+def image_key(payload, position):
+    """
+    상품 안에서 이미지 임베딩을 구분하는 값
+
+    포인트는 상품 이미지마다 하나이므로 payload의 image_url을 쓰고,
+    image_url이 없으면 같은 상품 안에서 몇 번째 항목인지(position)를 쓴다.
+    """
+    image_url = payload.get("image_url")
+    if isinstance(image_url, str) and image_url:
+        return image_url
+    return f"#{position}"
+
+
+def point_id(product_id, key):
+    """(상품 id, image_key)로 항상 같은 Qdrant 포인트 id(UUIDv5)를 만든다"""
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{product_id}\n{key}"))
+
+
+def legacy_point_id(product_id):
+    """이미지 구분 없이 상품 id만으로 만들던 이전 포인트 id"""
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, str(product_id)))
+
+
+# Qdrant 포인트 payload 필드 (backend app.qdrant.PRODUCT_PAYLOAD_FIELDS와 같음)
+PAYLOAD_FIELDS = (
+    "id",
+    "label",
+    "product_name",
+    "product_url",
+    "image_url",
+    "width_cm",
+    "depth_cm",
+    "height_cm",
+    "created_at",
+    "updated_at",
+)
+
+
+def point_payload(product_id, payload, vector):
+    """
+    Qdrant 포인트 payload (upload_qdrant.py, load_danawa_catalog.py 공통)
+
+    PAYLOAD_FIELDS만 같은 형태로 남기고 상품 id와 content_hash를 넣으므로, 원본 값이 같으면
+    어느 스크립트로 적재해도 payload와 해시가 같다 (서로의 포인트를 다시 쓰지 않음).
+    """
+    result = {field: payload.get(field) for field in PAYLOAD_FIELDS}
+    result["id"] = product_id
+    result["content_hash"] = content_hash(vector, result)
+    return result
+
+
+def content_hash(vector, payload):
+    """벡터와 payload가 같으면 같은 값 (diff 모드에서 변경 여부 판단에 사용)"""
+    data = json.dumps(
+        [vector, payload], sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def iter_json_array(path, chunk_size=1 << 20):
+    """최상위 JSON 배열 파일을 항목 단위로 읽기 (파일 전체를 메모리에 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer, pos, started, eof = "", 0, False, False
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buffer):
+                if not started:
+                    if buffer[pos] != "[":
+                        raise ValueError(f"JSON 배열 파일이 아닙니다: {path}")
+                    started, pos = True, pos + 1
+                    continue
+                if buffer[pos] == "]":
+                    return
+                try:
+                    item, pos = decoder.raw_decode(buffer, pos)
+                    yield item
+                    continue
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+            elif eof:
+                raise ValueError(f"JSON 배열이 닫히지 않았습니다: {path}")
+            # 항목이 청크 경계에 걸쳐 있으면 다음 청크를 이어 붙여 다시 시도
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+
+
+def iter_ndjson(path):
+    """한 줄에 포인트 하나인 NDJSON 파일 읽기"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def is_vector_store(path):
+    return path.endswith(".npy")
+
+
+def payload_path(vectors_path):
+    """벡터 파일(.npy)과 짝이 되는 payload 파일(.parquet) 경로"""
+    return os.path.splitext(vectors_path)[0] + ".parquet"
+
+
+def open_vector_store(vectors_path):
+    """(memory map 벡터 행렬, ParquetFile) 반환, 두 파일의 행 수가 다르면 ValueError"""
+    vectors = np.load(vectors_path, mmap_mode="r")
+    payloads = pq.ParquetFile(payload_path(vectors_path))
+    if vectors.ndim != 2:
+        raise ValueError(f"벡터 파일이 2차원 행렬이 아닙니다: {vectors_path} {vectors.shape}")
+    if payloads.metadata.num_rows != vectors.shape[0]:
+        raise ValueError(
+            f"벡터({vectors.shape[0]}행)와 payload({payloads.metadata.num_rows}행) 수가 다릅니다"
+        )
+    return vectors, payloads
+
+
+def iter_vector_store(vectors_path, batch_size=4096):
+    """바이너리 형식을 JSON 형식과 같은 {"id", "vector", "payload"} 항목으로 읽기"""
+    vectors, payloads = open_vector_store(vectors_path)
+    row = 0
+    for batch in payloads.iter_batches(batch_size=batch_size, columns=["id", "payload"]):
+        ids = batch.column("id").to_pylist()
+        payload_texts = batch.column("payload").to_pylist()
+        # 배치 단위로만 memory map에서 읽어 list로 변환
+        rows = vectors[row : row + len(ids)].tolist()
+        for product_id, vector, payload_text in zip(ids, rows, payload_texts):
+            yield {"id": product_id, "vector": vector, "payload": json.loads(payload_text)}
+        row += len(ids)
+
+
+def iter_raw_points(path):
+    if is_vector_store(path):
+        return iter_vector_store(path)
+    if path.endswith((".ndjson", ".jsonl")):
+        return iter_ndjson(path)
+    return iter_json_array(path)
+
+
+def write_vector_store(raw_points, vectors_path, vector_size=None, batch_size=4096):
+    """
+    {"id", "vector", "payload"} 항목들을 .npy + .parquet으로 저장 (스트리밍)
+
+    행 수를 미리 알 수 없으므로 .npy 헤더를 먼저 쓰고 벡터를 이어 붙인 뒤 마지막에
+    헤더의 shape만 다시 쓴다. vector_size를 주지 않으면 첫 벡터 길이를 사용한다.
+    반환값: (저장한 행 수, 제외한 항목 수, 벡터 크기)
+    """
+    rows = skipped = 0
+    pending = []
+    tmp_vectors = vectors_path + ".tmp"
+    tmp_payloads = payload_path(vectors_path) + ".tmp"
+    writer = pq.ParquetWriter(tmp_payloads, PAYLOAD_SCHEMA, compression="zstd")
+
+    def flush(f):
+        nonlocal pending
+        if not pending:
+            return
+        f.write(np.asarray([p[0] for p in pending], dtype="<f4").tobytes())
+        writer.write_table(
+            pa.Table.from_pylist([p[1] for p in pending], schema=PAYLOAD_SCHEMA)
+        )
+        pending = []
+
+    try:
+        with open(tmp_vectors, "wb") as f:
+            header_size = _write_npy_header(f, 0, vector_size or 0)
+            for idx, item in enumerate(raw_points):
+                vec = item.get("vector")
+                if vector_size is None and vec:
+                    vector_size = len(vec)
+                if vec is None or len(vec) != vector_size or item.get("id") is None:
+                    print(f"[SKIP] {idx}번째 항목: 벡터 길이 불일치 또는 id 없음")
+                    skipped += 1
+                    continue
+                payload = item.get("payload") or {}
+                pending.append(
+                    (
+                        vec,
+                        {
+                            "id": str(item["id"]),
+                            "label": payload.get("label"),
+                            "payload": json.dumps(payload, ensure_ascii=False),
+                        },
+                    )
+                )
+                rows += 1
+                if len(pending) >= batch_size:
+                    flush(f)
+            flush(f)
+            f.seek(0)
+            if _write_npy_header(f, rows, vector_size or 0) != header_size:
+                raise RuntimeError("npy 헤더 크기가 바뀌었습니다")
+    finally:
+        writer.close()
+    os.replace(tmp_vectors, vectors_path)
+    os.replace(tmp_payloads, payload_path(vectors_path))
+    return rows, skipped, vector_size
+
+
+def _write_npy_header(f, rows, vector_size):
+    # 헤더는 64바이트 단위로 패딩되므로 행 수 자릿수가 달라도 길이가 같다
+    start = f.tell()
+    np.lib.format.write_array_header_1_0(
+        f, {"descr": "<f4", "fortran_order": False, "shape": (rows, vector_size)}
+    )
+    return f.tell() - start
@@ -1,8 +1,22 @@
 import os
 import time
 import json
+import random
+import hashlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import requests
 from google.cloud import storage
+from embedding_store import (
+    image_key,
+    is_vector_store,
+    iter_raw_points,
+    legacy_point_id,
+    payload_path,
+    point_id,
+    point_payload,
+)
+from check_vector import validate_embeddings
 
 
 def wait_for_qdrant(qdrant_url, timeout=60):
@@ -21,24 +35,98 @@ def wait_for_qdrant(qdrant_url, timeout=60):
 
 
 def download_from_gcs(bucket_name, blob_name, dest_path):
-    print(f"[INFO] GCS에서 {bucket_name}/{blob_name} 다운로드 중...")
     client = storage.Client()
     bucket = client.bucket(bucket_name)
-    blob = bucket.blob(blob_name)
+    blob = bucket.get_blob(blob_name)
+    if blob is None:
+        print(f"[ERROR] GCS 객체가 없습니다: {bucket_name}/{blob_name}")
+        exit(1)
+    # 이어서 업로드할 때 같은 파일을 다시 받지 않음
+    if os.path.exists(dest_path) and os.path.getsize(dest_path) == blob.size:
+        print(f"[INFO] 이미 다운로드된 파일 사용: {dest_path}")
+        return
+    print(f"[INFO] GCS에서 {bucket_name}/{blob_name} 다운로드 중...")
     blob.download_to_filename(dest_path)
     print(f"[INFO] 다운로드 완료: {dest_path}")
 
 
+def collection_config_from_env():
+    """HNSW / 양자화 / 옵티마이저 설정 (환경변수, 값이 없으면 Qdrant 기본값)"""
+    hnsw_config = {
+        "m": int(os.environ.get("QDRANT_HNSW_M", "16")),
+        "ef_construct": int(os.environ.get("QDRANT_HNSW_EF_CONSTRUCT", "100")),
+    }
+    optimizers_config = {
+        "indexing_threshold": int(os.environ.get("QDRANT_INDEXING_THRESHOLD", "20000"))
+    }
+    if os.environ.get("QDRANT_DEFAULT_SEGMENT_NUMBER"):
+        optimizers_config["default_segment_number"] = int(
+            os.environ["QDRANT_DEFAULT_SEGMENT_NUMBER"]
+        )
+    if os.environ.get("QDRANT_MEMMAP_THRESHOLD"):
+        optimizers_config["memmap_threshold"] = int(os.environ["QDRANT_MEMMAP_THRESHOLD"])
+
+    # none | scalar | product, 양자화하면 원본 벡터는 디스크에 두고 양자화 벡터만 RAM에 유지
+    quantization = os.environ.get("QDRANT_QUANTIZATION", "none").lower()
+    quantization_config = None
+    if quantization == "scalar":
+        quantization_config = {
+            "scalar": {
+                "type": "int8",
+                "quantile": float(os.environ.get("QDRANT_SCALAR_QUANTILE", "0.99")),
+                "always_ram": True,
+            }
+        }
+    elif quantization == "product":
+        quantization_config = {
+            "product": {
+                "compression": os.environ.get("QDRANT_PRODUCT_COMPRESSION", "x16"),
+                "always_ram": True,
+            }
+        }
+    elif quantization != "none":
+        print(f"[ERROR] 알 수 없는 QDRANT_QUANTIZATION 값: {quantization}")
+        exit(1)
+    on_disk_default = "true" if quantization_config else "false"
+    # compose에서 빈 값으로 넘어오면 기본값 사용
+    on_disk = (os.environ.get("QDRANT_VECTORS_ON_DISK") or on_disk_default).lower() == "true"
+    return hnsw_config, optimizers_config, quantization_config, on_disk
+
+
 def create_collection_if_not_exists(
     qdrant_url, collection, vector_size, distance="Cosine"
 ):
     url = f"{qdrant_url}/collections/{collection}"
+    hnsw_config, optimizers_config, quantization_config, on_disk = (
+        collection_config_from_env()
+    )
+    print(
+        f"[INFO] 컬렉션 설정: hnsw={hnsw_config}, optimizers={optimizers_config}, "
+        f"quantization={quantization_config}, vectors_on_disk={on_disk}"
+    )
     resp = requests.get(url)
     if resp.status_code == 200:
-        print(f"[INFO] 컬렉션 '{collection}' 이미 존재.")
+        # 이미 있으면 변경 가능한 설정만 갱신 (벡터 크기/거리는 바꿀 수 없음)
+        print(f"[INFO] 컬렉션 '{collection}' 이미 존재. 인덱스/옵티마이저 설정 갱신 중...")
+        data = {
+            "vectors": {"": {"on_disk": on_disk}},
+            "hnsw_config": hnsw_config,
+            "optimizers_config": optimizers_config,
+            "quantization_config": quantization_config or "Disabled",
+        }
+        resp = requests.patch(url, json=data)
+        if resp.status_code != 200:
+            print(f"[ERROR] 컬렉션 설정 갱신 실패: {resp.status_code} {resp.text}")
+            exit(1)
         return
     print(f"[INFO] 컬렉션 '{collection}' 생성 중...")
-    data = {"vectors": {"size": vector_size, "distance": distance}}
+    data = {
+        "vectors": {"size": vector_size, "distance": distance, "on_disk": on_disk},
+        "hnsw_config": hnsw_config,
+        "optimizers_config": optimizers_config,
+    }
+    if quantization_config:
+        data["quantization_config"] = quantization_config
     resp = requests.put(url, json=data)
     if resp.status_code not in (200, 201):
         print(f"[ERROR] 컬렉션 생성 실패: {resp.status_code} {resp.text}")
@@ -46,9 +134,27 @@ def create_collection_if_not_exists(
     print(f"[INFO] 컬렉션 생성 완료.")
 
 
+def create_payload_index(qdrant_url, collection, field_name, field_schema="keyword"):
+    # 모든 검색이 label로 필터링하므로 payload 인덱스가 없으면 카탈로그가 커질수록 느려진다
+    url = f"{qdrant_url}/collections/{collection}/index?wait=true"
+    data = {"field_name": field_name, "field_schema": field_schema}
+    resp = requests.put(url, json=data)
+    if resp.status_code not in (200, 201):
+        print(f"[ERROR] payload 인덱스 생성 실패: {resp.status_code} {resp.text}")
+        exit(1)
+    print(f"[INFO] payload 인덱스 생성 완료: {field_name} ({field_schema})")
+
+
 def parse_points(raw_points, vector_size=768):
-    points = []
-    skipped = 0
+    """
+    원본 항목을 Qdrant 포인트로 변환하는 generator (벡터 길이가 다르거나 id가 없으면 제외)
+
+    포인트는 상품 이미지마다 하나이므로 id는 (상품 id, image_url)로 만든다.
+    같은 이미지가 여러 번 나오면 첫 항목만 사용한다 (diff 모드 해시 비교도 같은 id 기준).
+    """
+    skipped = duplicated = 0
+    positions = {}  # 상품 id → 지금까지 나온 항목 수 (image_url이 없을 때 순번으로 사용)
+    seen = set()
     for idx, item in enumerate(raw_points):
         vec = item.get("vector")
         if vec is None or len(vec) != vector_size:
@@ -57,36 +163,309 @@ def parse_points(raw_points, vector_size=768):
             )
             skipped += 1
             continue
-        payload = item.get("payload", {})
-        payload["id"] = item.get("id")  # id 항목 추가
-        point = {
-            "id": idx,  # 항상 순번으로 id 지정 (중복 방지)
-            "vector": vec,
-            "payload": payload,
+        product_id = item.get("id")
+        if product_id is None or product_id == "":
+            print(f"[SKIP] {idx}번째 포인트: 상품 id 없음")
+            skipped += 1
+            continue
+        payload = item.get("payload") or {}
+        position = positions.get(product_id, 0)
+        positions[product_id] = position + 1
+        # 파일 순서와 무관하게 같은 이미지는 같은 포인트를 덮어씀 (재실행/부분 갱신 시 중복 방지)
+        pid = point_id(product_id, image_key(payload, position))
+        if pid in seen:
+            print(f"[SKIP] {idx}번째 포인트: 같은 상품 이미지가 이미 있음 ({product_id})")
+            duplicated += 1
+            continue
+        seen.add(pid)
+        yield {"id": pid, "vector": vec, "payload": point_payload(product_id, payload, vec)}
+    print(f"[INFO] 총 {skipped + duplicated}개 포인트가 업로드에서 제외됨 (중복 이미지 {duplicated}개)")
+
+
+def scroll_points(qdrant_url, collection, with_payload, page_size=1000):
+    """컬렉션의 포인트를 벡터 없이 scroll하는 generator"""
+    url = f"{qdrant_url}/collections/{collection}/points/scroll"
+    offset = None
+    while True:
+        body = {
+            "limit": page_size,
+            "with_payload": with_payload,
+            "with_vector": False,
         }
-        points.append(point)
-    print(f"[INFO] 총 {skipped}개 포인트가 업로드에서 제외됨")
-    return points
-
-
-def upload_to_qdrant(qdrant_url, collection, points):
-    url = f"{qdrant_url}/collections/{collection}/points"
-    headers = {"Content-Type": "application/json"}
-    batch_size = 100
-    total_uploaded = 0
-    for i in range(0, len(points), batch_size):
-        batch = points[i : i + batch_size]
-        data = {"points": batch}
-        resp = requests.put(url, headers=headers, data=json.dumps(data))
-        print(f"[Qdrant 응답] {resp.status_code} {resp.text}")
-        if resp.status_code not in (200, 201):
-            print(f"[ERROR] 업로드 실패: {resp.status_code} {resp.text}")
-        else:
-            print(f"[INFO] {i+1}~{i+len(batch)} 포인트 업로드 성공")
-            total_uploaded += len(batch)
-    print(f"[INFO] 총 업로드 시도 포인트 수: {len(points)}")
-    print(f"[INFO] 업로드 성공 포인트 수: {total_uploaded}")
-    return total_uploaded
+        if offset is not None:
+            body["offset"] = offset
+        resp = _session().post(url, json=body, timeout=120)
+        if resp.status_code != 200:
+            print(f"[ERROR] 기존 포인트 조회 실패: {resp.status_code} {resp.text}")
+            exit(1)
+        result = resp.json()["result"]
+        yield from result["points"]
+        offset = result.get("next_page_offset")
+        if offset is None:
+            break
+
+
+def fetch_point_hashes(qdrant_url, collection):
+    """컬렉션의 {포인트 id: content_hash} (해시가 없던 포인트는 None)"""
+    hashes = {
+        point["id"]: (point.get("payload") or {}).get("content_hash")
+        for point in scroll_points(qdrant_url, collection, ["content_hash"])
+    }
+    print(f"[INFO] 기존 포인트 {len(hashes)}개 해시 조회 완료")
+    return hashes
+
+
+def fetch_legacy_point_ids(qdrant_url, collection):
+    """
+    이전 방식 id로 저장된 포인트 id 목록
+
+    - 정수 id: 파일 순번으로 id를 매기던 시드 결과
+    - 상품 id만으로 만든 UUID: 이미지 구분 없이 상품당 포인트 하나로 적재하던 결과
+    upsert 모드는 같은 id만 덮어쓰므로 이 포인트들은 따로 지우지 않으면 중복으로 남는다.
+    """
+    legacy = []
+    for point in scroll_points(qdrant_url, collection, ["id"]):
+        product_id = (point.get("payload") or {}).get("id")
+        if isinstance(point["id"], int) or (
+            product_id is not None and point["id"] == legacy_point_id(product_id)
+        ):
+            legacy.append(point["id"])
+    return legacy
+
+
+def filter_changed_points(points, existing, stats):
+    """
+    새로 추가되거나 내용이 바뀐 포인트만 내보내는 generator
+
+    확인한 id는 existing에서 제거하므로 다 소비한 뒤 existing에 남은 id가 삭제 대상이다.
+    """
+    for point in points:
+        old_hash = existing.pop(point["id"], None)
+        if old_hash == point["payload"]["content_hash"]:
+            stats["unchanged"] += 1
+            continue
+        stats["changed" if old_hash is not None else "added"] += 1
+        yield point
+
+
+def delete_points(qdrant_url, collection, ids, reason="원본에서 사라진", batch_size=1000):
+    url = f"{qdrant_url}/collections/{collection}/points/delete?wait=true"
+    ids = list(ids)
+    for start in range(0, len(ids), batch_size):
+        resp = _session().post(
+            url, json={"points": ids[start : start + batch_size]}, timeout=120
+        )
+        if resp.status_code != 200:
+            print(f"[ERROR] 포인트 삭제 실패: {resp.status_code} {resp.text}")
+            exit(1)
+    print(f"[INFO] {reason} 포인트 {len(ids)}개 삭제 완료")
+
+
+def iter_batches(points, batch_size):
+    batch = []
+    for point in points:
+        batch.append(point)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class UploadCheckpoint:
+    """
+    앞에서부터 연속으로 완료된 배치 수를 파일에 기록해 중단된 업로드를 이어서 진행
+
+    배치는 동시에 업로드되어 순서 없이 끝나므로, 재시작 시에는 연속 완료 지점 이후를
+    모두 다시 올린다 (같은 id로 upsert하므로 중복 저장되지 않음).
+    """
+
+    def __init__(self, path, source_key):
+        self.path = path
+        self.source_key = source_key
+        self.completed_batches = 0
+        self._done = set()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("source") == source_key:
+                self.completed_batches = data["completed_batches"]
+                print(
+                    f"[INFO] 체크포인트에서 이어서 업로드: 배치 {self.completed_batches}개 완료됨"
+                )
+            else:
+                print("[INFO] 원본 파일/설정이 달라 체크포인트를 무시합니다.")
+
+    def mark_done(self, batch_no):
+        with self._lock:
+            self._done.add(batch_no)
+            advanced = False
+            while self.completed_batches in self._done:
+                self._done.remove(self.completed_batches)
+                self.completed_batches += 1
+                advanced = True
+            if advanced:
+                self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"source": self.source_key, "completed_batches": self.completed_batches},
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+_thread_local = threading.local()
+
+
+def _session():
+    # 업로드 스레드마다 keep-alive 연결 재사용
+    if not hasattr(_thread_local, "session"):
+        _thread_local.session = requests.Session()
+    return _thread_local.session
+
+
+def upsert_batch(qdrant_url, collection, batch, retries=5):
+    """배치 upsert (wait=true로 반영 완료까지 대기), 일시적 오류는 지수 백오프로 재시도"""
+    url = f"{qdrant_url}/collections/{collection}/points?wait=true"
+    for attempt in range(retries + 1):
+        try:
+            resp = _session().put(url, json={"points": batch}, timeout=120)
+            if resp.status_code in (200, 201):
+                return
+            error = f"{resp.status_code} {resp.text[:200]}"
+            if resp.status_code < 500 and resp.status_code != 429:
+                raise RuntimeError(error)  # 요청 자체가 잘못된 경우 재시도하지 않음
+        except requests.RequestException as e:
+            error = str(e)
+        if attempt < retries:
+            delay = min(30, 2**attempt) * random.uniform(0.5, 1.0)
+            print(f"[WARN] 배치 재시도 {attempt + 1}/{retries} ({delay:.1f}초 후): {error}")
+            time.sleep(delay)
+    raise RuntimeError(f"재시도 {retries}회 초과: {error}")
+
+
+def upload_to_qdrant(
+    qdrant_url, collection, points, batch_size=256, workers=4, retries=5, checkpoint=None
+):
+    """
+    포인트를 배치로 나눠 여러 스레드에서 동시에 upsert
+
+    Returns:
+        (전체 포인트 수, 이번 실행에서 업로드한 포인트 수, 실패한 배치 수)
+    """
+    total = uploaded = failed = skipped = 0
+    skip_batches = checkpoint.completed_batches if checkpoint else 0
+    in_flight = {}
+    started_at = time.time()
+
+    def collect(futures):
+        nonlocal uploaded, failed
+        for future in futures:
+            batch_no, size = in_flight.pop(future)
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[ERROR] 배치 {batch_no} 업로드 실패: {e}")
+                continue
+            uploaded += size
+            if checkpoint:
+                checkpoint.mark_done(batch_no)
+            if (batch_no + 1) % 20 == 0:
+                rate = uploaded / max(time.time() - started_at, 1e-9)
+                print(f"[INFO] {uploaded}개 업로드 ({rate:.0f} points/s)")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch_no, batch in enumerate(iter_batches(points, batch_size)):
+            total += len(batch)
+            if batch_no < skip_batches:
+                skipped += 1
+                continue
+            # 읽기가 업로드보다 빠르면 메모리가 늘어나므로 진행 중인 배치 수를 제한
+            if len(in_flight) >= workers * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = executor.submit(upsert_batch, qdrant_url, collection, batch, retries)
+            in_flight[future] = (batch_no, len(batch))
+        collect(list(in_flight))
+
+    print(f"[INFO] 총 포인트 수: {total} (체크포인트로 건너뛴 배치 {skipped}개)")
+    print(f"[INFO] 이번 실행 업로드 성공 포인트 수: {uploaded}, 실패 배치 수: {failed}")
+    return total, uploaded, failed
+
+
+def file_fingerprint(paths, chunk_size=1 << 20):
+    """원본 파일들 내용의 sha1 (체크포인트 키, blue/green 모드의 새 컬렉션 이름에 사용)"""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_alias_target(qdrant_url, alias):
+    """alias가 가리키는 컬렉션 이름 (alias가 없으면 None)"""
+    resp = requests.get(f"{qdrant_url}/aliases")
+    if resp.status_code != 200:
+        print(f"[ERROR] alias 조회 실패: {resp.status_code} {resp.text}")
+        exit(1)
+    for item in resp.json()["result"]["aliases"]:
+        if item["alias_name"] == alias:
+            return item["collection_name"]
+    return None
+
+
+def collection_exists(qdrant_url, collection):
+    return requests.get(f"{qdrant_url}/collections/{collection}").status_code == 200
+
+
+def switch_alias(qdrant_url, alias, collection, has_alias):
+    """alias를 새 컬렉션으로 교체 (삭제/생성이 한 요청에서 원자적으로 처리되어 검색이 끊기지 않음)"""
+    actions = []
+    if has_alias:
+        actions.append({"delete_alias": {"alias_name": alias}})
+    actions.append({"create_alias": {"collection_name": collection, "alias_name": alias}})
+    resp = requests.post(f"{qdrant_url}/collections/aliases", json={"actions": actions})
+    if resp.status_code != 200:
+        print(f"[ERROR] alias 전환 실패: {resp.status_code} {resp.text}")
+        exit(1)
+    print(f"[INFO] alias '{alias}' → '{collection}' 전환 완료")
+
+
+def delete_collection(qdrant_url, collection):
+    resp = requests.delete(f"{qdrant_url}/collections/{collection}")
+    if resp.status_code != 200:
+        print(f"[WARN] 컬렉션 '{collection}' 삭제 실패: {resp.status_code} {resp.text}")
+        return
+    print(f"[INFO] 이전 컬렉션 '{collection}' 삭제 완료")
+
+
+def wait_for_collection_ready(qdrant_url, collection, timeout=300):
+    """컬렉션 상태가 green(최적화/인덱싱 완료)이 될 때까지 polling"""
+    url = f"{qdrant_url}/collections/{collection}"
+    deadline = time.time() + timeout
+    status = None
+    while time.time() < deadline:
+        resp = requests.get(url)
+        if resp.status_code == 200:
+            status = resp.json()["result"].get("status")
+            if status == "green":
+                print("[INFO] 컬렉션 최적화 완료 (status=green)")
+                return True
+        time.sleep(2)
+    print(f"[WARNING] {timeout}초 안에 컬렉션 최적화가 끝나지 않았습니다 (status={status})")
+    return False
 
 
 def check_qdrant_points_count(qdrant_url, collection):
@@ -108,47 +487,194 @@ def check_qdrant_points_count(qdrant_url, collection):
         return None
 
 
+def verify_collection(qdrant_url, collection, payload_fields=("label",)):
+    """인덱싱된 벡터 수와 payload 인덱스 상태 출력, 문제가 없으면 True"""
+    resp = requests.get(f"{qdrant_url}/collections/{collection}")
+    if resp.status_code != 200:
+        print(f"[ERROR] Qdrant 컬렉션 정보 조회 실패: {resp.status_code} {resp.text}")
+        return False
+    info = resp.json()["result"]
+    points_count = info.get("points_count") or 0
+    indexed_count = info.get("indexed_vectors_count") or 0
+    threshold = info["config"]["optimizer_config"].get("indexing_threshold")
+    print(
+        f"[INFO] 컬렉션 상태: {info.get('status')}, 포인트 {points_count}개, "
+        f"HNSW 인덱싱된 벡터 {indexed_count}개 (indexing_threshold={threshold})"
+    )
+    ok = True
+    payload_schema = info.get("payload_schema", {})
+    for field_name in payload_fields:
+        schema = payload_schema.get(field_name)
+        if schema is None:
+            print(f"[ERROR] payload 인덱스 없음: {field_name}")
+            ok = False
+        else:
+            print(
+                f"[INFO] payload 인덱스 {field_name}: {schema.get('data_type')} "
+                f"({schema.get('points', 0)}개 포인트)"
+            )
+    # indexing_threshold(KB) 미만의 작은 세그먼트는 인덱스 없이 전수 검색되므로 경고만 출력
+    if points_count and indexed_count < points_count:
+        print(
+            f"[WARNING] 인덱싱되지 않은 벡터 {points_count - indexed_count}개 "
+            f"(최적화 진행 중이거나 세그먼트가 indexing_threshold보다 작음)"
+        )
+    return ok
+
+
 def main():
     GCS_BUCKET = os.environ["GCS_BUCKET"]
+    # .json(배열), .ndjson/.jsonl 또는 .npy(같은 이름의 .parquet도 함께 받음)
     GCS_BLOB = os.environ["GCS_QDRANT_EMBEDDINGS_JSON"]
     QDRANT_URL = os.environ.get("QDRANT_URL", "http://qdrant:6333")
     QDRANT_COLLECTION = os.environ["QDRANT_COLLECTION"]
     VECTOR_SIZE = int(os.environ.get("QDRANT_VECTOR_SIZE", "384"))  # 벡터 크기(예시)
     QDRANT_DISTANCE = os.environ.get("QDRANT_DISTANCE", "Cosine")
-    LOCAL_PATH = "/tmp/furniture_embeddings.json"
+    BATCH_SIZE = int(os.environ.get("QDRANT_UPLOAD_BATCH_SIZE", "256"))
+    WORKERS = int(os.environ.get("QDRANT_UPLOAD_WORKERS", "4"))
+    RETRIES = int(os.environ.get("QDRANT_UPLOAD_RETRIES", "5"))
+    READY_TIMEOUT = int(os.environ.get("QDRANT_READY_TIMEOUT_SECONDS", "300"))
+    CHECKPOINT_PATH = os.environ.get(
+        "QDRANT_UPLOAD_CHECKPOINT", "/tmp/qdrant_upload.checkpoint.json"
+    )
+    # upsert: 전체 덮어쓰기, diff: 바뀐 포인트만 upsert + 사라진 포인트 삭제,
+    # bluegreen: 새 컬렉션에 전체 적재 후 QDRANT_COLLECTION alias 전환
+    SYNC_MODE = os.environ.get("QDRANT_SYNC_MODE", "upsert").lower()
+    KEEP_PREVIOUS = os.environ.get("QDRANT_KEEP_PREVIOUS_COLLECTION", "false").lower() == "true"
+    MIGRATE_TO_ALIAS = os.environ.get("QDRANT_MIGRATE_TO_ALIAS", "false").lower() == "true"
+    # 업로드 전 임베딩 검증 (임계값을 넘으면 적재하지 않음), off면 중복 검사 생략
+    VALIDATE = os.environ.get("QDRANT_VALIDATE", "true").lower() == "true"
+    DUPLICATE_THRESHOLD = os.environ.get("QDRANT_DUPLICATE_THRESHOLD", "0.999")
+    MAX_INVALID_RATIO = float(os.environ.get("QDRANT_MAX_INVALID_RATIO", "0"))
+    MAX_DUPLICATE_RATIO = float(os.environ.get("QDRANT_MAX_DUPLICATE_RATIO", "0.01"))
+    LOCAL_PATH = os.path.join("/tmp", os.path.basename(GCS_BLOB))
+
+    if SYNC_MODE not in ("upsert", "diff", "bluegreen"):
+        print(f"[ERROR] 알 수 없는 QDRANT_SYNC_MODE: {SYNC_MODE}")
+        exit(1)
 
     if not wait_for_qdrant(QDRANT_URL):
         exit(1)
 
     download_from_gcs(GCS_BUCKET, GCS_BLOB, LOCAL_PATH)
+    source_files = [LOCAL_PATH]
+    if is_vector_store(LOCAL_PATH):
+        download_from_gcs(GCS_BUCKET, payload_path(GCS_BLOB), payload_path(LOCAL_PATH))
+        source_files.append(payload_path(LOCAL_PATH))
+    # 원본 내용이 같을 때만 같은 값 (체크포인트 키, blue/green 컬렉션 이름에 사용)
+    source_fingerprint = file_fingerprint(source_files)
 
-    with open(LOCAL_PATH, "r", encoding="utf-8") as f:
-        raw_points = json.load(f)
-    points = parse_points(raw_points)
+    target = QDRANT_COLLECTION
+    previous = None
+    replace_collection = False
+    if SYNC_MODE == "bluegreen":
+        # 같은 원본이면 같은 이름이 되므로 실패 후 재실행 시 체크포인트로 이어서 적재
+        target = f"{QDRANT_COLLECTION}_{source_fingerprint[:12]}"
+        previous = get_alias_target(QDRANT_URL, QDRANT_COLLECTION)
+        if previous == target:
+            print(f"[INFO] alias '{QDRANT_COLLECTION}'가 이미 '{target}'을 가리킵니다. 적재 생략.")
+            return
+        if previous is None and collection_exists(QDRANT_URL, QDRANT_COLLECTION):
+            # alias와 같은 이름의 일반 컬렉션이 있으면 alias를 만들 수 없음
+            if not MIGRATE_TO_ALIAS:
+                print(
+                    f"[ERROR] '{QDRANT_COLLECTION}'는 alias가 아닌 컬렉션입니다. "
+                    "QDRANT_MIGRATE_TO_ALIAS=true로 한 번 실행해 alias로 전환하세요."
+                )
+                exit(1)
+            replace_collection = True
+        print(f"[INFO] blue/green 적재 대상 컬렉션: {target} (현재: {previous or QDRANT_COLLECTION})")
 
-    create_collection_if_not_exists(
-        QDRANT_URL, QDRANT_COLLECTION, VECTOR_SIZE, QDRANT_DISTANCE
-    )
+    if VALIDATE and not validate_embeddings(
+        LOCAL_PATH,
+        VECTOR_SIZE,
+        max_invalid_ratio=MAX_INVALID_RATIO,
+        duplicate_threshold=(
+            None if DUPLICATE_THRESHOLD.lower() == "off" else float(DUPLICATE_THRESHOLD)
+        ),
+        max_duplicate_ratio=MAX_DUPLICATE_RATIO,
+    ):
+        print("[ERROR] 임베딩 검증에 실패해 업로드를 중단합니다. (QDRANT_VALIDATE=false로 생략 가능)")
+        exit(1)
 
-    uploaded = upload_to_qdrant(QDRANT_URL, QDRANT_COLLECTION, points)
+    create_collection_if_not_exists(QDRANT_URL, target, VECTOR_SIZE, QDRANT_DISTANCE)
+    create_payload_index(QDRANT_URL, target, "label", "keyword")
 
-    # 업로드 후 실제 Qdrant에 저장된 포인트 개수 확인
-    print("[INFO] 데이터 반영 대기 중...")
-    time.sleep(20)
-    count = check_qdrant_points_count(QDRANT_URL, QDRANT_COLLECTION)
+    points = parse_points(iter_raw_points(LOCAL_PATH), VECTOR_SIZE)
+    checkpoint = None
+    existing = None
+    legacy_ids = []
+    stats = {"added": 0, "changed": 0, "unchanged": 0}
+    if SYNC_MODE == "diff":
+        # 해시 비교 결과는 다시 실행해도 같으므로 체크포인트 없이 처음부터 비교
+        existing = fetch_point_hashes(QDRANT_URL, target)
+        points = filter_changed_points(points, existing, stats)
+    else:
+        if SYNC_MODE == "upsert":
+            # 이전 방식 id의 포인트는 새 id로 덮어써지지 않으므로 업로드 후 삭제
+            legacy_ids = fetch_legacy_point_ids(QDRANT_URL, target)
+            if legacy_ids:
+                print(f"[WARN] 이전 방식 id로 저장된 포인트 {len(legacy_ids)}개는 업로드 후 삭제합니다.")
+        # 원본 파일, 컬렉션, 배치 크기가 같을 때만 체크포인트에서 이어서 진행
+        checkpoint = UploadCheckpoint(
+            CHECKPOINT_PATH,
+            f"{target}:{source_fingerprint}:{BATCH_SIZE}",
+        )
+    total, uploaded, failed = upload_to_qdrant(
+        QDRANT_URL,
+        target,
+        points,
+        batch_size=BATCH_SIZE,
+        workers=WORKERS,
+        retries=RETRIES,
+        checkpoint=checkpoint,
+    )
+    if failed:
+        print("[ERROR] 실패한 배치가 있습니다. 다시 실행하면 체크포인트부터 이어서 업로드합니다.")
+        exit(1)
+    if checkpoint is not None:
+        checkpoint.clear()
+    if legacy_ids:
+        delete_points(QDRANT_URL, target, legacy_ids, reason="이전 방식 id")
+    if existing is not None:
+        print(
+            f"[INFO] diff 결과: 추가 {stats['added']}개, 변경 {stats['changed']}개, "
+            f"변경 없음 {stats['unchanged']}개, 삭제 {len(existing)}개"
+        )
+        if existing:
+            delete_points(QDRANT_URL, target, existing.keys())
+        total = stats["added"] + stats["changed"] + stats["unchanged"]
+
+    # wait=true로 upsert가 반영된 뒤이므로 인덱싱 완료만 기다린 후 포인트 개수 확인
+    wait_for_collection_ready(QDRANT_URL, target, READY_TIMEOUT)
+    count = check_qdrant_points_count(QDRANT_URL, target)
     if count is not None:
-        if count >= uploaded:
+        if count >= total:
             print(
                 f"[SUCCESS] Qdrant에 데이터가 정상적으로 업로드되었습니다! (총 {count}개)"
             )
         else:
             print(
-                f"[WARNING] 업로드 시도({uploaded}) 대비 실제 저장({count}) 개수가 다릅니다. 일부 실패 가능성 있음."
+                f"[WARNING] 업로드 대상({total}) 대비 실제 저장({count}) 개수가 다릅니다. 일부 실패 가능성 있음."
             )
     else:
         print(
             "[ERROR] Qdrant 포인트 개수 확인 실패. 업로드 결과를 수동으로 확인하세요."
         )
+    if not verify_collection(QDRANT_URL, target):
+        exit(1)
+
+    if SYNC_MODE == "bluegreen":
+        if count is None or count < total:
+            print("[ERROR] 새 컬렉션 적재가 완전하지 않아 alias를 전환하지 않습니다.")
+            exit(1)
+        if replace_collection:
+            # 기존 컬렉션을 지운 뒤 alias를 만들기 전까지 잠시 검색이 실패함 (최초 1회만)
+            print(f"[WARN] 기존 컬렉션 '{QDRANT_COLLECTION}'을 삭제하고 alias로 전환합니다.")
+            delete_collection(QDRANT_URL, QDRANT_COLLECTION)
+        switch_alias(QDRANT_URL, QDRANT_COLLECTION, target, previous is not None)
+        if previous and not KEEP_PREVIOUS:
+            delete_collection(QDRANT_URL, previous)
 
     print("[INFO] 모든 작업이 완료되었습니다.")
 